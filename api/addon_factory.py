@@ -0,0 +1,100 @@
+"""Creates the addons needed by the DevHub UI tests through the upload and addon
+APIs, so the tests can start directly on the page they cover instead of going
+through the submission pages first. Addons are built in memory, with a random
+slug and guid, and are deleted when the test is done"""
+
+import collections
+
+from api import xpi_builder
+from scripts import reusables
+
+# states an addon can be created in through the API; 'awaiting_review' is the state
+# of a new listed addon, 'incomplete' is a listed addon with all its versions disabled
+STATES = ('awaiting_review', 'incomplete')
+
+CreatedAddon = collections.namedtuple(
+    'CreatedAddon', ['id', 'slug', 'guid', 'name', 'channel', 'version_ids']
+)
+
+
+def _check(response, action):
+    assert response.status_code in (200, 201), (
+        f'Could not {action}: {response.status_code}, {response.text}'
+    )
+    return response.json()
+
+
+class AddonFactory:
+    """Creates addons with the given API client and remembers them for 'delete_all';
+    addons are remembered by id, so the ones a test renamed are deleted as well"""
+
+    def __init__(self, client):
+        self.client = client
+        self.created = []
+
+    def _upload(self, name, guid, version, channel):
+        manifest = {
+            'manifest_version': 2,
+            'name': name,
+            'version': version,
+            'browser_specific_settings': {'gecko': {'id': guid}},
+        }
+        file = xpi_builder.archive(manifest, name=f'{guid}-{version}.zip')
+        upload = _check(self.client.upload(file, channel), 'upload the addon')
+        upload = self.client.wait_for_upload_processed(upload['uuid'])
+        assert upload['valid'], f'The addon did not pass validation: {upload["validation"]}'
+        return upload['uuid']
+
+    def create(
+        self,
+        channel='listed',
+        state='awaiting_review',
+        versions=1,
+        license='all-rights-reserved',
+        name=None,
+        categories=('bookmarks',),
+    ):
+        """Creates an addon with 'versions' versions ('1.0', '1.1', ...) of the given
+        license and returns its details; unlisted addons have no review state"""
+        if state not in STATES:
+            raise ValueError(f'Addons can only be created as one of {STATES}, not "{state}"')
+        slug = f'factory-{reusables.get_random_string(12)}'
+        name = name or slug
+        guid = f'{slug}@release-tests'
+        version_payload = {}
+        if channel == 'listed':
+            version_payload = {'license': license, 'compatibility': ['firefox']}
+        uuid = self._upload(name, guid, '1.0', channel)
+        payload = {'slug': slug, 'version': {'upload': uuid, **version_payload}}
+        if channel == 'listed':
+            payload.update(
+                categories=list(categories), summary={'en-US': f'Summary of {name}'}
+            )
+        addon = _check(self.client.create_addon(payload), 'create the addon')
+        self.created.append(addon['id'])
+        first_version = 'current_version' if channel == 'listed' else 'latest_unlisted_version'
+        version_ids = [addon[first_version]['id']]
+        for index in range(1, versions):
+            uuid = self._upload(name, guid, f'1.{index}', channel)
+            version = _check(
+                self.client.create_version(slug, {'upload': uuid, **version_payload}),
+                'add a version',
+            )
+            version_ids.append(version['id'])
+        if channel == 'listed' and state == 'incomplete':
+            for version_id in version_ids:
+                _check(
+                    self.client.edit_version(slug, version_id, {'is_disabled': True}),
+                    'disable the version',
+                )
+        return CreatedAddon(addon['id'], slug, guid, name, channel, version_ids)
+
+    def delete_all(self):
+        """Deletes the created addons, skipping the ones the test already deleted"""
+        for addon_id in self.created:
+            if self.client.get_addon(addon_id).status_code == 404:
+                continue
+            response = self.client.delete_addon(addon_id)
+            if response.status_code != 204:
+                print(f'Addon {addon_id} could not be deleted: {response.status_code}')
+        self.created.clear()
@@ -1,24 +1,21 @@
 """File holding some reusable methods used in the API addon submission tests"""
 
-import hashlib
-import json
-import zipfile
-
-import requests
+from api import streaming, xpi_builder
 
 
 def make_addon(manifest_data):
-    """Dynamically create a simple extension with minimal manifest properties"""
-    with open('sample-addons/manifest.json', 'w') as f:
-        # the contents of the manifest will be defined in tests based on the scenario we want to verify
-        json.dump(manifest_data, f)
-        print(f'Manifest content: {manifest_data}')
-    # add the manifest to the addon zip we want to upload - this will always be the 'make-addon.zip' file
-    # if the zip files contains a manifest already, it will be overwritten by the new manifest
-    with zipfile.ZipFile('sample-addons/make-addon.zip', 'w') as zipf:
-        manifest = 'sample-addons/manifest.json'
-        destination = 'manifest.json'
-        zipf.write(manifest, destination)
+    """Dynamically create a simple extension with minimal manifest properties;
+    the addon is built in memory and returned as a file ready to be uploaded"""
+    # the contents of the manifest will be defined in tests based on the scenario we want to verify
+    print(f'Manifest content: {manifest_data}')
+    return xpi_builder.archive(manifest_data)
+
+
+def make_addon_file(manifest_data):
+    """Same as 'make_addon', but the addon is saved in the 'sample-addons' folder for tests that
+    upload it through the browser; returns the file name, which is unique to the addon contents"""
+    print(f'Manifest content: {manifest_data}')
+    return xpi_builder.write(manifest_data)
 
 
 def verify_addon_response_details(payload, response, request):
@@ -70,32 +67,31 @@ def verify_addon_response_details(payload, response, request):
 def compare_source_files(file_a, file_b, request):
     """Method to compare the hashes of the uploaded and downloaded
     addon source files to make sure they are matching; the comparison differs
-    between POST and PATCH requests, so the method is split in two checks"""
+    between POST and PATCH requests, so the method is split in two checks.
+    Downloaded files are the results of 'ApiClient.download', which hashes them in chunks"""
     # this is the source file downloaded from AMO used in both request types
-    source_from_api = hashlib.sha256(file_b.content).digest()
-    if request == 'POST':
-        # in POST request we compare the local source uploaded with the source from the API
-        local_file = hashlib.sha256(open(file_a, 'rb').read()).digest()
+    source_from_api = file_b.sha256
+    if request.upper() == 'POST':
+        # in POST request we compare the local source uploaded with the source from the API;
+        # the local digest is usually cached already, since it was computed during the upload
+        local_file = streaming.file_digest(file_a)
         assert (
             local_file == source_from_api
         ), f'File contents did not match: local_file_hash = {local_file}, source_from_api_hash = {source_from_api}'
-    if request == 'PATCH':
+    if request.upper() == 'PATCH':
         # in PATCH requests, we are fetching the previous source file attached to the version
         # and compare it to the new attached files to make sure they are different
-        previous_source_from_api = hashlib.sha256(file_a.content).digest()
+        previous_source_from_api = file_a.sha256
         assert previous_source_from_api != source_from_api, (
             f'Source files were not updated successfully: previous_source_from_api_hash = {previous_source_from_api}, '
             f'source_from_api_hash = {source_from_api}'
         )
 
 
-def get_addon_version_string(base_url, addon, auth):
+def get_addon_version_string(api_client, addon):
     """Get the version string of an addon's latest version by using
     the /addons/versions/ API endpoint"""
-    request = requests.get(
-        url=f'{base_url}/api/v5/addons/addon/{addon}/versions/?filter=all_with_unlisted',
-        headers={'Authorization': f'Session {auth}'},
-    )
+    request = api_client.list_versions(addon)
     assert (
         request.status_code == 200
     ), f'Actual response was: status code: {request.status_code}, {request.text}'
@@ -0,0 +1,294 @@
+"""Client used by the API tests to talk to the AMO v5 API"""
+
+import hashlib
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from api import streaming
+
+# AMO v5 API endpoints covered by the client
+UPLOAD = '/api/v5/addons/upload/'
+ADDON = '/api/v5/addons/addon/'
+ABUSE_REPORT = '/api/v5/abuse/report/addon/'
+SESSION = '/api/v5/accounts/session/'
+PROFILE = '/api/v5/accounts/profile/'
+ACCOUNT = '/api/v5/accounts/account/'
+RATING = '/api/v5/ratings/rating/'
+
+# 5xx responses are retried only for methods that can be safely repeated; a POST that
+# failed with a 5xx might have been processed by the server, so it is returned as it is
+IDEMPOTENT_METHODS = ('GET', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS')
+# default of 'delete_addon', so that the tests can also send an empty (None) token
+REQUEST_TOKEN = object()
+
+
+def _is_retryable_response(response):
+    return response.status_code >= 500 and response.request.method in IDEMPOTENT_METHODS
+
+
+class ApiClient:
+    """Wraps a single keep-alive requests.Session, so every call made by a test
+    process reuses the already open TLS connections to AMO. The client injects the
+    'Authorization: Session ...' header, JSON encodes payloads passed through 'json',
+    retries calls failing with connection errors or 5xx responses and records the
+    duration of every call in 'timings'. Files passed through 'files' are streamed
+    (see api.streaming)."""
+
+    def __init__(self, base_url, auth=None, session=None, timings=None):
+        self.base_url = base_url
+        self.auth = auth
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
+        # list of (method, path, status code, seconds) tuples shared by all the
+        # clients created with 'with_auth' from the same pool
+        self.timings = [] if timings is None else timings
+
+    def with_auth(self, sessionid):
+        """Returns a client authenticated with the sessionid, sharing this client's connection pool"""
+        return ApiClient(self.base_url, sessionid, self.session, self.timings)
+
+    def close(self):
+        self.session.close()
+
+    @retry(
+        retry=retry_if_exception_type(requests.ConnectionError)
+        | retry_if_result(_is_retryable_response),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=5),
+        retry_error_callback=lambda state: state.outcome.result(),
+    )
+    def _send(self, method, url, **kwargs):
+        # streamed bodies need to be rewound in case the request is sent again
+        if isinstance(kwargs.get('data'), streaming.MultipartStream):
+            kwargs['data'].seek(0)
+        return self.session.request(method, url, **kwargs)
+
+    def request(self, method, path, headers=None, files=None, **kwargs):
+        """Sends a request to AMO; 'path' is relative to the base url, unless it is a
+        full url returned by the API. The digests of the files sent are found in the
+        'sent_digests' attribute of the response"""
+        headers = dict(headers or {})
+        if self.auth is not None:
+            headers.setdefault('Authorization', f'Session {self.auth}')
+        if files:
+            kwargs['data'] = streaming.MultipartStream(kwargs.get('data'), files)
+            headers['Content-Type'] = kwargs['data'].content_type
+        kwargs.setdefault('timeout', 60)
+        url = path if path.startswith(('http://', 'https://')) else f'{self.base_url}{path}'
+        start = time.perf_counter()
+        response = self._send(method, url, headers=headers, **kwargs)
+        if files:
+            response.sent_digests = kwargs['data'].digests
+        self.timings.append(
+            (method, path, response.status_code, time.perf_counter() - start)
+        )
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request('POST', path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request('PUT', path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request('PATCH', path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request('DELETE', path, **kwargs)
+
+    def download(self, url, chunk_size=streaming.CHUNK_SIZE, **kwargs):
+        """Downloads a file in chunks, hashing it on the way, so it is never held in
+        memory; returns a streaming.Download with the status code, digest and size"""
+        digest = hashlib.sha256()
+        size = 0
+        with self.get(url, stream=True, **kwargs) as response:
+            for chunk in response.iter_content(chunk_size):
+                digest.update(chunk)
+                size += len(chunk)
+        return streaming.Download(response.status_code, digest.hexdigest(), size)
+
+    # uploads
+    def upload(self, file, channel, **data):
+        """Uploads an addon file (an open file or a path) to the given channel"""
+        if isinstance(file, str):
+            with open(file, 'rb') as f:
+                return self.post(UPLOAD, files={'upload': f}, data={'channel': channel, **data})
+        return self.post(UPLOAD, files={'upload': file}, data={'channel': channel, **data})
+
+    def get_upload(self, uuid):
+        return self.get(f'{UPLOAD}{uuid}/')
+
+    def wait_for_upload_processed(self, uuid, timeout=120, initial_delay=0.5, max_delay=8):
+        """Polls the upload details with an exponential backoff until AMO has finished
+        processing the upload; returns the upload details, including the 'validation'
+        results, so tests can inspect them without requesting the upload again"""
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while True:
+            response = self.get_upload(uuid)
+            assert (
+                response.status_code == 200
+            ), f'Upload {uuid} could not be retrieved: {response.status_code}, {response.text}'
+            upload = response.json()
+            if upload['processed']:
+                return upload
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f'Upload {uuid} was not processed after {timeout}s; last response was {upload}'
+                )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    # addons
+    def create_addon(self, payload):
+        return self.post(ADDON, json=payload)
+
+    def get_addon(self, addon):
+        return self.get(f'{ADDON}{addon}/')
+
+    def edit_addon(self, addon, payload):
+        return self.patch(f'{ADDON}{addon}/', json=payload)
+
+    def upload_icon(self, addon, icon):
+        """Uploads an image (an open file) as the addon icon"""
+        return self.patch(f'{ADDON}{addon}/', files={'icon': icon})
+
+    def put_addon(self, guid, payload):
+        return self.put(f'{ADDON}{guid}/', json=payload)
+
+    def get_delete_confirm(self, addon):
+        return self.get(f'{ADDON}{addon}/delete_confirm/')
+
+    def delete_addon(self, addon, delete_confirm=REQUEST_TOKEN):
+        """Deletes an addon with the delete token, which is requested first if none
+        is given"""
+        if delete_confirm is REQUEST_TOKEN:
+            confirm = self.get_delete_confirm(addon)
+            confirm.raise_for_status()
+            delete_confirm = confirm.json()['delete_confirm']
+        return self.delete(
+            f'{ADDON}{addon}/', params={'delete_confirm': delete_confirm}
+        )
+
+    # versions
+    def list_versions(self, addon, filter='all_with_unlisted'):
+        return self.get(f'{ADDON}{addon}/versions/', params={'filter': filter})
+
+    def create_version(self, addon, payload, source=None):
+        """Creates a version from an upload; the source code (an open file) can be
+        submitted with it, in which case the request is sent as multipart form data"""
+        if source is not None:
+            return self.post(
+                f'{ADDON}{addon}/versions/', data=payload, files={'source': source}
+            )
+        return self.post(f'{ADDON}{addon}/versions/', json=payload)
+
+    def get_version(self, addon, version):
+        return self.get(f'{ADDON}{addon}/versions/{version}/')
+
+    def edit_version(self, addon, version, payload):
+        return self.patch(f'{ADDON}{addon}/versions/{version}/', json=payload)
+
+    def upload_source(self, addon, version, source):
+        """Uploads the source code (an open file) of a version"""
+        return self.patch(
+            f'{ADDON}{addon}/versions/{version}/', files={'source': source}
+        )
+
+    # authors
+    def list_authors(self, addon):
+        return self.get(f'{ADDON}{addon}/authors/')
+
+    def get_author(self, addon, author):
+        return self.get(f'{ADDON}{addon}/authors/{author}/')
+
+    def edit_author(self, addon, author, payload):
+        return self.patch(f'{ADDON}{addon}/authors/{author}/', json=payload)
+
+    def delete_author(self, addon, author):
+        return self.delete(f'{ADDON}{addon}/authors/{author}/')
+
+    def list_pending_authors(self, addon):
+        return self.get(f'{ADDON}{addon}/pending-authors/')
+
+    def invite_author(self, addon, payload):
+        return self.post(f'{ADDON}{addon}/pending-authors/', json=payload)
+
+    def get_pending_author(self, addon, author):
+        return self.get(f'{ADDON}{addon}/pending-authors/{author}/')
+
+    def edit_pending_author(self, addon, author, payload):
+        return self.patch(f'{ADDON}{addon}/pending-authors/{author}/', json=payload)
+
+    def delete_pending_author(self, addon, author):
+        return self.delete(f'{ADDON}{addon}/pending-authors/{author}/')
+
+    def confirm_author_invite(self, addon):
+        return self.post(f'{ADDON}{addon}/pending-authors/confirm/')
+
+    def decline_author_invite(self, addon):
+        return self.post(f'{ADDON}{addon}/pending-authors/decline/')
+
+    # previews
+    def add_preview(self, addon, image, position=None):
+        """Uploads an image (an open file) as an addon preview"""
+        data = {} if position is None else {'position': position}
+        return self.post(f'{ADDON}{addon}/previews/', files={'image': image}, data=data)
+
+    def edit_preview(self, addon, preview, payload):
+        return self.patch(f'{ADDON}{addon}/previews/{preview}/', json=payload)
+
+    def delete_preview(self, addon, preview):
+        return self.delete(f'{ADDON}{addon}/previews/{preview}/')
+
+    # accounts
+    def get_profile(self):
+        return self.get(PROFILE)
+
+    def delete_session(self):
+        return self.delete(SESSION)
+
+    # collections
+    def list_collections(self, user, **params):
+        return self.get(f'{ACCOUNT}{user}/collections/', params=params)
+
+    def delete_collection(self, user, collection):
+        return self.delete(f'{ACCOUNT}{user}/collections/{collection}/')
+
+    # ratings
+    def list_ratings(self, **params):
+        return self.get(RATING, params=params)
+
+    def delete_rating(self, rating):
+        return self.delete(f'{RATING}{rating}/')
+
+    # abuse reports
+    def report_addon(self, payload):
+        return self.post(ABUSE_REPORT, json=payload)
+
+    def timing_summary(self, slowest=10):
+        """Returns a printable summary of the recorded API calls"""
+        total = sum(timing[3] for timing in self.timings)
+        lines = [f'{len(self.timings)} API calls took {total:.2f}s']
+        for method, path, status, seconds in sorted(
+            self.timings, key=lambda timing: timing[3], reverse=True
+        )[:slowest]:
+            lines.append(f'{seconds:8.2f}s {status} {method} {path}')
+        return '\n'.join(lines)
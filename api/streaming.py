@@ -0,0 +1,156 @@
+"""Streaming of the files sent to and downloaded from the AMO API. Uploads are sent as
+a multipart body read in chunks, instead of being encoded in memory by requests,
+and downloads are read in chunks too; files are hashed while they are transferred,
+so addon and source files are never held in memory or read a second time just to
+compare them"""
+
+import collections
+import hashlib
+import io
+import os
+import threading
+import uuid
+
+CHUNK_SIZE = 64 * 1024
+
+# returned by 'ApiClient.download'; 'sha256' is the hex digest of the downloaded file
+Download = collections.namedtuple('Download', ['status_code', 'sha256', 'size'])
+
+# {absolute path: (mtime in ns, size, sha256 hex digest)} of the local files hashed
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def _remember(path, stat, digest):
+    with _digests_lock:
+        _digests[os.path.abspath(path)] = (stat.st_mtime_ns, stat.st_size, digest)
+
+
+def file_digest(path):
+    """Returns the SHA-256 hex digest of a local file; digests are cached by the
+    modification time of the file, including the ones computed while uploading it"""
+    stat = os.stat(path)
+    with _digests_lock:
+        cached = _digests.get(os.path.abspath(path))
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    _remember(path, stat, digest.hexdigest())
+    return digest.hexdigest()
+
+
+class _FilePart:
+    """A file sent in a multipart body, from its current position; the file is
+    hashed as it is read"""
+
+    def __init__(self, file):
+        self.file = file
+        self.start = file.tell()
+        file.seek(0, os.SEEK_END)
+        self.size = file.tell() - self.start
+        file.seek(self.start)
+        # local files sent whole seed the digest cache once they are read; in-memory
+        # files (e.g. from 'xpi_builder.archive') can have a name, but no descriptor
+        self.path = getattr(file, 'name', None)
+        self.stat = None
+        if self.start == 0 and isinstance(self.path, str):
+            try:
+                self.stat = os.fstat(file.fileno())
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+        self.rewind()
+
+    def rewind(self):
+        self.file.seek(self.start)
+        self.sha256 = hashlib.sha256()
+        self.read_size = 0
+
+    def read(self, size):
+        chunk = self.file.read(size)
+        self.sha256.update(chunk)
+        self.read_size += len(chunk)
+        if self.read_size == self.size and self.stat is not None and chunk:
+            _remember(self.path, self.stat, self.sha256.hexdigest())
+        return chunk
+
+    @property
+    def digest(self):
+        """The SHA-256 hex digest of the file, once it was sent"""
+        return self.sha256.hexdigest() if self.read_size == self.size else None
+
+
+class MultipartStream:
+    """A multipart/form-data body that requests sends in chunks: 'fields' and 'files'
+    take the same values as the 'data' and 'files' arguments of requests. The digests
+    of the files sent are found in 'digests' once the body was read"""
+
+    def __init__(self, fields=None, files=None):
+        boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        self.files = {}
+        self._parts = []
+        for name, value in (fields or {}).items():
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                if item is None:
+                    continue
+                header = f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+                self._parts.append(f'{header}\r\n\r\n{item}\r\n'.encode())
+        for name, file in (files or {}).items():
+            if isinstance(file, tuple):
+                filename, file = file[:2]
+            else:
+                filename = os.path.basename(getattr(file, 'name', name))
+            part = self.files[name] = _FilePart(file)
+            self._parts += [
+                (
+                    f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                    f'filename="{filename}"\r\nContent-Type: application/octet-stream\r\n\r\n'
+                ).encode(),
+                part,
+                b'\r\n',
+            ]
+        self._parts.append(f'--{boundary}--\r\n'.encode())
+        self.seek(0)
+
+    @property
+    def digests(self):
+        return {name: part.digest for name, part in self.files.items()}
+
+    def __len__(self):
+        return sum(
+            part.size if isinstance(part, _FilePart) else len(part) for part in self._parts
+        )
+
+    def __iter__(self):
+        return iter(lambda: self.read(CHUNK_SIZE), b'')
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Only rewinding is supported, so the body can be sent again on retries"""
+        if (offset, whence) != (0, os.SEEK_SET):
+            raise ValueError('Multipart streams can only be rewound')
+        self._index = 0
+        self._offset = 0
+        for part in self.files.values():
+            part.rewind()
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return b''.join(iter(lambda: self.read(CHUNK_SIZE), b''))
+        chunks = []
+        while size > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, _FilePart):
+                chunk = part.read(size)
+            else:
+                chunk = part[self._offset : self._offset + size]
+                self._offset += len(chunk)
+            if not chunk:
+                self._index += 1
+                self._offset = 0
+                continue
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
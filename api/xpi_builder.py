@@ -0,0 +1,79 @@
+"""Builds the addon archives used in submission tests in memory. Archives are
+cached by the hash of their contents, so identical addons are only built once per
+test run, and nothing is written to a shared file that other workers could overwrite"""
+
+import hashlib
+import io
+import json
+import os
+import zipfile
+
+# archives built in this process, keyed by the sha256 of their entries
+_cache = {}
+# fixed timestamp for the archive entries, so the same contents produce the same bytes
+_ZIP_DATE_TIME = (2020, 1, 1, 0, 0, 0)
+
+
+def _as_bytes(content):
+    if isinstance(content, bytes):
+        return content
+    if isinstance(content, (dict, list)):
+        return json.dumps(content).encode()
+    return str(content).encode()
+
+
+def build(manifest, locales=None, icons=None, scripts=None, files=None):
+    """Returns the bytes of a zip archive holding the manifest and, optionally:
+    'locales' - {locale: messages dict}, stored as '_locales/<locale>/messages.json'
+    'icons' - {archive path: image bytes or path of a local image}
+    'scripts' - {archive path: script source}, e.g. background scripts
+    'files' - {archive path: content} for any other file"""
+    entries = {'manifest.json': _as_bytes(manifest)}
+    for locale, messages in (locales or {}).items():
+        entries[f'_locales/{locale}/messages.json'] = _as_bytes(messages)
+    for path, icon in (icons or {}).items():
+        if isinstance(icon, str) and os.path.isfile(icon):
+            with open(icon, 'rb') as f:
+                icon = f.read()
+        entries[path] = _as_bytes(icon)
+    for path, source in {**(scripts or {}), **(files or {})}.items():
+        entries[path] = _as_bytes(source)
+    digest = hashlib.sha256()
+    for path in sorted(entries):
+        digest.update(path.encode() + b'\0' + hashlib.sha256(entries[path]).digest())
+    key = digest.hexdigest()
+    if key not in _cache:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for path in sorted(entries):
+                zipf.writestr(
+                    zipfile.ZipInfo(path, _ZIP_DATE_TIME),
+                    entries[path],
+                    compress_type=zipfile.ZIP_DEFLATED,
+                )
+        _cache[key] = buffer.getvalue()
+    return _cache[key]
+
+
+def archive(manifest, name='make-addon.zip', **contents):
+    """Returns the built addon as an in-memory file that can be passed
+    directly to an upload request"""
+    file = io.BytesIO(build(manifest, **contents))
+    # requests uses the 'name' attribute as the filename of the uploaded file
+    file.name = name
+    return file
+
+
+def write(manifest, directory='sample-addons', **contents):
+    """Writes the built addon under a name derived from its contents and returns that
+    name; used by the DevHub tests, where the browser needs a file on disk to upload.
+    The file is replaced atomically, so concurrent writers can't corrupt it"""
+    data = build(manifest, **contents)
+    name = f'make-addon-{hashlib.sha256(data).hexdigest()[:12]}.zip'
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    return name
@@ -2,7 +2,10 @@ import requests
 
 from pypom import Page, Region
 
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
@@ -10,14 +13,104 @@ from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from regions.desktop import reads
+
+# Installed once per document, it keeps track of the fetch/XHR requests started by the
+# page and of the time of the last DOM change; returns the pending requests matching
+# the url fragments passed as argument and the time passed since the DOM last changed
+READINESS_SCRIPT = """
+const fragments = arguments[0];
+if (!window.__amoReadiness) {
+  const state = { pending: new Map(), next: 0, lastMutation: performance.now() };
+  window.__amoReadiness = state;
+  const track = (url) => {
+    const id = state.next++;
+    state.pending.set(id, String(url));
+    return () => state.pending.delete(id);
+  };
+  const fetch = window.fetch;
+  window.fetch = function (input) {
+    const done = track(input && input.url ? input.url : input);
+    return fetch.apply(this, arguments).finally(done);
+  };
+  const open = XMLHttpRequest.prototype.open;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__amoUrl = url;
+    return open.apply(this, arguments);
+  };
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    this.addEventListener("loadend", track(this.__amoUrl));
+    return send.apply(this, arguments);
+  };
+  new MutationObserver(() => {
+    state.lastMutation = performance.now();
+  }).observe(document.documentElement, {
+    childList: true,
+    subtree: true,
+    characterData: true,
+  });
+}
+const state = window.__amoReadiness;
+return {
+  readyState: document.readyState,
+  pending: [...state.pending.values()].filter(
+    (url) => fragments.length === 0 || fragments.some((f) => url.includes(f))
+  ),
+  quietFor: performance.now() - state.lastMutation,
+};
+"""
+
 
 class Base(Page):
     _url = "{base_url}"
     _amo_header = (By.CLASS_NAME, "Header")
+    # what 'ready' means for a page, used by 'wait_until_ready': the url fragments
+    # of the API requests that need to be completed, the elements of which at least
+    # one has to be displayed and how long (in seconds) the DOM has to stay unchanged
+    _ready_requests = ()
+    _ready_locators = ()
+    _ready_quiet_period = 0.5
 
     def __init__(self, selenium, base_url, **kwargs):
         super(Base, self).__init__(selenium, base_url, timeout=30, **kwargs)
 
+    def readiness_state(self):
+        """Returns the pending API requests that the page is waiting for and
+        the number of milliseconds since the page content last changed"""
+        return self.driver.execute_script(READINESS_SCRIPT, list(self._ready_requests))
+
+    def wait_until_ready(self, timeout=None):
+        """Waits for the page to be ready, as declared by the page class, instead of
+        sleeping for a fixed amount of time. Requests started before the first check
+        aren't tracked, so the DOM quiet period covers content still being loaded"""
+        state = {}
+
+        def ready(_):
+            state.update(self.readiness_state())
+            return (
+                state["readyState"] == "complete"
+                and not state["pending"]
+                and state["quietFor"] >= self._ready_quiet_period * 1000
+                and (
+                    not self._ready_locators
+                    or any(
+                        self.is_element_displayed(*locator)
+                        for locator in self._ready_locators
+                    )
+                )
+            )
+
+        wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
+        try:
+            wait.until(ready)
+        except TimeoutException:
+            raise TimeoutException(
+                f"{type(self).__name__} was not ready at {self.driver.current_url}, "
+                f"last readiness state was {state}"
+            )
+        return self
+
     def wait_for_page_to_load(self):
         self.wait.until(
             lambda _: self.find_element(*self._amo_header).is_displayed(),
@@ -46,6 +139,17 @@ class Base(Page):
         self.wait.until(EC.element_to_be_clickable(element))
         return self
 
+    # waiting for an element and reading it in one WebDriver call; regions use the
+    # functions of 'regions.desktop.reads' directly
+    def read_text(self, locator):
+        return reads.read_text(self, locator)
+
+    def read_attr(self, locator, name):
+        return reads.read_attr(self, locator, name)
+
+    def read_many(self, locators):
+        return reads.read_many(self, locators)
+
     @property
     def header(self):
         return Header(self)
@@ -36,6 +36,10 @@ class EditAddon(Base):
         self.wait.until(lambda _: self.is_element_displayed(*self._addon_name_locator))
         return self
 
+    @staticmethod
+    def open_edit_page(addon_slug, base_url, selenium):
+        selenium.get(f"{base_url}/developers/addon/{addon_slug}/edit")
+
     @property
     def name(self):
         self.wait_for_element_to_be_displayed(self._addon_name_locator)
@@ -10,6 +10,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from pages.desktop.base import Base
 from pages.desktop.frontend.reviews import Reviews
 from pages.desktop.frontend.versions import Versions
+from regions.desktop.reads import read_attr, read_text
 
 
 class Detail(Base):
@@ -41,6 +42,14 @@ class Detail(Base):
     _paragraphs_with_links_message = (By.CSS_SELECTOR, "p.Errors-paragraph-with-links")
     _card_header_text_message = (By.CSS_SELECTOR, ".Card-header-text")
     _why_was_it_blocked_message = (By.CSS_SELECTOR, ".Card-contents > h2")
+    # the page is ready when the addon details were fetched and the addon title (or,
+    # for addons that can't be shown, the error or block message) was rendered
+    _ready_requests = ("/api/v5/addons/",)
+    _ready_locators = (
+        _addon_name_locator,
+        _paragraphs_with_links_message,
+        _why_was_it_blocked_message,
+    )
     _block_metadata_message = (By.CSS_SELECTOR, ".Block-metadata")
 
     def wait_for_page_to_load(self):
@@ -48,8 +57,7 @@ class Detail(Base):
         self.wait.until(
             expected.invisibility_of_element_located((By.CLASS_NAME, "LoadingText"))
         )
-        time.sleep(3)
-        return self
+        return self.wait_until_ready()
 
     @property
     def name(self):
@@ -321,12 +329,7 @@ class Detail(Base):
 
         @property
         def rating_score_tile(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._rating_score_title_locator)
-            )
-            return self.find_element(*self._rating_score_title_locator).get_attribute(
-                "title"
-            )
+            return read_attr(self, self._rating_score_title_locator, "title")
 
         @property
         def rating_title(self):
@@ -366,24 +369,15 @@ class Detail(Base):
 
         @property
         def contribute_card_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._contribute_header_locator)
-            )
-            return self.find_element(*self._contribute_header_locator).text
+            return read_text(self, self._contribute_header_locator)
 
         @property
         def contribute_card_content(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._contribute_header_locator)
-            )
-            return self.find_element(*self._contribute_content_locator).text
+            return read_text(self, self._contribute_content_locator)
 
         @property
         def contribute_button_text(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._contribute_button_locator)
-            )
-            return self.find_element(*self._contribute_button_locator).text
+            return read_text(self, self._contribute_button_locator)
 
         @property
         def contribute_button_heart_icon(self):
@@ -409,10 +403,7 @@ class Detail(Base):
 
         @property
         def permissions_card_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._permissions_header_locator)
-            )
-            return self.find_element(*self._permissions_header_locator).text
+            return read_text(self, self._permissions_header_locator)
 
         @property
         def permissions_list(self):
@@ -424,10 +415,7 @@ class Detail(Base):
 
         @property
         def permissions_learn_more_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._permissions_learn_more_locator)
-            )
-            return self.find_element(*self._permissions_learn_more_locator).text
+            return read_text(self, self._permissions_learn_more_locator)
 
         @property
         def permissions_learn_more_button_icon(self):
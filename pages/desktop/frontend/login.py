@@ -1,14 +1,13 @@
 import os
 import time
 import requests
-import pyotp
 
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 from pages.desktop.base import Base
-from scripts import reusables
+from scripts import reusables, totp
 
 
 class Login(Base):
@@ -198,18 +197,30 @@ class Login(Base):
         if key != "":
             self.wait.until(EC.url_contains("signin_totp_code"))
             self.wait.until(EC.visibility_of_element_located(self._2fa_input_locator))
-            time.sleep(30)
-            totp = pyotp.TOTP(key)
-            self.find_element(*self._2fa_input_locator).send_keys(totp.now())
+            self.find_element(*self._2fa_input_locator).send_keys(totp.next_code(key))
             self.find_element(*self._confirm_2fa_button_locator).click()
-            time.sleep(5)
             for max_retries in range(0, 2):
+                # wait for FxA to either accept the code and redirect to AMO or reject it
+                self.wait.until(
+                    lambda _: "signin_totp_code" not in self.driver.current_url
+                    or self.is_element_displayed(*self._error_2fa_code_locator),
+                    message="FxA did not respond to the submitted 2FA code",
+                )
                 if self.is_element_displayed(*self._error_2fa_code_locator):
-                    time.sleep(500)
-                    totp = pyotp.TOTP(key)
+                    # the code was rejected; a different code is guaranteed by the totp helper
+                    error = self.find_element(*self._error_2fa_code_locator)
                     self.find_element(*self._2fa_input_locator).clear()
-                    self.find_element(*self._2fa_input_locator).send_keys(totp.now())
+                    self.find_element(*self._2fa_input_locator).send_keys(
+                        totp.next_code(key)
+                    )
                     self.find_element(*self._confirm_2fa_button_locator).click()
+                    # the error of the previous code stays displayed until FxA handles
+                    # the new one, so it has to go away before the next check
+                    self.wait.until(
+                        lambda _: "signin_totp_code" not in self.driver.current_url
+                        or EC.invisibility_of_element(error)(self.driver),
+                        message="FxA did not respond to the new 2FA code",
+                    )
                 else:
                     break
 
@@ -5,6 +5,8 @@ from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from regions.desktop.snapshot import snapshot
+
 
 class Search(Page):
     _context_card_locator = (By.CLASS_NAME, "SearchContextCard-header")
@@ -113,6 +115,20 @@ class Search(Page):
             items = self.find_elements(*self._result_locator)
             return [self.ResultListItems(self, el) for el in items]
 
+        @property
+        def search_results_snapshot(self):
+            """The promoted badge labels of the search results, read in one call"""
+            self.wait.until(EC.visibility_of_element_located(self._result_locator))
+            return snapshot(
+                self,
+                self._result_locator,
+                {
+                    "promoted_badge_label": (
+                        self.ResultListItems._promoted_badge_label_locator
+                    ),
+                },
+            )
+
         @property
         def themes(self):
             items = self.find_elements(*self._theme_locator)
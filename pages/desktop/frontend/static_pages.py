@@ -1,7 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.desktop.base import Base
+from pages.desktop.base import Base, Header
 from pages.desktop.frontend.details import Detail
 
 
@@ -92,24 +92,21 @@ class StaticPages(Base):
         self.wait.until(
             EC.visibility_of_element_located(self._get_involved_links_locator)
         )
-        links = self.find_elements(*self._get_involved_links_locator)
-        # add the 'wiki' link
-        links.append(self.find_elements(*self._content_card_links_locator)[10])
-        return links
+        return _get_involved_links(self)
 
     @property
     def report_an_issue_links(self):
         self.wait.until(
             EC.visibility_of_element_located(self._content_card_links_locator)
         )
-        return self.find_elements(*self._content_card_links_locator)[11:15]
+        return _report_an_issue_links(self)
 
     @property
     def get_support_links(self):
         self.wait.until(
             EC.visibility_of_element_located(self._content_card_links_locator)
         )
-        return self.find_elements(*self._content_card_links_locator)[15:]
+        return _get_support_links(self)
 
     # ------- Blocked Add-on page
     @property
@@ -117,21 +114,21 @@ class StaticPages(Base):
         self.wait.until(
             EC.visibility_of_element_located(self._blocked_addon_page_links_locator)
         )
-        return self.find_elements(*self._blocked_addon_page_links_locator)[0]
+        return _blocked_addon_page_link(self, 0)
 
     @property
     def certain_criteria_link(self):
         self.wait.until(
             EC.visibility_of_element_located(self._blocked_addon_page_links_locator)
         )
-        return self.find_elements(*self._blocked_addon_page_links_locator)[1]
+        return _blocked_addon_page_link(self, 1)
 
     @property
     def this_support_article_link(self):
         self.wait.until(
             EC.visibility_of_element_located(self._blocked_addon_page_links_locator)
         )
-        return self.find_elements(*self._blocked_addon_page_links_locator)[2]
+        return _blocked_addon_page_link(self, 2)
 
     # ------- Login Expired page
     @property
@@ -149,3 +146,93 @@ class StaticPages(Base):
             EC.visibility_of_element_located((By.CSS_SELECTOR, ".AddonTitle"))
         )
         return Detail(self.driver, self.base_url)
+
+
+# the links of the static pages that are picked by their position; 'page' is any
+# object with 'find_elements', i.e. the page in the browser or its HTML
+def _get_involved_links(page):
+    # all the links except 'wiki', then the 'wiki' link
+    links = page.find_elements(*StaticPages._get_involved_links_locator)
+    links.append(page.find_elements(*StaticPages._content_card_links_locator)[10])
+    return links
+
+
+def _report_an_issue_links(page):
+    return page.find_elements(*StaticPages._content_card_links_locator)[11:15]
+
+
+def _get_support_links(page):
+    return page.find_elements(*StaticPages._content_card_links_locator)[15:]
+
+
+def _blocked_addon_page_link(page, index):
+    """The links of the Blocked Add-on page are: the add-on policies (0), the
+    certain criteria (1) and the support article (2)"""
+    return page.find_elements(*StaticPages._blocked_addon_page_links_locator)[index]
+
+
+class StaticPagesHtml:
+    """The read-only checks of StaticPages, on the server-side rendered HTML of the
+    page (see pages.desktop.html_page) instead of a browser"""
+
+    def __init__(self, html_page):
+        self.html_page = html_page
+
+    def _element(self, locator):
+        return self.html_page.find_element(*locator)
+
+    @property
+    def title(self):
+        return self.html_page.title
+
+    @property
+    def page_header(self):
+        return self._element(StaticPages._page_header_locator).text
+
+    @property
+    def content(self):
+        return self._element(StaticPages._content_locator)
+
+    @property
+    def login_button(self):
+        header = self._element(Header._root_locator)
+        return header.find_element(*Header._login_locator)
+
+    # ------- Review Guidelines page
+    @property
+    def forum_link(self):
+        return self._element(StaticPages._review_guidelines_page_forum_link_locator)
+
+    # ------- About Firefox Add-ons page
+    @property
+    def thunderbird_link(self):
+        return self._element(StaticPages._thunderbird_link_locator)
+
+    @property
+    def seamonkey_link(self):
+        return self._element(StaticPages._seamonkey_link_locator)
+
+    @property
+    def get_involved_links(self):
+        return _get_involved_links(self.html_page)
+
+    @property
+    def report_an_issue_links(self):
+        return _report_an_issue_links(self.html_page)
+
+    @property
+    def get_support_links(self):
+        return _get_support_links(self.html_page)
+
+    # ------- Blocked Add-on page
+    @property
+    def addon_policies_link(self):
+        return _blocked_addon_page_link(self.html_page, 0)
+
+    @property
+    def certain_criteria_link(self):
+        return _blocked_addon_page_link(self.html_page, 1)
+
+    @property
+    def this_support_article_link(self):
+        return _blocked_addon_page_link(self.html_page, 2)
@@ -0,0 +1,118 @@
+"""Browserless access to the server-side rendered AMO pages. AMO renders its
+pages on the server, so tests which only read the text and links of a page can
+fetch its HTML and evaluate the locators declared by the page objects on it,
+instead of starting a browser and waiting for the page to be rendered again"""
+
+import re
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+# compiled css selectors, since the same locators are evaluated on every page
+_selectors = {}
+# the axis cssselect starts each alternative of a selector with
+_root_axis = re.compile(r"(^|\| )descendant-or-self::")
+_hidden_style = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+
+
+def _xpath(locator):
+    """Converts a selenium locator to an XPath expression"""
+    strategy, value = locator
+    if strategy == By.XPATH:
+        return value
+    if strategy == By.CLASS_NAME:
+        value = "." + value
+    elif strategy == By.ID:
+        value = f'[id="{value}"]'
+    elif strategy == By.NAME:
+        value = f'[name="{value}"]'
+    elif strategy not in (By.CSS_SELECTOR, By.TAG_NAME):
+        raise ValueError(
+            f'Locator strategy "{strategy}" is not supported in HTML pages'
+        )
+    if value not in _selectors:
+        _selectors[value] = CSSSelector(value).path
+    return _selectors[value]
+
+
+class HtmlElement:
+    """A parsed HTML element offering the read-only part of the WebElement API"""
+
+    def __init__(self, element):
+        self.element = element
+
+    @property
+    def text(self):
+        """The element text with whitespace collapsed, as a browser displays it"""
+        return " ".join(self.element.text_content().split())
+
+    @property
+    def tag_name(self):
+        return self.element.tag
+
+    def get_attribute(self, name):
+        return self.element.get(name)
+
+    def is_displayed(self):
+        """Approximates the browser visibility: the element and its ancestors are
+        neither 'hidden' nor styled inline as not displayed"""
+        for element in [self.element, *self.element.iterancestors()]:
+            if element.get("hidden") is not None or _hidden_style.search(
+                element.get("style", "")
+            ):
+                return False
+        return True
+
+    def find_element(self, strategy, locator):
+        return _find_element(self.element, (strategy, locator))
+
+    def find_elements(self, strategy, locator):
+        return _find_elements(self.element, (strategy, locator))
+
+
+def _find_elements(root, locator):
+    # css selectors only match the descendants of the root, as they do in selenium
+    path = _xpath(locator)
+    if locator[0] != By.XPATH:
+        path = _root_axis.sub(r"\1descendant::", path)
+    return [HtmlElement(element) for element in root.xpath(path)]
+
+
+def _find_element(root, locator):
+    elements = _find_elements(root, locator)
+    if not elements:
+        raise NoSuchElementException(f"Unable to locate element: {locator}")
+    return elements[0]
+
+
+class HtmlPage:
+    """A server-side rendered page, loaded through a requests session"""
+
+    def __init__(self, url, status_code, html):
+        self.url = url
+        self.status_code = status_code
+        self.document = lxml.html.document_fromstring(html)
+
+    @classmethod
+    def load(cls, session, url):
+        response = session.get(url, headers={"Accept": "text/html"}, timeout=60)
+        return cls(response.url, response.status_code, response.content)
+
+    @property
+    def title(self):
+        return " ".join((self.document.findtext(".//title") or "").split())
+
+    def find_element(self, strategy, locator):
+        return _find_element(self.document, (strategy, locator))
+
+    def find_elements(self, strategy, locator):
+        return _find_elements(self.document, (strategy, locator))
+
+    def is_element_displayed(self, strategy, locator):
+        try:
+            return self.find_element(strategy, locator).is_displayed()
+        except NoSuchElementException:
+            return False
@@ -0,0 +1,114 @@
+"""Waits for elements to be displayed and reads their text or attributes in a single
+WebDriver call. The usual 'wait.until(visibility_of_element_located)', 'find_element'
+and '.text' sequence of a property costs three or more round trips and up to one
+polling interval of extra latency; here, the waiting is done in the browser, which
+checks the elements on every DOM change and animation frame and returns as soon as
+they are all displayed"""
+
+from selenium.common.exceptions import TimeoutException
+
+from regions.desktop.snapshot import js_locator
+
+# the default WebDriver script timeout; waits in the browser end a second earlier,
+# so a missing element raises a TimeoutException naming it instead of a script timeout
+SCRIPT_TIMEOUT = 30
+
+READ_SCRIPT = """
+const [root, reads, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const context = root || document;
+const findFirst = ([kind, value]) => {
+  if (kind === 'css') {
+    return context.querySelector(value);
+  }
+  return document.evaluate(
+    value, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+  ).singleNodeValue;
+};
+const isDisplayed = (el) =>
+  el.checkVisibility
+    ? el.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true })
+    : el.getClientRects().length > 0;
+// returns the values once all the elements are displayed, else the missing ones
+const read = () => {
+  const values = [];
+  const missing = [];
+  reads.forEach(([locator, attribute], index) => {
+    const el = findFirst(locator);
+    if (!el || !isDisplayed(el)) {
+      missing.push(index);
+    } else {
+      values.push(
+        attribute === null ? el.innerText.trim() : el.getAttribute(attribute)
+      );
+    }
+  });
+  return missing.length ? { missing } : { values };
+};
+let finished = false;
+let frame = null;
+let timer = null;
+const observer = new MutationObserver(() => check());
+const finish = (result) => {
+  finished = true;
+  observer.disconnect();
+  cancelAnimationFrame(frame);
+  clearTimeout(timer);
+  done(result);
+};
+// changes of style and layout don't always mutate the DOM, so the elements are
+// also checked on every animation frame
+const check = () => {
+  if (finished) {
+    return;
+  }
+  const result = read();
+  if (result.values) {
+    finish(result);
+  } else {
+    cancelAnimationFrame(frame);
+    frame = requestAnimationFrame(check);
+  }
+};
+observer.observe(document.documentElement, {
+  childList: true,
+  subtree: true,
+  characterData: true,
+  attributes: true,
+});
+timer = setTimeout(() => finish(read()), timeout);
+check();
+"""
+
+
+def read_many(context, locators, timeout=None):
+    """Waits until the first element matching each locator is displayed and returns
+    their values: the visible text for a locator, or the value of the attribute for a
+    (locator, attribute name) pair. Elements are searched in the root of 'context' if
+    it is a region, else in the page; 'timeout' defaults to the page's timeout"""
+    reads = [
+        (entry, None) if isinstance(entry[0], str) else tuple(entry)
+        for entry in locators
+    ]
+    timeout = min(context.timeout if timeout is None else timeout, SCRIPT_TIMEOUT - 1)
+    result = context.driver.execute_async_script(
+        READ_SCRIPT,
+        getattr(context, 'root', None),
+        [[js_locator(locator), attribute] for locator, attribute in reads],
+        timeout * 1000,
+    )
+    if 'missing' in result:
+        missing = [reads[index][0] for index in result['missing']]
+        raise TimeoutException(f'Elements not displayed after {timeout}s: {missing}')
+    return result['values']
+
+
+def read_text(context, locator, timeout=None):
+    """The visible text of the first element matching the locator, once displayed"""
+    return read_many(context, [locator], timeout)[0]
+
+
+def read_attr(context, locator, name, timeout=None):
+    """The value of an attribute of the first element matching the locator, once
+    displayed"""
+    return read_many(context, [(locator, name)], timeout)[0]
@@ -3,6 +3,8 @@ from pypom import Region
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from regions.desktop.snapshot import snapshot
+
 
 class Shelves(Region):
 
@@ -39,6 +41,20 @@ class Shelves(Region):
             items = self.find_elements(*self._addon_item_locator)
             return [self.ShelfDetail(self.page, el) for el in items]
 
+        @property
+        def list_snapshot(self):
+            """The name, icon and users of the shelf addons, read in one call"""
+            self.wait.until(EC.visibility_of_element_located(self._addon_item_locator))
+            return snapshot(
+                self,
+                self._addon_item_locator,
+                {
+                    'name': self.ShelfDetail._addon_name_locator,
+                    'icon': self.ShelfDetail._addon_icon_locator,
+                    'users': self.ShelfDetail._addon_users_locator,
+                },
+            )
+
         @property
         def card_header(self):
             self.wait.until(EC.visibility_of_element_located(self._promo_card_header_locator))
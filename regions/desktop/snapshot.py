@@ -0,0 +1,105 @@
+"""Reads the values displayed by a list of regions in a single WebDriver call.
+Region properties make a wait, a find and a read call for every field of every
+item; tests which only check the displayed values can use a snapshot instead"""
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+SNAPSHOT_SCRIPT = """
+const [context, root, fields, attributes] = arguments;
+const findAll = (parent, [kind, value]) => {
+  if (kind === 'css') {
+    return [...parent.querySelectorAll(value)];
+  }
+  const result = document.evaluate(
+    value, parent, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+  );
+  return Array.from({ length: result.snapshotLength }, (_, i) => result.snapshotItem(i));
+};
+const isDisplayed = (el) =>
+  el.checkVisibility
+    ? el.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true })
+    : el.getClientRects().length > 0;
+return findAll(context || document, root).map((item) => {
+  const record = {};
+  for (const [name, locator] of Object.entries(fields)) {
+    const el = findAll(item, locator)[0];
+    if (!el) {
+      record[name] = null;
+      continue;
+    }
+    const displayed = isDisplayed(el);
+    record[name] = {
+      text: displayed ? el.innerText.trim() : '',
+      displayed: displayed,
+      attributes: Object.fromEntries(
+        attributes.map((attribute) => [attribute, el.getAttribute(attribute)])
+      ),
+    };
+  }
+  return record;
+});
+"""
+
+
+class ElementSnapshot:
+    """The state of an element at the time of the snapshot: its visible text (empty
+    for hidden elements, like WebElement.text), whether it was displayed and the
+    values of the requested attributes"""
+
+    __slots__ = ('text', 'displayed', 'attributes')
+
+    def __init__(self, text, displayed, attributes):
+        self.text = text
+        self.displayed = displayed
+        self.attributes = attributes
+
+    def __repr__(self):
+        return f'ElementSnapshot({self.text!r}, displayed={self.displayed})'
+
+
+def js_locator(locator):
+    strategy, value = locator
+    if strategy == By.XPATH:
+        return ['xpath', value]
+    if strategy == By.CSS_SELECTOR:
+        return ['css', value]
+    if strategy == By.CLASS_NAME:
+        return ['css', f'.{value}']
+    if strategy == By.ID:
+        return ['css', f'[id="{value}"]']
+    if strategy == By.NAME:
+        return ['css', f'[name="{value}"]']
+    if strategy == By.TAG_NAME:
+        return ['css', value]
+    raise ValueError(f'Locator strategy "{strategy}" is not supported in snapshots')
+
+
+def snapshot(context, item_locator, fields, attributes=(), optional=()):
+    """Returns one dict per element matching 'item_locator', mapping each field name
+    to the ElementSnapshot of the first element matching the field locator inside the
+    item. 'context' is the page or region the items are searched in and 'attributes'
+    the attribute names read for every field. A field that is not found raises
+    NoSuchElementException, unless it is listed in 'optional', which maps it to None"""
+    root = getattr(context, 'root', None)
+    records = context.driver.execute_script(
+        SNAPSHOT_SCRIPT,
+        root,
+        js_locator(item_locator),
+        {name: js_locator(locator) for name, locator in fields.items()},
+        list(attributes),
+    )
+    for index, record in enumerate(records):
+        for name, value in record.items():
+            if value is None and name not in optional:
+                raise NoSuchElementException(
+                    f'Snapshot field "{name}" was not found by {fields[name]} '
+                    f'in item {index} of {item_locator}'
+                )
+    return [
+        {
+            name: None if value is None else ElementSnapshot(**value)
+            for name, value in record.items()
+        }
+        for record in records
+    ]
@@ -0,0 +1,111 @@
+"""Deletes the addons created by the tests of a run once the run is over. The addons
+to delete are found in the DevHub listings of the users who created them, by the
+run tag their names contain, and are deleted through the addons API by a bounded
+pool of threads; each deletion is checked by requesting the addon again.
+
+The AMO API only lists public addons, while most of the addons created by the
+tests are still awaiting review, which is why the server-side rendered DevHub
+listing is read instead"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from selenium.webdriver.common.by import By
+
+from pages.desktop.html_page import HtmlPage
+
+# DevHub listing path of each kind of addon
+LISTINGS = {"addons": "/developers/addons", "themes": "/developers/themes"}
+_item_link_locator = (By.CSS_SELECTOR, ".item.addon .info > h3 > a")
+
+
+def run_tag(config):
+    """A tag shared by all the processes of a run, to be added to the names of the
+    addons that should be deleted when the run is over"""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        return f"run{workerinput['testrunuid'][:8]}"
+    if not hasattr(config, "_amo_run_tag"):
+        config._amo_run_tag = f"run{uuid.uuid4().hex[:8]}"
+    return config._amo_run_tag
+
+
+def list_addons(client, sessionid, kind):
+    """Returns (slug, name) pairs for the addons of the user the session belongs to"""
+    client.session.cookies.set("sessionid", sessionid)
+    addons = []
+    try:
+        page_number = 1
+        while True:
+            page = HtmlPage.load(
+                client.session,
+                f"{client.base_url}{LISTINGS[kind]}?page={page_number}",
+            )
+            links = page.find_elements(*_item_link_locator)
+            found = [
+                (link.get_attribute("href").rstrip("/").split("/")[-2], link.text)
+                for link in links
+            ]
+            new = [addon for addon in found if addon not in addons]
+            if not new:
+                return addons
+            addons.extend(new)
+            page_number += 1
+    finally:
+        client.session.cookies.clear()
+
+
+def _delete(client, slug):
+    try:
+        response = client.delete_addon(slug)
+    except requests.HTTPError as error:
+        # the delete token can't be requested for an addon that is already gone
+        response = error.response
+    if response.status_code not in (204, 404):
+        return f"delete returned {response.status_code}: {response.text}"
+    # the addon is gone once the authenticated detail request can't find it
+    status_code = client.get_addon(slug).status_code
+    if status_code != 404:
+        return f"still found after the delete ({status_code})"
+    return None
+
+
+def delete_addons(client, slugs, max_workers=8):
+    """Deletes the addons concurrently; returns {slug: error} for the failures"""
+    slugs = list(slugs)
+    if not slugs:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(slugs))) as executor:
+        errors = executor.map(lambda slug: _delete(client, slug), slugs)
+        return {slug: error for slug, error in zip(slugs, errors) if error is not None}
+
+
+class AddonCleanup:
+    """Collects the user sessions and kinds of addons registered by the tests and
+    deletes the addons whose name holds the run tag when 'run' is called; the
+    client should not be shared with the tests, since it holds the listing cookie"""
+
+    def __init__(self, client, tag, max_workers=8):
+        self.client = client
+        self.tag = tag
+        self.max_workers = max_workers
+        self.registered = set()
+
+    def register(self, sessionid, kind):
+        self.registered.add((sessionid, kind))
+
+    def run(self):
+        """Returns {slug: error} for the addons that could not be deleted"""
+        errors = {}
+        for sessionid, kind in sorted(self.registered):
+            slugs = [
+                slug
+                for slug, name in list_addons(self.client, sessionid, kind)
+                if self.tag in name
+            ]
+            client = self.client.with_auth(sessionid)
+            errors.update(delete_addons(client, slugs, self.max_workers))
+            print(f"Deleted {len(slugs)} {kind} tagged with {self.tag}")
+        self.registered.clear()
+        return errors
@@ -0,0 +1,259 @@
+"""A pool of addons created ahead of the tests that need one, so that the upload,
+the server-side validation and the addon creation are not part of the test run.
+Every test process keeps a number of ready addons per template for each user in a
+SQLite database shared by the xdist workers; tests lease an addon, change or delete
+it as they like and give it back, and a background thread in each process creates
+the replacements and deletes the addons that were given back. Pool addons are
+tracked by their id, which stays the same when a test changes the addon slug.
+
+An addon is only used by one test: leased addons are never handed out again"""
+
+import collections
+import os
+import socket
+import threading
+import time
+
+import psutil
+import requests
+
+from api import payloads
+from scripts import reusables
+from scripts.local_db import transaction
+
+DEFAULT_PATH = ".amo-addon-pool.sqlite3"
+
+# 'file' - the addon from 'sample-addons' that is uploaded
+# 'details' - builds the addon create payload from the upload uuid
+Template = collections.namedtuple("Template", ["file", "channel", "details"])
+
+TEMPLATES = {
+    "listed_extension": Template(
+        "listed-addon.zip",
+        "listed",
+        lambda uuid: {
+            "categories": ["bookmarks"],
+            "summary": {"en-US": "Addon created by the release tests addon pool"},
+            "version": {
+                "upload": uuid,
+                "license": "all-rights-reserved",
+                "compatibility": ["firefox"],
+            },
+        },
+    ),
+    "unlisted_extension": Template(
+        "unlisted-addon.zip", "unlisted", lambda uuid: {"version": {"upload": uuid}}
+    ),
+    "theme": Template(
+        "theme.xpi", "listed", lambda uuid: payloads.theme_details(uuid, "CC-BY-3.0")
+    ),
+    "language_pack": Template("lang-pack.xpi", "listed", payloads.lang_tool_details),
+}
+
+
+def create_addon(client, template_name):
+    """Creates an addon from the template through the API; returns its id and slug"""
+    template = TEMPLATES[template_name]
+    upload = client.upload(f"sample-addons/{template.file}", template.channel)
+    upload.raise_for_status()
+    uuid = upload.json()["uuid"]
+    client.wait_for_upload_processed(uuid)
+    slug = f"pool-{template_name.replace('_', '-')}-{reusables.get_random_string(10)}"
+    addon = client.create_addon({**template.details(uuid), "slug": slug})
+    addon.raise_for_status()
+    return addon.json()["id"], addon.json()["slug"]
+
+
+class AddonPool:
+    """The pool of a user in an AMO environment. Addons go through the 'creating',
+    'ready', 'leased', 'returned' and 'deleting' states; addons leased or being
+    deleted by a process that is no longer running are deleted again, and the
+    creations it didn't finish are dropped"""
+
+    def __init__(self, environment, user, path=DEFAULT_PATH, poll_interval=1):
+        self.environment = environment
+        self.user = user
+        self.path = path
+        self.poll_interval = poll_interval
+        self.host = socket.gethostname()
+        with transaction(self.path) as db:
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS addons (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    environment TEXT NOT NULL,
+                    user TEXT NOT NULL,
+                    template TEXT NOT NULL,
+                    addon_id INTEGER,
+                    slug TEXT,
+                    status TEXT NOT NULL,
+                    holder TEXT,
+                    host TEXT NOT NULL,
+                    pid INTEGER NOT NULL,
+                    updated_at REAL NOT NULL
+                )"""
+            )
+            columns = [row[1] for row in db.execute("PRAGMA table_info(addons)")]
+            if "addon_id" not in columns:
+                # pools made before the addons were tracked by id
+                db.execute("ALTER TABLE addons ADD COLUMN addon_id INTEGER")
+
+    def _where(self):
+        return "environment = ? AND user = ?", (self.environment, self.user)
+
+    def _drop_orphaned(self, db):
+        for row_id, pid, status in db.execute(
+            """SELECT id, pid, status FROM addons
+            WHERE host = ? AND status IN ('creating', 'leased', 'deleting')""",
+            (self.host,),
+        ).fetchall():
+            if psutil.pid_exists(pid):
+                continue
+            if status == "creating":
+                db.execute("DELETE FROM addons WHERE id = ?", (row_id,))
+            else:
+                db.execute(
+                    "UPDATE addons SET status = 'returned' WHERE id = ?", (row_id,)
+                )
+
+    def _set(self, db, row_id, status, **columns):
+        assignments = "".join(f", {column} = ?" for column in columns)
+        db.execute(
+            f"""UPDATE addons SET status = ?, host = ?, pid = ?, updated_at = ?
+            {assignments} WHERE id = ?""",
+            (status, self.host, os.getpid(), time.time(), *columns.values(), row_id),
+        )
+
+    def claim_creation(self, template, size):
+        """Reserves the creation of an addon if the pool of the template holds fewer
+        than 'size' ready or upcoming addons; returns the id of the reserved row"""
+        where, params = self._where()
+        with transaction(self.path) as db:
+            self._drop_orphaned(db)
+            (count,) = db.execute(
+                f"""SELECT COUNT(*) FROM addons WHERE {where} AND template = ?
+                AND status IN ('creating', 'ready')""",
+                (*params, template),
+            ).fetchone()
+            if count >= size:
+                return None
+            cursor = db.execute(
+                """INSERT INTO addons
+                (environment, user, template, status, host, pid, updated_at)
+                VALUES (?, ?, ?, 'creating', ?, ?, ?)""",
+                (*params, template, self.host, os.getpid(), time.time()),
+            )
+            return cursor.lastrowid
+
+    def created(self, row_id, addon_id, slug):
+        with transaction(self.path) as db:
+            self._set(db, row_id, "ready", addon_id=addon_id, slug=slug)
+
+    def discard(self, row_id):
+        with transaction(self.path) as db:
+            db.execute("DELETE FROM addons WHERE id = ?", (row_id,))
+
+    def try_lease(self, template, holder):
+        """Leases the oldest ready addon of the template; returns its row id and slug,
+        or None if no addon is ready"""
+        where, params = self._where()
+        with transaction(self.path) as db:
+            row = db.execute(
+                f"""SELECT id, slug FROM addons WHERE {where} AND template = ?
+                AND status = 'ready' ORDER BY updated_at LIMIT 1""",
+                (*params, template),
+            ).fetchone()
+            if row is None:
+                return None
+            self._set(db, row[0], "leased", holder=holder)
+        return row
+
+    def lease(self, template, holder, timeout=300):
+        """Waits until an addon of the template is ready and leases it; returns its
+        row id, to give it back, and its slug"""
+        deadline = time.monotonic() + timeout
+        while True:
+            leased = self.try_lease(template, holder)
+            if leased is not None:
+                return leased
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"{holder} could not lease a {template} addon in {timeout}s"
+                )
+            time.sleep(self.poll_interval)
+
+    def give_back(self, row_id):
+        """Hands a leased addon over to be deleted"""
+        with transaction(self.path) as db:
+            db.execute(
+                """UPDATE addons SET status = 'returned', updated_at = ?
+                WHERE id = ?""",
+                (time.time(), row_id),
+            )
+
+    def claim_returned(self):
+        """Takes over the deletion of the addons given back; returns (row id, addon
+        id) pairs"""
+        where, params = self._where()
+        with transaction(self.path) as db:
+            self._drop_orphaned(db)
+            rows = db.execute(
+                f"""SELECT id, COALESCE(addon_id, slug) FROM addons
+                WHERE {where} AND status = 'returned'""",
+                params,
+            ).fetchall()
+            for row_id, _ in rows:
+                self._set(db, row_id, "deleting")
+        return rows
+
+
+class PoolReplenisher(threading.Thread):
+    """Keeps 'size' ready addons of each template in 'templates' in the pool and
+    deletes the addons given back, using its own API client; templates are added
+    when a test of the process leases one for the first time. On 'stop', the
+    addons given back are deleted, while the ready ones stay for the next run"""
+
+    def __init__(self, pool, client, size, interval=2):
+        super().__init__(name=f"addon-pool-{pool.user}", daemon=True)
+        self.pool = pool
+        self.client = client
+        self.templates = set()
+        self.size = size
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def sweep(self):
+        for row_id, addon_id in self.pool.claim_returned():
+            try:
+                response = self.client.delete_addon(addon_id)
+            except requests.HTTPError as error:
+                # the delete token can't be requested for an addon that is already gone
+                response = error.response
+            if response.status_code not in (204, 404):
+                print(
+                    f"Pool addon {addon_id} could not be deleted: "
+                    f"{response.status_code}"
+                )
+            self.pool.discard(row_id)
+
+    def replenish(self):
+        for template in list(self.templates):
+            row_id = self.pool.claim_creation(template, self.size)
+            if row_id is None:
+                continue
+            try:
+                self.pool.created(row_id, *create_addon(self.client, template))
+            except Exception as error:
+                self.pool.discard(row_id)
+                print(f"Pool addon from the {template} template failed: {error}")
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.sweep()
+            self.replenish()
+            self.stopped.wait(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.sweep()
+        self.client.close()
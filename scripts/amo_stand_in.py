@@ -0,0 +1,1658 @@
+"""A local stand-in for the AMO v5 API endpoints used by the API tests: uploads,
+addons, versions, authors, previews, accounts and addon abuse reports. Unlike the
+replay server of 'cassettes', it keeps its state in memory and answers any call,
+so payloads and response checks can be worked on without a stage account, and the
+overhead of the suite itself can be measured without the server latency.
+
+Calls are checked like AMO checks them, with the same error messages, and a call
+failing any check changes nothing. Uploads are validated from their manifest only
+and are processed after a configurable delay, simulating the validation run by AMO.
+Sessions are not checked against any account: any 'Session <token>' is accepted
+until it is deleted, and the user is named after the token ('stand-in-<user>');
+'seed' recreates the accounts and addons of the environment that the tests refer
+to through the variables file. Runs in a thread of the test process (see
+'--api-stand-in') or on its own:
+
+    python -m scripts.amo_stand_in --port 8800 --validation-latency 2"""
+
+import argparse
+import email.parser
+import email.policy
+import http.server
+import io
+import itertools
+import json
+import re
+import secrets
+import struct
+import threading
+import time
+import uuid
+import zipfile
+from urllib.parse import parse_qs, unquote, urlsplit
+
+API_PREFIX = "/api/v5"
+SESSION_PREFIX = "stand-in-"
+# ids of the accounts the stand-in knows of, besides the ones seen in sessions
+ACCOUNT_IDS = range(1, 2**31)
+CONTRIBUTIONS_QUERY = (
+    "?utm_content=product-page-contribute&utm_medium=referral"
+    "&utm_source=addons.mozilla.org"
+)
+SOURCE_EXTENSIONS = (".zip", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+UPLOAD_EXTENSIONS = (".crx", ".xpi", ".zip")
+
+LOCALES = frozenset(
+    "af ar ast az bg bn bs ca cak cs cy da de dsb el en-CA en-GB en-US eo es-AR "
+    "es-CL es-ES es-MX et eu fa fi fr fur fy-NL ga-IE gl gu-IN he hi-IN hr hsb hu "
+    "ia id is it ja ka kab kk ko lt lv mk mn ms my nb-NO ne-NP nl nn-NO oc pa-IN "
+    "pl pt-BR pt-PT ro ru si sk skr sl sq sr sv-SE te th tl tr trs uk ur uz vi "
+    "zh-CN zh-TW".split()
+)
+# the translated addon fields; the first two need a value in the default locale
+TRANSLATED_FIELDS = (
+    "name",
+    "summary",
+    "description",
+    "developer_comments",
+    "homepage",
+    "support_email",
+    "support_url",
+)
+REQUIRED_TRANSLATED_FIELDS = ("name", "summary")
+CATEGORIES = {
+    "extension": frozenset(
+        "alerts-updates appearance bookmarks download-management "
+        "feeds-news-blogging games-entertainment language-support "
+        "photos-music-videos privacy-security search-tools shopping "
+        "social-communication tabs web-development other".split()
+    ),
+    "statictheme": frozenset(
+        "abstract causes fashion film-and-tv firefox foxkeh holiday music nature "
+        "other scenery seasonal solid sports websites".split()
+    ),
+    "language": frozenset(["general"]),
+    "dictionary": frozenset(["general"]),
+}
+# categories of the android app, which can still be sent as {app: categories}
+ANDROID_CATEGORIES = frozenset(
+    "device-features-location experimental feeds-news-blogging performance "
+    "photos-media security-privacy shopping social-networking sports-games "
+    "user-interface other".split()
+)
+TAGS = frozenset(
+    [
+        "anti malware",
+        "anti tracker",
+        "antivirus",
+        "chat",
+        "container",
+        "content blocker",
+        "coupon",
+        "dailymotion",
+        "dark mode",
+        "dndbeyond",
+        "download",
+        "duckduckgo",
+        "facebook",
+        "google",
+        "mp3",
+        "music",
+        "password manager",
+        "pinterest",
+        "search",
+        "security",
+        "shopping",
+        "twitch",
+        "twitter",
+        "video",
+        "wikipedia",
+        "youtube",
+    ]
+)
+CONTRIBUTION_DOMAINS = (
+    "buymeacoffee.com",
+    "donate.mozilla.org",
+    "flattr.com",
+    "github.com",
+    "ko-fi.com",
+    "liberapay.com",
+    "www.micropayment.de",
+    "opencollective.com",
+    "www.patreon.com",
+    "www.paypal.com",
+    "paypal.me",
+)
+# {license slug: the addon types it can be used for}
+_EXTENSION_TYPES = ("extension", "language", "dictionary")
+LICENSES = {
+    "all-rights-reserved": (*_EXTENSION_TYPES, "statictheme"),
+    **{
+        slug: _EXTENSION_TYPES
+        for slug in (
+            "MPL-2.0",
+            "Apache-2.0",
+            "GPL-2.0-or-later",
+            "GPL-3.0-or-later",
+            "LGPL-2.1-or-later",
+            "LGPL-3.0-or-later",
+            "AGPL-3.0-or-later",
+            "MIT",
+            "ISC",
+            "BSD-2-Clause",
+            "Unlicense",
+        )
+    },
+    **{
+        slug: ("statictheme",)
+        for slug in (
+            "CC-BY-3.0",
+            "CC-BY-NC-3.0",
+            "CC-BY-NC-ND-3.0",
+            "CC-BY-NC-SA-3.0",
+            "CC-BY-ND-3.0",
+            "CC-BY-SA-3.0",
+        )
+    },
+}
+# the min version set for apps sent as a list, and the latest major version known
+DEFAULT_MIN_VERSIONS = {"firefox": "58.0", "android": "120.0"}
+LATEST_APP_VERSION = 150
+RESERVED_GUID_SUFFIXES = (
+    "@mozilla.com",
+    "@mozilla.org",
+    "@pioneer.mozilla.org",
+    "@search.mozilla.org",
+    "@shield.mozilla.com",
+    "@shield.mozilla.org",
+    "@mozillaonline.com",
+    "@mozillafoundation.org",
+    "@rally.mozilla.org",
+    "@temporary-addon",
+    "@mozac.org",
+)
+TYPE_NAMES = {
+    "extension": "Extension",
+    "statictheme": "Theme",
+    "language": "Language Pack",
+    "dictionary": "Dictionary",
+}
+ROLES = ("owner", "developer")
+ICON_SIZES = (32, 64, 128)
+DEFAULT_ICONS = "/static-server/img/addon-icons"
+
+NOT_FOUND = "Not found."
+NO_PERMISSION = "You do not have permission to perform this action."
+NOT_NULL = "This field may not be null."
+NOT_BLANK = "This field may not be blank."
+REQUIRED = "This field is required."
+REQUIRED_FOR_LISTED = "This field is required for add-ons with listed versions."
+NEEDS_OWNER = "Add-ons need at least one owner."
+NEEDS_LISTED_AUTHOR = "Add-ons need at least one listed author."
+TRADEMARK = "Add-on names cannot contain the Mozilla or Firefox trademarks."
+INVALID_IMAGE = (
+    "Upload a valid image. The file you uploaded was either not an image or a "
+    "corrupted image."
+)
+
+
+class ApiError(Exception):
+    """Ends the handling of a call with an error response"""
+
+    def __init__(self, status, body):
+        super().__init__(status, body)
+        self.status = status
+        self.body = body if isinstance(body, dict) else {"detail": body}
+
+
+def _type_name(value):
+    return type(value).__name__
+
+
+def _as_text(value):
+    """Strings and numbers are accepted for text fields, like DRF does"""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return None
+    return str(value)
+
+
+def _translation_errors(value, check=None):
+    """Returns the messages for a translated field, sent as {locale: value}; a
+    None value removes the translation. 'check' returns the message for a single
+    translation, if any"""
+    if not isinstance(value, dict):
+        return ["You must provide an object of {lang-code:value}."]
+    messages = []
+    for locale, translation in value.items():
+        if locale not in LOCALES:
+            messages.append(f'The language code "{locale}" is invalid.')
+            continue
+        if translation is None:
+            continue
+        text = _as_text(translation)
+        if text is None:
+            messages.append("Not a valid string.")
+        elif not text.strip():
+            messages.append(NOT_BLANK)
+        elif check is not None and check(text):
+            messages.append(check(text))
+    return messages
+
+
+def _merged(current, value):
+    """Applies the translations sent to the current ones; None if none are left"""
+    merged = dict(current or {})
+    for locale, translation in value.items():
+        if translation is None:
+            merged.pop(locale, None)
+        else:
+            merged[locale] = _as_text(translation)
+    return merged or None
+
+
+def _email_error(text):
+    if not re.fullmatch(r"[^@\s]+@[^@\s]+\.[A-Za-z]{2,}", text):
+        return "Enter a valid email address."
+    return None
+
+
+def _summary_error(text):
+    if len(text) > 250:
+        return "Ensure this field has no more than 250 characters."
+    return None
+
+
+def _boolean_errors(value):
+    if value is None:
+        return [NOT_NULL]
+    if not isinstance(value, bool):
+        return ["Must be a valid boolean."]
+    return []
+
+
+def _category_errors(value, addon_type):
+    if value is None:
+        return [NOT_NULL]
+    if isinstance(value, dict):
+        apps = value.items()
+    elif isinstance(value, list):
+        apps = [("firefox", value)]
+    else:
+        return [f'Expected a list of items but got type "{_type_name(value)}".']
+    for app, slugs in apps:
+        valid = CATEGORIES.get(addon_type, frozenset())
+        if app == "android" and addon_type == "extension":
+            valid = ANDROID_CATEGORIES
+        if not isinstance(slugs, list) or app not in ("firefox", "android"):
+            return ["Invalid category name."]
+        if any(not isinstance(slug, str) or slug not in valid for slug in slugs):
+            return ["Invalid category name."]
+        if "other" in slugs and len(slugs) > 1:
+            return ['The "other" category cannot be combined with another category.']
+    return []
+
+
+def _tag_errors(value):
+    if value is None:
+        return [NOT_NULL]
+    if not isinstance(value, list):
+        return [f'Expected a list of items but got type "{_type_name(value)}".']
+    return [f'"{tag}" is not a valid choice.' for tag in value if tag not in TAGS]
+
+
+def _contributions_errors(value):
+    if value is None:
+        return [NOT_NULL]
+    text = _as_text(value)
+    if not text:
+        return [NOT_BLANK if text == "" else "Not a valid string."]
+    messages = []
+    if not text.startswith("https://"):
+        messages.append("URLs must start with https://.")
+    if urlsplit(text).netloc not in CONTRIBUTION_DOMAINS:
+        domains = ", ".join(CONTRIBUTION_DOMAINS)
+        messages.append(f"URL domain must be one of [{domains}].")
+    return messages
+
+
+def _known_app_version(value, bound):
+    """'bound' is 'min' or 'max'; only max versions can be '*' or 'N.*'"""
+    if bound == "max" and value == "*":
+        return True
+    match = isinstance(value, str) and re.fullmatch(r"(\d+)\.(\d+(?:a1)?|\*)", value)
+    if not match or (bound == "min" and match.group(2) == "*"):
+        return False
+    return int(match.group(1)) <= LATEST_APP_VERSION
+
+
+def _compatibility(value):
+    """Returns the {app: {'min': ..., 'max': ...}} compatibility sent as a list of
+    apps or a dictionary, and the error message if it is invalid"""
+    if isinstance(value, list):
+        if not value or any(app not in DEFAULT_MIN_VERSIONS for app in value):
+            return None, "Invalid app specified"
+        return {
+            app: {"min": DEFAULT_MIN_VERSIONS[app], "max": "*"} for app in value
+        }, None
+    if not isinstance(value, dict) or not value:
+        return None, "Invalid value"
+    compatibility = {}
+    for app, versions in value.items():
+        if app not in DEFAULT_MIN_VERSIONS:
+            return None, "Invalid app specified"
+        if not isinstance(versions, dict):
+            return None, "Invalid value"
+        versions = {"min": DEFAULT_MIN_VERSIONS[app], "max": "*", **versions}
+        for bound in ("min", "max"):
+            if not _known_app_version(versions[bound], bound):
+                return None, f"Unknown {bound} app version specified"
+        compatibility[app] = {"min": versions["min"], "max": versions["max"]}
+    return compatibility, None
+
+
+def _png_chunks(content):
+    """Returns the {type: data} chunks of a PNG image, or None if it is corrupt"""
+    chunks = {}
+    position = 8
+    while position + 8 <= len(content):
+        length, kind = struct.unpack(">I4s", content[position : position + 8])
+        chunks.setdefault(kind, content[position + 8 : position + 8 + length])
+        position += length + 12
+        if kind == b"IEND":
+            return chunks if b"IHDR" in chunks else None
+    return None
+
+
+def _jpeg_size(content):
+    """Returns the (width, height) of a JPEG image, or None if it is corrupt"""
+    position = 2
+    while position + 9 <= len(content):
+        if content[position] != 0xFF:
+            return None
+        marker = content[position + 1]
+        if marker == 0xFF:
+            position += 1
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", content[position + 5 : position + 9])
+            return width, height
+        (length,) = struct.unpack(">H", content[position + 2 : position + 4])
+        position += length + 2
+    return None
+
+
+def _image_error(content, square=False):
+    """Returns the message for an invalid icon or preview image, if any; images
+    are recognized from their signature and only their header is read"""
+    if content.startswith(b"\x89PNG\r\n\x1a\n"):
+        chunks = _png_chunks(content)
+        if chunks is None:
+            return INVALID_IMAGE
+        if b"acTL" in chunks:
+            return "Images cannot be animated."
+        size = struct.unpack(">II", chunks[b"IHDR"][:8])
+    elif content.startswith(b"\xff\xd8\xff"):
+        size = _jpeg_size(content)
+        if size is None:
+            return INVALID_IMAGE
+    elif content[:6] in (b"GIF87a", b"GIF89a") or content[:2] == b"BM":
+        return "Images must be either PNG or JPG."
+    elif content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        return "Images must be either PNG or JPG."
+    else:
+        return INVALID_IMAGE
+    if square and size[0] != size[1]:
+        return "Images must be square (same width and height)."
+    return None
+
+
+def _valid_guid(guid):
+    return isinstance(guid, str) and bool(
+        re.fullmatch(r"\{[0-9a-fA-F-]{36}\}|[\w.-]*@[\w.-]+", guid)
+    )
+
+
+def _localized(archive, manifest):
+    """Returns the default locale and the name and summary translations of an
+    addon; '__MSG_<key>__' values are read from the messages of every locale"""
+    default_locale = str(manifest.get("default_locale", "en-US")).replace("_", "-")
+    messages = {}
+    for path in archive.namelist():
+        match = re.fullmatch(r"_locales/([^/]+)/messages\.json", path)
+        if match is None:
+            continue
+        try:
+            messages[match.group(1).replace("_", "-")] = json.loads(archive.read(path))
+        except ValueError:
+            pass
+    translations = {}
+    for field, key in (("name", "name"), ("summary", "description")):
+        value = manifest.get(key)
+        if not isinstance(value, str):
+            continue
+        match = re.fullmatch(r"__MSG_(\w+)__", value)
+        if match is None:
+            translations[field] = {default_locale: value}
+            continue
+        translations[field] = {
+            locale: entries[match.group(1)]["message"]
+            for locale, entries in messages.items()
+            if match.group(1) in entries
+        }
+    return default_locale, translations
+
+
+def _validate(filename, content):
+    """Returns (manifest, details, messages) for an uploaded addon file; 'details'
+    are the localized name and summary and whether the file is signed by Mozilla"""
+    if not filename.lower().endswith(UPLOAD_EXTENSIONS):
+        message = (
+            "Unsupported file type, please upload a supported file (.crx, .xpi, .zip)."
+        )
+        return None, {}, [{"message": message}]
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(content))
+    except zipfile.BadZipFile:
+        return None, {}, [{"message": "Invalid or corrupt add-on file."}]
+    with archive:
+        if "manifest.json" not in archive.namelist():
+            message = "No manifest.json was found at the root of the extension."
+            return None, {}, [{"message": message}]
+        try:
+            manifest = json.loads(archive.read("manifest.json"))
+        except ValueError:
+            return None, {}, [{"message": "Your JSON file could not be parsed."}]
+        if not isinstance(manifest, dict):
+            return None, {}, [{"message": "Your JSON file could not be parsed."}]
+        default_locale, translations = _localized(archive, manifest)
+        details = {
+            "default_locale": default_locale,
+            "translations": translations,
+            "mozilla_signed": "META-INF/mozilla.rsa" in archive.namelist(),
+        }
+    messages = [
+        {"message": f"must have required property '{field}'", "instancePath": ""}
+        for field in ("manifest_version", "version", "name")
+        if field not in manifest
+    ]
+    version = manifest.get("version")
+    if "version" in manifest and not re.fullmatch(
+        r"\d+(\.\d+[a-z0-9]*)*", str(version)
+    ):
+        messages.append(
+            {
+                "message": "The version string should be simplified.",
+                "instancePath": "/version",
+            }
+        )
+    key = (
+        "browser_specific_settings"
+        if "browser_specific_settings" in manifest
+        else "applications"
+    )
+    guid = _guid(manifest)
+    if guid is not None and not _valid_guid(guid):
+        messages.append(
+            {
+                "message": "must match the format of add-on IDs",
+                "instancePath": f"/{key}/gecko/id",
+            }
+        )
+    return manifest, details, messages
+
+
+def _addon_type(manifest):
+    if "theme" in manifest:
+        return "statictheme"
+    if "langpack_id" in manifest:
+        return "language"
+    if "dictionaries" in manifest:
+        return "dictionary"
+    return "extension"
+
+
+def _guid(manifest):
+    settings = manifest.get("browser_specific_settings") or manifest.get("applications")
+    if not isinstance(settings, dict) or not isinstance(settings.get("gecko"), dict):
+        return None
+    return settings["gecko"].get("id")
+
+
+def _parse_body(headers, body):
+    """Returns the fields of a JSON, multipart or url encoded request body; files
+    sent in a multipart body are returned as (filename, content) pairs"""
+    content_type = headers.get("Content-Type", "")
+    if not body:
+        return {}
+    if content_type.startswith("application/json"):
+        try:
+            data = json.loads(body)
+        except ValueError as error:
+            raise ApiError(400, f"JSON parse error - {error}")
+        if not isinstance(data, dict):
+            message = (
+                f"Invalid data. Expected a dictionary, but got {_type_name(data)}."
+            )
+            raise ApiError(400, {"non_field_errors": [message]})
+        return data
+    if content_type.startswith("multipart/form-data"):
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        fields = {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            content = part.get_payload(decode=True)
+            filename = part.get_filename()
+            fields[name] = (filename, content) if filename else content.decode()
+        return fields
+    return {key: values[-1] for key, values in parse_qs(body.decode()).items()}
+
+
+def _json(content):
+    """Renders responses like DRF does: compact and not escaped to ASCII"""
+    if isinstance(content, bytes):
+        return content
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        status, content, content_type = self.server.respond(
+            self.command, unquote(parts.path), query, self.headers, body
+        )
+        content = _json(content)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AmoStandIn(http.server.ThreadingHTTPServer):
+    """The stand-in server and its in-memory store; 'validation_latency' is the
+    number of seconds after which an upload is reported as processed"""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, validation_latency=0):
+        super().__init__((host, port), _Handler)
+        self.url = f"http://{host}:{self.server_address[1]}"
+        self.validation_latency = validation_latency
+        self.users = {}
+        self.revoked = set()
+        self.uploads = {}
+        self.addons = {}
+        # guids of deleted addons, which can't be used again
+        self.deleted_guids = set()
+        self.abuse_reports = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        # (methods, path pattern, handler); the first pattern matching the path and
+        # the method is used; the trailing slash of the patterns is optional
+        addon = r"/addons/addon/(?P<addon>[^/]+)"
+        self.routes = [
+            ("POST", r"/addons/upload/", self.create_upload),
+            ("GET", r"/addons/upload/(?P<uuid>[^/]+)/", self.get_upload),
+            ("POST", r"/addons/addon/", self.create_addon),
+            ("GET", rf"{addon}/", self.get_addon),
+            ("PATCH", rf"{addon}/", self.edit_addon),
+            ("PUT", r"/addons/addon/(?P<guid>[^/]+)/", self.put_addon),
+            ("DELETE", rf"{addon}/", self.delete_addon),
+            ("GET", rf"{addon}/delete_confirm/", self.delete_token),
+            ("GET", rf"{addon}/versions/", self.list_versions),
+            ("POST", rf"{addon}/versions/", self.create_version),
+            ("GET", rf"{addon}/versions/(?P<version>\d+)/", self.get_version),
+            ("PATCH", rf"{addon}/versions/(?P<version>\d+)/", self.edit_version),
+            ("GET", rf"{addon}/authors/", self.list_authors),
+            ("GET|PATCH|DELETE", rf"{addon}/authors/(?P<user_id>\d+)/", self.author),
+            (
+                "POST",
+                rf"{addon}/pending-authors/(?P<answer>confirm|decline)/",
+                self.answer_invite,
+            ),
+            ("GET", rf"{addon}/pending-authors/", self.list_pending_authors),
+            ("POST", rf"{addon}/pending-authors/", self.invite),
+            (
+                "GET|PATCH|DELETE",
+                rf"{addon}/pending-authors/(?P<user_id>\d+)/",
+                self.pending_author,
+            ),
+            ("POST", rf"{addon}/previews/", self.add_preview),
+            ("PATCH|DELETE", rf"{addon}/previews/(?P<preview>\d+)/", self.preview),
+            ("GET", r"/accounts/profile/", self.get_profile),
+            ("DELETE", r"/accounts/session/", self.delete_session),
+            ("POST", r"/abuse/report/addon/", self.report_addon),
+        ]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def add_user(
+        self, username, user_id=None, name=None, permissions=(), restricted=False
+    ):
+        """Registers an account; accounts are also created for the sessions used.
+        'name' is the display name (the username by default, '' for none), and
+        'restricted' accounts have an email that is not allowed for submissions"""
+        with self._lock:
+            account = self._account(username, user_id)
+            account.update(
+                name=username if name is None else name,
+                permissions=set(permissions),
+                restricted=restricted,
+            )
+            return account
+
+    def seed(self, variables):
+        """Recreates the accounts and addons of the environment that the tests refer
+        to: the ids of the test accounts, the addons owned by other developers, and an
+        approved addon of 'api_user' with sources"""
+        if "api_addon_author_owner" in variables:
+            self.add_user(
+                "api_user",
+                variables["api_addon_author_owner"],
+                permissions={"langpack"},
+            )
+        if "api_post_valid_author" in variables:
+            self.add_user(
+                "staff_user",
+                variables["api_post_valid_author"],
+                permissions={
+                    "langpack",
+                    "mozilla_signed",
+                    "reserved_guid",
+                    "trademark",
+                },
+            )
+        if "api_post_author_no_display_name" in variables:
+            user_id = variables["api_post_author_no_display_name"]
+            self.add_user(f"user{user_id}", user_id, name="")
+        if "api_post_author_no_dev_agreement" in variables:
+            user_id = variables["api_post_author_no_dev_agreement"]
+            self.add_user(f"user{user_id}", user_id, restricted=True)
+        with self._lock:
+            other = self._account("stand-in-developer")["id"]
+            owner = self.users.get("api_user", {}).get("id", other)
+            if "staff_user_addon" in variables:
+                staff_user = self.users.get("staff_user", {}).get("id", other)
+                self._seed_addon(variables["staff_user_addon"], staff_user)
+            if "detail_extension_slug" in variables:
+                self._seed_addon(variables["detail_extension_slug"], other)
+            if "duplicate_guid" in variables:
+                guid = variables["duplicate_guid"]
+                self._seed_addon(f"addon-{next(self._ids)}", other, guid)
+            if "approved_addon_with_sources" in variables:
+                addon = self._seed_addon(
+                    variables["approved_addon_with_sources"], owner
+                )
+                version = addon["versions"][0]
+                version["file"]["status"] = "public"
+                version["source_file"] = b"sources of the approved version"
+                version["source"] = self._source_url(version)
+
+    def _seed_addon(self, slug, owner, guid=None):
+        addon = self._addon_record(
+            guid or f"{slug}@stand-in",
+            "extension",
+            "en-US",
+            {"name": {"en-US": slug}, "summary": {"en-US": f"Summary of {slug}"}},
+        )
+        addon.update(slug=slug, status="public", categories=["other"])
+        addon["authors"][owner] = {"role": "owner", "listed": True, "position": 0}
+        upload = {"manifest": {"version": "1.0"}, "channel": "listed", "size": 0}
+        self._add_version(addon, upload, {"license": "all-rights-reserved"})
+        self.addons[addon["id"]] = addon
+        return addon
+
+    # request handling
+    def respond(self, method, path, query, headers, body):
+        """Returns the (status, content, content type) of the response to a call;
+        unexpected errors are answered with a 500 error, like AMO would"""
+        try:
+            return self._respond(method, path, query, headers, body)
+        except Exception as error:
+            detail = f"Stand-in error: {error!r}"
+            return 500, {"detail": detail}, "application/json"
+
+    def _respond(self, method, path, query, headers, body):
+        match = re.fullmatch(r"/firefox/downloads/source/(\d+)", path)
+        if method == "GET" and match:
+            return self._download_source(int(match.group(1)))
+        match = re.fullmatch(r"/[^/]+/developers/addon/([^/]+)/edit/?", path)
+        if method == "GET" and match:
+            return self._edit_page(match.group(1))
+        if not path.startswith(API_PREFIX):
+            return 404, {"detail": NOT_FOUND}, "application/json"
+        path = path[len(API_PREFIX) :]
+        allowed = False
+        for methods, pattern, handler in self.routes:
+            match = re.fullmatch(f"{pattern}?", path)
+            if match is None:
+                continue
+            allowed = True
+            if method not in methods.split("|"):
+                continue
+            try:
+                with self._lock:
+                    user = self._session_user(headers)
+                    data = _parse_body(headers, body)
+                    status, content = handler(
+                        user=user,
+                        data=data,
+                        query=query,
+                        method=method,
+                        **match.groupdict(),
+                    )
+            except ApiError as error:
+                status, content = error.status, error.body
+            return status, content, "application/json"
+        if allowed:
+            detail = f'Method "{method}" not allowed.'
+            return 405, {"detail": detail}, "application/json"
+        return 404, {"detail": NOT_FOUND}, "application/json"
+
+    def _account(self, username, user_id=None):
+        if username not in self.users:
+            self.users[username] = {
+                "id": user_id or next(self._ids),
+                "name": username,
+                "username": username,
+                "email": f"{username}@stand-in.test",
+                "permissions": set(),
+                "restricted": False,
+            }
+        return self.users[username]
+
+    def _account_by_id(self, user_id):
+        for account in self.users.values():
+            if account["id"] == user_id:
+                return account
+        if user_id not in ACCOUNT_IDS:
+            return None
+        return self._account(f"user{user_id}", user_id)
+
+    def _session_user(self, headers):
+        authorization = headers.get("Authorization")
+        if not authorization:
+            return None
+        token = authorization.split(" ", 1)[-1]
+        if token in self.revoked or not token.startswith(SESSION_PREFIX):
+            raise ApiError(
+                401,
+                {
+                    "detail": "Valid user session not found matching the provided "
+                    "session key.",
+                    "code": "ERROR_AUTHENTICATION_EXPIRED",
+                },
+            )
+        user = self._account(token[len(SESSION_PREFIX) :])
+        return {**user, "token": token}
+
+    @staticmethod
+    def _require_user(user):
+        if user is None:
+            raise ApiError(401, "Authentication credentials were not provided.")
+        return user
+
+    def _addon(self, key):
+        """Finds an addon by id, slug or guid"""
+        for addon in self.addons.values():
+            if key in (str(addon["id"]), addon["slug"], addon["guid"]):
+                return addon
+        raise ApiError(404, NOT_FOUND)
+
+    def _owned_addon(self, key, user, owner=False):
+        """Finds an addon the user is an author of; 'owner' requires the owner role"""
+        addon = self._addon(key)
+        author = addon["authors"].get(self._require_user(user)["id"])
+        if author is None or (owner and author["role"] != "owner"):
+            raise ApiError(403, NO_PERMISSION)
+        return addon
+
+    def _version(self, addon, version_id):
+        for version in addon["versions"]:
+            if version["id"] == int(version_id):
+                return version
+        raise ApiError(404, NOT_FOUND)
+
+    # uploads
+    def create_upload(self, user, data, **kwargs):
+        self._require_user(user)
+        if not isinstance(data.get("upload"), tuple):
+            raise ApiError(400, {"upload": ["No file was submitted."]})
+        filename, content = data["upload"]
+        manifest, details, messages = _validate(filename, content)
+        upload = {
+            "uuid": uuid.uuid4().hex,
+            "channel": data.get("channel", "listed"),
+            "user": user["id"],
+            "manifest": manifest,
+            "details": details,
+            "messages": messages,
+            "size": len(content),
+            "created": time.monotonic(),
+            "used": False,
+        }
+        self.uploads[upload["uuid"]] = upload
+        return 201, self._upload_json(upload)
+
+    def _upload_json(self, upload):
+        processed = time.monotonic() - upload["created"] >= self.validation_latency
+        errors = len(upload["messages"])
+        return {
+            "uuid": upload["uuid"],
+            "channel": upload["channel"],
+            "processed": processed,
+            "submitted": upload["used"],
+            "url": f"{self.url}{API_PREFIX}/addons/upload/{upload['uuid']}/",
+            "valid": processed and not errors,
+            "validation": (
+                {
+                    "errors": errors,
+                    "warnings": 0,
+                    "notices": 0,
+                    "messages": [
+                        {"type": "error", "tier": 1, **message}
+                        for message in upload["messages"]
+                    ],
+                }
+                if processed
+                else None
+            ),
+            "version": (upload["manifest"] or {}).get("version"),
+        }
+
+    def get_upload(self, user, uuid, **kwargs):
+        upload = self.uploads.get(uuid)
+        if upload is None or upload["user"] != self._require_user(user)["id"]:
+            raise ApiError(404, NOT_FOUND)
+        return 200, self._upload_json(upload)
+
+    def _use_upload(self, user, value):
+        """Returns the upload with the given uuid, if it can be turned into a version;
+        errors are raised for the 'upload' field"""
+        if value is None or value == "":
+            raise ApiError(400, {"upload": [NOT_NULL]})
+        upload = None
+        if isinstance(value, str):
+            try:
+                upload = self.uploads.get(uuid.UUID(value).hex)
+            except ValueError:
+                raise ApiError(400, {"upload": [f"“{value}” is not a valid UUID."]})
+        elif not isinstance(value, int) or isinstance(value, bool):
+            raise ApiError(400, {"upload": [f"“{value}” is not a valid UUID."]})
+        if upload is None or upload["user"] != user["id"]:
+            raise ApiError(
+                400, {"upload": [f"Object with uuid={value} does not exist."]}
+            )
+        if not self._upload_json(upload)["valid"]:
+            raise ApiError(
+                400, {"upload": ["Upload is not valid, or has not been processed yet."]}
+            )
+        if upload["used"]:
+            raise ApiError(400, {"upload": ["Upload already used."]})
+        return upload
+
+    # addons
+    def _addon_json(self, addon):
+        def latest(channel):
+            versions = [
+                version
+                for version in addon["versions"]
+                if version["channel"] == channel and not version["is_disabled"]
+            ]
+            return self._version_json(versions[-1]) if versions else None
+
+        homepage = addon["homepage"]
+        support_url = addon["support_url"]
+        contributions = addon["contributions_url"]
+        return {
+            "id": addon["id"],
+            "guid": addon["guid"],
+            "slug": addon["slug"],
+            "type": addon["type"],
+            "status": addon["status"],
+            "default_locale": addon["default_locale"],
+            "categories": addon["categories"],
+            "name": addon["name"],
+            "summary": addon["summary"],
+            "description": addon["description"],
+            "developer_comments": addon["developer_comments"],
+            "homepage": {"url": homepage, "outgoing": homepage} if homepage else None,
+            "support_email": addon["support_email"],
+            "support_url": (
+                {"url": support_url, "outgoing": support_url} if support_url else None
+            ),
+            "is_experimental": addon["is_experimental"],
+            "requires_payment": addon["requires_payment"],
+            "contributions_url": (
+                {
+                    "url": f"{contributions}{CONTRIBUTIONS_QUERY}",
+                    "outgoing": f"{contributions}{CONTRIBUTIONS_QUERY}",
+                }
+                if contributions
+                else ""
+            ),
+            "tags": addon["tags"],
+            "icons": addon["icons"],
+            "authors": [
+                self._author_json(user_id, author)
+                for user_id, author in self._sorted_authors(addon["authors"])
+            ],
+            "previews": addon["previews"],
+            "current_version": latest("listed"),
+            "latest_unlisted_version": latest("unlisted"),
+            "created": addon["created"],
+            "url": f"{self.url}/en-US/firefox/addon/{addon['slug']}/",
+            "edit_url": f"{self.url}/en-US/developers/addon/{addon['slug']}/edit",
+        }
+
+    def _slug_errors(self, slug, addon=None):
+        # slugs can be sent as numbers, which then only have digits
+        text = _as_text(slug)
+        if text is not None and text.isdigit():
+            return ["This slug cannot be used. Please choose another."]
+        if text is None or not re.fullmatch(r"[-\w]*[^\W_][-\w]*", text):
+            return [
+                "Enter a valid “slug” consisting of letters, numbers, underscores "
+                "or hyphens."
+            ]
+        for other in self.addons.values():
+            if other["slug"] == text and other is not addon:
+                return ["addon with this slug already exists."]
+        return []
+
+    def _name_error(self, text, user):
+        if not any(character.isalnum() for character in text):
+            return "Ensure this field contains at least one letter or number character."
+        if len(text) > 50:
+            return "Ensure this field has no more than 50 characters."
+        if re.search("mozilla|firefox", text, re.I) and "trademark" not in (
+            user["permissions"]
+        ):
+            return TRADEMARK
+        return None
+
+    def _url_error(self, text):
+        if not re.fullmatch(
+            r"https?://(localhost|\d{1,3}(\.\d{1,3}){3}|([\w-]+\.)+[a-z]{2,})"
+            r"(:\d+)?([/?#]\S*)?",
+            text,
+            re.I,
+        ):
+            return "Enter a valid URL."
+        if urlsplit(text).netloc == urlsplit(self.url).netloc:
+            return (
+                "This field can only be used to link to external websites. "
+                f"URLs on {self.url} are not allowed."
+            )
+        return None
+
+    def _detail_changes(self, addon, data, user, merge=True):
+        """Returns the addon fields changed by the details sent and raises the errors
+        of all the fields at once, before anything is changed; translations are
+        merged with the current ones, unless 'merge' is False"""
+        errors = {}
+        changes = {}
+        if "default_locale" in data:
+            locale = data["default_locale"]
+            if locale is None:
+                errors["default_locale"] = [NOT_NULL]
+            elif not isinstance(locale, str) or locale not in LOCALES:
+                errors["default_locale"] = [f'"{locale}" is not a valid choice.']
+            else:
+                changes["default_locale"] = locale
+        if "slug" in data:
+            errors["slug"] = self._slug_errors(data["slug"], addon)
+            changes["slug"] = _as_text(data["slug"])
+        if "categories" in data:
+            errors["categories"] = _category_errors(data["categories"], addon["type"])
+            categories = data["categories"]
+            if isinstance(categories, dict):
+                categories = categories.get("firefox", [])
+            changes["categories"] = categories
+        checks = {
+            "name": lambda text: self._name_error(text, user),
+            "summary": _summary_error,
+            "homepage": self._url_error,
+            "support_url": self._url_error,
+            "support_email": _email_error,
+        }
+        for field in TRANSLATED_FIELDS:
+            if field in data:
+                errors[field] = _translation_errors(data[field], checks.get(field))
+                if not errors[field]:
+                    current = addon[field] if merge else None
+                    changes[field] = _merged(current, data[field])
+        for field in ("is_experimental", "requires_payment"):
+            if field in data:
+                errors[field] = _boolean_errors(data[field])
+                changes[field] = data[field]
+        if "contributions_url" in data:
+            errors["contributions_url"] = _contributions_errors(
+                data["contributions_url"]
+            )
+            changes["contributions_url"] = data["contributions_url"]
+        if "tags" in data:
+            errors["tags"] = _tag_errors(data["tags"])
+            changes["tags"] = data["tags"]
+        if isinstance(data.get("icon"), tuple):
+            message = _image_error(data["icon"][1], square=True)
+            errors["icon"] = [message] if message else []
+            changes["icons"] = {
+                str(size): f"{self.url}/user-media/addon_icons/{addon['id']}-{size}.png"
+                for size in ICON_SIZES
+            }
+        errors = {field: messages for field, messages in errors.items() if messages}
+        if errors:
+            raise ApiError(400, errors)
+        # the default locale needs a value in the fields having translations
+        locale = changes.get("default_locale", addon["default_locale"])
+        for field in TRANSLATED_FIELDS:
+            value = changes.get(field, addon[field])
+            if (value or field == "name") and locale not in (value or {}):
+                message = f'A value in the default locale of "{locale}" is required'
+                if field in REQUIRED_TRANSLATED_FIELDS:
+                    errors[field] = [f"{message}."]
+                else:
+                    errors[field] = [f"{message} if other translations are set."]
+        if errors:
+            raise ApiError(400, errors)
+        return changes
+
+    def _addon_record(self, guid, addon_type, default_locale, translations):
+        addon_id = next(self._ids)
+        return {
+            "id": addon_id,
+            "guid": guid,
+            "slug": f"addon-{addon_id}",
+            "type": addon_type,
+            "status": "incomplete",
+            "default_locale": default_locale,
+            "categories": [],
+            "name": translations.get("name"),
+            "summary": translations.get("summary"),
+            "description": None,
+            "developer_comments": None,
+            "homepage": None,
+            "support_email": None,
+            "support_url": None,
+            "is_experimental": False,
+            "requires_payment": False,
+            "contributions_url": "",
+            "tags": [],
+            "icons": {
+                str(size): f"{self.url}{DEFAULT_ICONS}/default-{size}.png"
+                for size in ICON_SIZES
+            },
+            "authors": {},
+            "pending_authors": {},
+            "previews": [],
+            "versions": [],
+            "delete_tokens": set(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+
+    def _check_guid(self, guid, user):
+        reserved = guid.endswith(RESERVED_GUID_SUFFIXES)
+        if reserved and "reserved_guid" not in user["permissions"]:
+            message = "You cannot submit an add-on using an ID ending with this suffix."
+            raise ApiError(400, {"version": {"upload": [message]}})
+        in_use = any(addon["guid"] == guid for addon in self.addons.values())
+        if in_use or guid in self.deleted_guids:
+            raise ApiError(409, {"version": ["Duplicate add-on ID found."]})
+
+    def _check_submission(self, upload, user):
+        """Checks that the user is allowed to submit the addon of the upload"""
+        message = None
+        addon_type = _addon_type(upload["manifest"])
+        if addon_type == "language" and "langpack" not in user["permissions"]:
+            message = "You cannot submit a language pack"
+        signed = upload["details"]["mozilla_signed"]
+        if signed and "mozilla_signed" not in user["permissions"]:
+            message = "You cannot submit a Mozilla Signed Extension"
+        if message:
+            raise ApiError(400, {"version": {"upload": [message]}})
+
+    def _new_addon(self, user, data, guid=None):
+        version_data = data.get("version")
+        if not isinstance(version_data, dict):
+            message = f"Invalid data. Expected a dictionary, but got {_type_name(version_data)}."
+            raise ApiError(400, {"version": {"non_field_errors": [message]}})
+        try:
+            upload = self._use_upload(user, version_data.get("upload"))
+        except ApiError as error:
+            raise ApiError(error.status, {"version": error.body})
+        manifest = upload["manifest"]
+        if guid is not None:
+            if _guid(manifest) is None:
+                message = "A GUID must be specified in the manifest."
+                raise ApiError(400, {"version": {"upload": [message]}})
+            if _guid(manifest) != guid:
+                message = "GUID mismatch between the URL and manifest."
+                raise ApiError(400, {"version": {"upload": [message]}})
+        guid = guid or _guid(manifest) or f"{{{uuid.uuid4()}}}"
+        self._check_guid(guid, user)
+        self._check_submission(upload, user)
+        details = upload["details"]
+        addon = self._addon_record(
+            guid,
+            _addon_type(manifest),
+            details["default_locale"],
+            details["translations"],
+        )
+        name = details["translations"].get("name") or {}
+        if "name" not in data and any(
+            self._name_error(text, user) == TRADEMARK for text in name.values()
+        ):
+            raise ApiError(400, {"name": [TRADEMARK]})
+        changes = self._detail_changes(addon, data, user, merge=False)
+        version_changes = self._version_changes(addon, version_data)
+        if upload["channel"] == "listed":
+            listed = {**addon, **changes}
+            missing = [
+                field for field in ("categories", "summary") if not listed[field]
+            ]
+            if "license" not in version_changes:
+                missing.append("license")
+            if missing:
+                raise ApiError(400, {field: [REQUIRED_FOR_LISTED] for field in missing})
+            changes["status"] = "nominated"
+        addon.update(changes)
+        addon["authors"][user["id"]] = {"role": "owner", "listed": True, "position": 0}
+        self._add_version(addon, upload, version_data)
+        self.addons[addon["id"]] = addon
+        return addon
+
+    def create_addon(self, user, data, **kwargs):
+        addon = self._new_addon(self._require_user(user), data)
+        return 201, self._addon_json(addon)
+
+    def get_addon(self, user, addon, **kwargs):
+        return 200, self._addon_json(self._addon(addon))
+
+    def edit_addon(self, user, addon, data, **kwargs):
+        addon = self._owned_addon(addon, user)
+        addon.update(self._detail_changes(addon, data, user))
+        return 200, self._addon_json(addon)
+
+    def put_addon(self, user, guid, data, **kwargs):
+        """Creates the addon with the guid or adds the version to it"""
+        user = self._require_user(user)
+        if not _valid_guid(guid):
+            raise ApiError(404, NOT_FOUND)
+        try:
+            addon = self._owned_addon(guid, user)
+        except ApiError as error:
+            if error.status != 404:
+                raise
+            return 201, self._addon_json(self._new_addon(user, data, guid))
+        details = {key: value for key, value in data.items() if key != "version"}
+        changes = self._detail_changes(addon, details, user)
+        version_data = data.get("version") or {}
+        try:
+            upload = self._use_upload(user, version_data.get("upload"))
+        except ApiError as error:
+            raise ApiError(error.status, {"version": error.body})
+        self._add_version(addon, upload, version_data)
+        addon.update(changes)
+        return 200, self._addon_json(addon)
+
+    def delete_token(self, user, addon, **kwargs):
+        addon = self._owned_addon(addon, user, owner=True)
+        token = secrets.token_urlsafe(16)
+        addon["delete_tokens"].add(token)
+        return 200, {"delete_confirm": token}
+
+    def delete_addon(self, user, addon, query, **kwargs):
+        addon = self._owned_addon(addon, user, owner=True)
+        token = query.get("delete_confirm")
+        if not token:
+            raise ApiError(
+                400, "Delete confirmation token must be supplied for add-on delete."
+            )
+        if token not in addon["delete_tokens"]:
+            raise ApiError(400, "Delete confirmation token is invalid.")
+        del self.addons[addon["id"]]
+        self.deleted_guids.add(addon["guid"])
+        return 204, b""
+
+    def _edit_page(self, key):
+        with self._lock:
+            try:
+                addon = self._addon(key)
+            except ApiError:
+                return 404, b"", "text/html"
+        page = f"<html><body><h1>Edit {addon['slug']}</h1></body></html>"
+        return 200, page.encode(), "text/html; charset=utf-8"
+
+    # versions
+    def _version_json(self, version):
+        return {key: value for key, value in version.items() if key != "source_file"}
+
+    def _version_changes(self, addon, data, version=None):
+        """Returns the version fields changed by the details sent and raises the
+        errors of all the fields at once, before anything is changed"""
+        errors = {}
+        changes = {}
+        if "license" in data and "custom_license" in data:
+            message = "Both `license` and `custom_license` cannot be provided together."
+            raise ApiError(400, {"non_field_errors": [message]})
+        if "license" in data:
+            slug = data["license"]
+            if slug is None:
+                errors["license"] = [NOT_NULL]
+            elif not isinstance(slug, str) or slug not in LICENSES:
+                errors["license"] = [f"License with slug={slug} does not exist."]
+            elif addon["type"] not in LICENSES[slug]:
+                errors["license"] = ["Wrong add-on type for this license."]
+            else:
+                changes["license"] = {
+                    "id": next(self._ids),
+                    "slug": slug,
+                    "is_custom": False,
+                }
+        if "custom_license" in data:
+            custom = data["custom_license"]
+            current = (version or {}).get("license") or {}
+            current = current if current.get("is_custom") else {}
+            if custom is None:
+                errors["custom_license"] = [NOT_NULL]
+            elif not isinstance(custom, dict):
+                errors["custom_license"] = [
+                    f"Invalid data. Expected a dictionary, but got {_type_name(custom)}."
+                ]
+            else:
+                messages = {}
+                for field in ("name", "text"):
+                    if field in custom:
+                        field_errors = _translation_errors(custom[field])
+                    else:
+                        field_errors = [] if current.get(field) else [REQUIRED]
+                    if field_errors:
+                        messages[field] = field_errors
+                if messages:
+                    errors["custom_license"] = messages
+                else:
+                    changes["license"] = {
+                        "id": current.get("id") or next(self._ids),
+                        "slug": None,
+                        "is_custom": True,
+                        **{
+                            field: _merged(current.get(field), custom.get(field, {}))
+                            for field in ("name", "text")
+                        },
+                    }
+        if "compatibility" in data:
+            if data["compatibility"] is None:
+                errors["compatibility"] = [NOT_NULL]
+            else:
+                compatibility, message = _compatibility(data["compatibility"])
+                errors["compatibility"] = [message] if message else []
+                changes["compatibility"] = compatibility
+        if "release_notes" in data:
+            errors["release_notes"] = _translation_errors(data["release_notes"])
+            if not errors["release_notes"]:
+                current = (version or {}).get("release_notes")
+                changes["release_notes"] = _merged(current, data["release_notes"])
+        if "approval_notes" in data:
+            notes = _as_text(data["approval_notes"])
+            errors["approval_notes"] = (
+                [] if notes is not None else ["Not a valid string."]
+            )
+            changes["approval_notes"] = notes
+        if "is_disabled" in data:
+            errors["is_disabled"] = _boolean_errors(data["is_disabled"])
+            changes["is_disabled"] = data["is_disabled"]
+        if isinstance(data.get("source"), tuple):
+            filename, content = data["source"]
+            if not filename.endswith(SOURCE_EXTENSIONS):
+                errors["source"] = [
+                    "Unsupported file type, please upload an archive file."
+                ]
+            elif version is not None and version["file"]["status"] == "public":
+                errors["source"] = [
+                    "Source cannot be changed because this version has been "
+                    "reviewed by Mozilla."
+                ]
+            changes["source_file"] = content
+        errors = {field: messages for field, messages in errors.items() if messages}
+        if errors:
+            raise ApiError(400, errors)
+        return changes
+
+    def _source_url(self, version):
+        return f"{self.url}/firefox/downloads/source/{version['id']}"
+
+    def _add_version(self, addon, upload, data):
+        """Adds a version for the upload to the addon; everything is checked first"""
+        manifest = upload["manifest"]
+        addon_type = _addon_type(manifest)
+        if addon_type != addon["type"]:
+            message = (
+                f"The type ({TYPE_NAMES[addon_type]}) does not match the type of "
+                f"your add-on on AMO ({TYPE_NAMES[addon['type']]})"
+            )
+            raise ApiError(400, {"upload": [message]})
+        guid = _guid(manifest)
+        if guid not in (None, addon["guid"]):
+            message = (
+                f"The add-on ID in your manifest.json ({guid}) does not match the "
+                "ID of your add-on on AMO."
+            )
+            raise ApiError(400, {"upload": [message]})
+        number = manifest.get("version")
+        if any(version["version"] == number for version in addon["versions"]):
+            raise ApiError(409, {"version": [f"Version {number} already exists."]})
+        changes = self._version_changes(addon, data)
+        upload["used"] = True
+        version_id = next(self._ids)
+        version = {
+            "id": version_id,
+            "version": number,
+            "channel": upload["channel"],
+            "license": None,
+            "release_notes": None,
+            "approval_notes": "",
+            "compatibility": _compatibility(["firefox"])[0],
+            "is_disabled": False,
+            "file": {
+                "id": next(self._ids),
+                "status": "unreviewed",
+                "size": upload["size"],
+                "url": f"{self.url}/firefox/downloads/file/{version_id}/",
+                "is_mozilla_signed_extension": bool(
+                    upload.get("details", {}).get("mozilla_signed")
+                ),
+            },
+            "source": None,
+            "source_file": None,
+        }
+        self._apply_version_changes(version, changes)
+        addon["versions"].append(version)
+        return version
+
+    def _apply_version_changes(self, version, changes):
+        version.update(changes)
+        if changes.get("source_file") is not None:
+            version["source"] = self._source_url(version)
+
+    def _download_source(self, version_id):
+        with self._lock:
+            for addon in self.addons.values():
+                for version in addon["versions"]:
+                    if version["id"] == version_id and version["source_file"]:
+                        return 200, version["source_file"], "application/octet-stream"
+        return 404, b"", "text/plain"
+
+    def list_versions(self, user, addon, query, **kwargs):
+        addon = self._addon(addon)
+        versions = addon["versions"]
+        if query.get("filter") != "all_with_unlisted":
+            versions = [
+                version for version in versions if version["channel"] == "listed"
+            ]
+        results = [self._version_json(version) for version in reversed(versions)]
+        return 200, {
+            "count": len(results),
+            "next": None,
+            "previous": None,
+            "results": results,
+        }
+
+    def create_version(self, user, addon, data, **kwargs):
+        addon = self._owned_addon(addon, user)
+        upload = self._use_upload(user, data.get("upload"))
+        licensed = any(
+            version["license"]
+            for version in addon["versions"]
+            if version["channel"] == "listed"
+        )
+        if upload["channel"] == "listed" and not licensed:
+            if not data.get("license") and not data.get("custom_license"):
+                raise ApiError(
+                    400, {"license": ["This field is required for listed versions."]}
+                )
+        return 201, self._version_json(self._add_version(addon, upload, data))
+
+    def get_version(self, user, addon, version, **kwargs):
+        return 200, self._version_json(self._version(self._addon(addon), version))
+
+    def edit_version(self, user, addon, version, data, **kwargs):
+        addon = self._owned_addon(addon, user)
+        version = self._version(addon, version)
+        self._apply_version_changes(
+            version, self._version_changes(addon, data, version)
+        )
+        return 200, self._version_json(version)
+
+    # authors
+    def _author_json(self, user_id, author):
+        account = self._account_by_id(user_id)
+        return {
+            "user_id": user_id,
+            "name": account["name"],
+            "email": account["email"],
+            **author,
+        }
+
+    @staticmethod
+    def _sorted_authors(authors):
+        return sorted(authors.items(), key=lambda item: item[1]["position"])
+
+    def _author_changes(self, data):
+        errors = {}
+        if "role" in data and data["role"] not in ROLES:
+            errors["role"] = [f'"{data["role"]}" is not a valid choice.']
+        if "listed" in data:
+            errors["listed"] = _boolean_errors(data["listed"])
+        position = data.get("position", 0)
+        if isinstance(position, bool) or not isinstance(position, int):
+            errors["position"] = ["A valid integer is required."]
+        errors = {field: messages for field, messages in errors.items() if messages}
+        if errors:
+            raise ApiError(400, errors)
+        return {
+            field: data[field]
+            for field in ("role", "listed", "position")
+            if field in data
+        }
+
+    def list_authors(self, user, addon, **kwargs):
+        addon = self._owned_addon(addon, user)
+        return 200, [
+            self._author_json(user_id, author)
+            for user_id, author in self._sorted_authors(addon["authors"])
+        ]
+
+    def _edit_author(self, addon, authors, user_id, method, data):
+        user_id = int(user_id)
+        if user_id not in authors:
+            raise ApiError(404, NOT_FOUND)
+        if method == "GET":
+            return 200, self._author_json(user_id, authors[user_id])
+        changed = dict(authors)
+        if method == "DELETE":
+            del changed[user_id]
+        else:
+            changed[user_id] = {**authors[user_id], **self._author_changes(data)}
+        if authors is addon["authors"]:
+            if not any(author["role"] == "owner" for author in changed.values()):
+                raise ApiError(400, NEEDS_OWNER)
+            if not any(author["listed"] for author in changed.values()):
+                raise ApiError(400, NEEDS_LISTED_AUTHOR)
+        if method == "DELETE":
+            del authors[user_id]
+            return 204, b""
+        authors[user_id] = changed[user_id]
+        return 200, self._author_json(user_id, authors[user_id])
+
+    def author(self, user, addon, user_id, method, data, **kwargs):
+        addon = self._owned_addon(addon, user, owner=method != "GET")
+        return self._edit_author(addon, addon["authors"], user_id, method, data)
+
+    def list_pending_authors(self, user, addon, **kwargs):
+        addon = self._owned_addon(addon, user)
+        return 200, [
+            self._author_json(user_id, author)
+            for user_id, author in addon["pending_authors"].items()
+        ]
+
+    def invite(self, user, addon, data, **kwargs):
+        addon = self._owned_addon(addon, user, owner=True)
+        user_id = data.get("user_id")
+        account = None
+        if isinstance(user_id, int) and not isinstance(user_id, bool):
+            account = self._account_by_id(user_id)
+        if account is None:
+            raise ApiError(400, {"user_id": ["Account not found."]})
+        if not account["name"]:
+            message = (
+                "The account needs a display name before it can be added as an author."
+            )
+            raise ApiError(400, {"user_id": [message]})
+        if account["restricted"]:
+            message = "The email address used for your account is not allowed for submissions."
+            raise ApiError(400, {"user_id": [message]})
+        if user_id in addon["authors"] or user_id in addon["pending_authors"]:
+            raise ApiError(400, {"user_id": ["An author can only be present once."]})
+        invite = {
+            "role": "developer",
+            "listed": True,
+            "position": len(addon["authors"]),
+            **self._author_changes(data),
+        }
+        addon["pending_authors"][user_id] = invite
+        return 201, self._author_json(user_id, invite)
+
+    def pending_author(self, user, addon, user_id, method, data, **kwargs):
+        addon = self._owned_addon(addon, user, owner=method != "GET")
+        return self._edit_author(addon, addon["pending_authors"], user_id, method, data)
+
+    def answer_invite(self, user, addon, answer, **kwargs):
+        addon = self._addon(addon)
+        invite = addon["pending_authors"].pop(self._require_user(user)["id"], None)
+        if invite is None:
+            raise ApiError(403, NO_PERMISSION)
+        if answer == "confirm":
+            addon["authors"][user["id"]] = invite
+        return 200, b""
+
+    # previews
+    def add_preview(self, user, addon, data, **kwargs):
+        addon = self._owned_addon(addon, user)
+        if not isinstance(data.get("image"), tuple):
+            raise ApiError(400, {"image": ["No file was submitted."]})
+        message = _image_error(data["image"][1])
+        if message:
+            raise ApiError(400, {"image": [message]})
+        position = data.get("position", len(addon["previews"]))
+        if not str(position).isdigit():
+            raise ApiError(400, {"position": ["A valid integer is required."]})
+        preview_id = next(self._ids)
+        preview = {
+            "id": preview_id,
+            "caption": None,
+            "position": int(position),
+            "image_url": f"{self.url}/user-media/previews/full/{preview_id}.png",
+            "thumbnail_url": f"{self.url}/user-media/previews/thumbs/{preview_id}.jpg",
+            "image_size": [],
+        }
+        addon["previews"].append(preview)
+        return 201, preview
+
+    def preview(self, user, addon, preview, method, data, **kwargs):
+        addon = self._owned_addon(addon, user)
+        for found in addon["previews"]:
+            if found["id"] == int(preview):
+                break
+        else:
+            raise ApiError(404, NOT_FOUND)
+        if method == "DELETE":
+            addon["previews"].remove(found)
+            return 204, b""
+        changes = {}
+        if "caption" in data:
+            messages = _translation_errors(data["caption"])
+            if messages:
+                raise ApiError(400, {"caption": messages})
+            changes["caption"] = _merged(found["caption"], data["caption"])
+        if "position" in data:
+            position = data["position"]
+            if isinstance(position, bool) or not isinstance(position, int):
+                raise ApiError(400, {"position": ["A valid integer is required."]})
+            changes["position"] = position
+        found.update(changes)
+        return 200, found
+
+    # accounts
+    def get_profile(self, user, **kwargs):
+        user = self._require_user(user)
+        return 200, {key: user[key] for key in ("id", "name", "username", "email")}
+
+    def delete_session(self, user, **kwargs):
+        self.revoked.add(self._require_user(user)["token"])
+        return 200, b""
+
+    # abuse reports
+    def report_addon(self, user, data, **kwargs):
+        guid = data.get("addon")
+        if not guid:
+            raise ApiError(400, {"addon": ["This field is required."]})
+        try:
+            addon = self._addon(str(guid))
+            target = {"guid": addon["guid"], "id": addon["id"], "slug": addon["slug"]}
+        except ApiError:
+            # reports can be sent for addons that are not on AMO
+            target = {"guid": guid, "id": None, "slug": None}
+        reporter = None
+        if user is not None:
+            reporter = {key: user[key] for key in ("id", "name", "username")}
+        report = {**data, "addon": target, "reporter": reporter}
+        self.abuse_reports.append(report)
+        return 201, report
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument(
+        "--validation-latency",
+        type=float,
+        default=0,
+        help="seconds after which uploads are reported as processed",
+    )
+    parser.add_argument(
+        "--variables",
+        help="variables file of the environment whose accounts and addons to seed",
+    )
+    options = parser.parse_args(args)
+    server = AmoStandIn(options.host, options.port, options.validation_latency)
+    if options.variables:
+        with open(options.variables, encoding="utf-8") as f:
+            server.seed(json.load(f))
+    print(f"AMO API stand-in listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Deletes the addons, collections and ratings the tests left behind on the test
+accounts, e.g. when a test failed before its clean-up steps. Only artifacts older
+than a TTL and following the naming conventions of the suite (see RULES) are
+deleted, so the artifacts of a run in progress and the ones the tests rely on are
+kept. The accounts are accessed with the sessions stored by previous runs in the
+credential store. Can be run on its own:
+
+    python -m scripts.artifact_sweeper --variables stage.json --users collection_user
+
+or at the start of a test session with '--sweep-artifacts'"""
+
+import argparse
+import datetime
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from api.client import ApiClient
+from scripts.addon_cleanup import list_addons
+from scripts.credential_store import CredentialStore
+from scripts.session_vault import SessionVault
+
+DEFAULT_TTL_HOURS = 24
+DEFAULT_REPORT = "sweep-report.json"
+# the accounts the tests create artifacts with
+DEFAULT_USERS = (
+    "api_user",
+    "collection_user",
+    "rating_user",
+    "submissions_user",
+)
+
+# the run tag (see addon_cleanup.run_tag), as a word of its own in names and texts
+RUN_TAG = r"(?<![0-9a-z])run[0-9a-f]{8}(?![0-9a-z])"
+
+# names (or slugs) of the artifacts created by the tests, by kind
+RULES = {
+    "addons": [
+        # addons created through the API by the pool, the factory and the run tag
+        re.compile(rf"^pool-|^factory-|{RUN_TAG}"),
+        # DevHub submissions
+        re.compile(r"^Listed-\w{3} \d{1,2}, \d{4}-|^wizard_theme_|^listed-addon"),
+    ],
+    # collections are named with 15 random lowercase letters
+    "collections": [re.compile(r"^[a-z]{15}$")],
+    # the texts of the reviews written by the tests end with the run tag
+    "ratings": [re.compile(rf"{RUN_TAG}$")],
+}
+
+
+def _parse_date(value):
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _matches(kind, name):
+    return any(rule.search(name or "") for rule in RULES[kind])
+
+
+def _name(value):
+    """Collection names are returned as a string or as a dict of translations"""
+    if isinstance(value, dict):
+        return next(iter(value.values()), "")
+    return value
+
+
+def _pages(client, response):
+    """Yields the results of a paginated API response and of the next pages"""
+    while True:
+        response.raise_for_status()
+        data = response.json()
+        yield from data["results"]
+        if not data.get("next"):
+            return
+        response = client.get(data["next"][len(client.base_url) :])
+
+
+class ArtifactSweeper:
+    """Finds and deletes the left over artifacts of one account"""
+
+    def __init__(self, client, ttl_hours=DEFAULT_TTL_HOURS, max_workers=8):
+        self.client = client
+        self.cutoff = datetime.datetime.now(datetime.timezone.utc) - (
+            datetime.timedelta(hours=ttl_hours)
+        )
+        self.max_workers = max_workers
+
+    def find(self, sessionid):
+        """Returns {kind: [artifact]}, where an artifact is a dict with the 'key' used
+        to delete it, its 'name' and its 'created' (or last modified) date"""
+        user_id = self.client.get_profile().json()["id"]
+        found = {"addons": [], "collections": [], "ratings": []}
+        for listing in ("addons", "themes"):
+            for slug, name in list_addons(self.client, sessionid, listing):
+                if _matches("addons", name) or _matches("addons", slug):
+                    created = self.client.get_addon(slug).json()["created"]
+                    found["addons"].append(
+                        {"key": slug, "name": name, "created": created}
+                    )
+        for collection in _pages(self.client, self.client.list_collections(user_id)):
+            name = _name(collection["name"])
+            if _matches("collections", name):
+                found["collections"].append(
+                    {
+                        "key": f"{user_id}/{collection['slug']}",
+                        "name": name,
+                        "created": collection["modified"],
+                    }
+                )
+        for rating in _pages(self.client, self.client.list_ratings(user=user_id)):
+            if _matches("ratings", rating["body"]):
+                found["ratings"].append(
+                    {
+                        "key": rating["id"],
+                        "name": rating["addon"]["slug"],
+                        "created": rating["created"],
+                    }
+                )
+        return {
+            kind: [
+                artifact
+                for artifact in artifacts
+                if _parse_date(artifact["created"]) < self.cutoff
+            ]
+            for kind, artifacts in found.items()
+        }
+
+    def _delete(self, kind, key):
+        if kind == "addons":
+            try:
+                response = self.client.delete_addon(key)
+            except requests.HTTPError as error:
+                response = error.response
+        elif kind == "collections":
+            response = self.client.delete_collection(*key.split("/"))
+        else:
+            response = self.client.delete_rating(key)
+        return response.status_code
+
+    def delete(self, found):
+        """Deletes the artifacts in parallel and adds the response 'status' to each"""
+        tasks = [(kind, item) for kind, items in found.items() for item in items]
+        if not tasks:
+            return found
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            statuses = executor.map(
+                lambda task: self._delete(task[0], task[1]["key"]), tasks
+            )
+            for (_, artifact), status in zip(tasks, statuses):
+                artifact["status"] = status
+        return found
+
+
+def sweep(base_url, users=DEFAULT_USERS, ttl_hours=DEFAULT_TTL_HOURS, dry_run=False):
+    """Sweeps the accounts and returns the report: {user: {kind: [artifact]}}, or
+    {user: {"skipped": reason}} for the accounts without a valid stored session"""
+    pool = ApiClient(base_url)
+    vault = SessionVault(pool, CredentialStore(base_url))
+    report = {}
+    try:
+        for user in users:
+            sessionid = vault.get(user)
+            if sessionid is None:
+                report[user] = {"skipped": "no valid session stored for the account"}
+                continue
+            sweeper = ArtifactSweeper(pool.with_auth(sessionid), ttl_hours)
+            found = sweeper.find(sessionid)
+            report[user] = found if dry_run else sweeper.delete(found)
+    finally:
+        pool.close()
+    return report
+
+
+def write_report(report, path=DEFAULT_REPORT):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    for user, kinds in report.items():
+        if "skipped" in kinds:
+            print(f"{user}: skipped, {kinds['skipped']}")
+            continue
+        for kind, items in kinds.items():
+            statuses = [item.get("status") for item in items]
+            removed = sum(status in (200, 204) for status in statuses)
+            failed = sum(status not in (None, 200, 204) for status in statuses)
+            print(
+                f"{user}: {len(items)} left over {kind} found, {removed} removed, "
+                f"{failed} failed"
+            )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--variables", required=True, help="e.g. stage.json")
+    parser.add_argument("--users", default=",".join(DEFAULT_USERS))
+    parser.add_argument("--ttl-hours", type=float, default=DEFAULT_TTL_HOURS)
+    parser.add_argument("--report", default=DEFAULT_REPORT)
+    parser.add_argument("--dry-run", action="store_true")
+    options = parser.parse_args(args)
+    with open(options.variables) as f:
+        base_url = json.load(f)["base_url"]
+    report = sweep(
+        base_url, options.users.split(","), options.ttl_hours, options.dry_run
+    )
+    write_report(report, options.report)
+
+
+if __name__ == "__main__":
+    main()
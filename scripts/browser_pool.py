@@ -0,0 +1,185 @@
+"""Keeps one Firefox instance alive per test process, so that tests don't pay for a
+browser start-up each time. Between tests, the browser is brought back to a clean
+state; if that fails, or after a number of tests, the browser is replaced"""
+
+import pytest
+
+from selenium.common.exceptions import WebDriverException
+
+from scripts import firefox_profile
+
+# uninstalls the add-ons installed during a test; builtin and system add-ons
+# (e.g. the default themes) are left untouched
+UNINSTALL_ADDONS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const { AddonManager } = ChromeUtils.importESModule(
+  "resource://gre/modules/AddonManager.sys.mjs"
+);
+AddonManager.getAddonsByTypes(["extension", "theme", "locale", "dictionary"])
+  .then(async (addons) => {
+    const removed = [];
+    for (const addon of addons) {
+      if (!addon.isBuiltin && !addon.isSystem) {
+        await addon.uninstall();
+        removed.push(addon.id);
+      }
+    }
+    done(removed);
+  })
+  .catch((error) => done(`error: ${error}`));
+"""
+
+
+# clears the cookies and web storage of all the sites, including the Firefox Accounts
+# pages the tests log in on, which 'delete_all_cookies' can't reach from AMO pages
+CLEAR_SITE_DATA_SCRIPT = """
+const done = arguments[arguments.length - 1];
+Services.clearData.deleteData(
+  Ci.nsIClearDataService.CLEAR_COOKIES | Ci.nsIClearDataService.CLEAR_DOM_STORAGES,
+  (failedFlags) => done(failedFlags)
+);
+"""
+# the Firefox Accounts sites of the AMO environments; their cookies and storage are
+# cleared page by page when the browser doesn't allow scripts in the chrome context
+FXA_ORIGINS = ("https://accounts.stage.mozaws.net", "https://accounts.firefox.com")
+
+
+class BrowserPool:
+    """Hands out the same WebDriver to consecutive tests until it has been
+    used 'max_uses' times, it crashed or it couldn't be reset"""
+
+    def __init__(self, max_uses, window_size):
+        self.max_uses = max_uses
+        self.window_size = window_size
+        self.driver = None
+        self.uses = 0
+        # turned off if the browser doesn't allow scripts in the chrome context
+        self.can_uninstall_addons = True
+        self.can_clear_site_data = True
+
+    def acquire(self, factory):
+        """Returns the pooled driver, starting a new browser with 'factory' when needed"""
+        if self.driver is not None and (
+            self.uses >= self.max_uses or not self._is_alive()
+        ):
+            self.recycle()
+        if self.driver is None:
+            self.driver = factory()
+            self.uses = 0
+        self.uses += 1
+        return self.driver
+
+    def release(self, base_url):
+        """Resets the browser state left behind by a test: extra windows, cookies,
+        web storage (of AMO and of Firefox Accounts) and installed add-ons; the
+        browser is recycled if any step fails"""
+        if self.driver is None:
+            return
+        try:
+            handles = self.driver.window_handles
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+            if not self._clear_site_data():
+                # cookies and storage can only be cleared for the loaded page's origin
+                for origin in (base_url, *FXA_ORIGINS):
+                    self.driver.get(origin)
+                    self.driver.delete_all_cookies()
+                    self.driver.execute_script(
+                        "window.localStorage.clear(); window.sessionStorage.clear();"
+                    )
+            self._uninstall_addons()
+            self.driver.get("about:blank")
+            self.driver.set_window_size(*self.window_size)
+        except WebDriverException as error:
+            print(f"The browser could not be reset and will be restarted: {error.msg}")
+            self.recycle()
+
+    def recycle(self):
+        """Quits the pooled browser; a new one is started on the next 'acquire'"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+        self.driver = None
+        self.uses = 0
+
+    def _is_alive(self):
+        try:
+            self.driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def _clear_site_data(self):
+        """Clears the cookies and storage of all sites at once; returns False if the
+        browser doesn't allow it, in which case the origins are cleared one by one"""
+        if not self.can_clear_site_data or not hasattr(self.driver, "context"):
+            return False
+        try:
+            with self.driver.context(self.driver.CONTEXT_CHROME):
+                failed = self.driver.execute_async_script(CLEAR_SITE_DATA_SCRIPT)
+        except WebDriverException as error:
+            print(f"Site data can't be cleared at once in this browser: {error.msg}")
+            self.can_clear_site_data = False
+            return False
+        if failed:
+            raise WebDriverException(f"Site data could not be cleared ({failed})")
+        return True
+
+    def _uninstall_addons(self):
+        if not self.can_uninstall_addons or not hasattr(self.driver, "context"):
+            return
+        try:
+            with self.driver.context(self.driver.CONTEXT_CHROME):
+                result = self.driver.execute_async_script(UNINSTALL_ADDONS_SCRIPT)
+        except WebDriverException as error:
+            # tests installing add-ons run in a fresh browser anyway, so the
+            # pool can still be used without this clean-up step
+            print(f"Add-on clean-up is not available in this browser: {error.msg}")
+            self.can_uninstall_addons = False
+            return
+        if isinstance(result, str):
+            raise WebDriverException(f"Add-ons could not be uninstalled, {result}")
+        if result:
+            print(f"Uninstalled the add-ons left by the previous test: {result}")
+
+
+class ReusedBrowserPlugin:
+    """Registered when running with '--reuse-browser'; replaces the pytest-selenium
+    'driver' fixture with one that takes the browser from the pool. Tests marked with
+    'fresh_browser' or 'firefox_release' and tests using FoxPuppet's 'firefox' fixture
+    (which install add-ons) still get a browser of their own. With
+    '--firefox-profile-cache', the pre-built profile is only copied for the browsers
+    actually started; the copies are removed at exit"""
+
+    def __init__(self, max_uses, window_size):
+        self.pool = BrowserPool(max_uses, window_size)
+
+    def pytest_sessionfinish(self):
+        self.pool.recycle()
+
+    @pytest.fixture
+    def driver(self, request, driver_class, driver_kwargs, base_url):
+        fresh = (
+            request.node.get_closest_marker("fresh_browser")
+            or request.node.get_closest_marker("firefox_release")
+            or "firefox" in request.fixturenames
+        )
+        template = request.getfixturevalue("firefox_profile_template")
+
+        def start():
+            if template is not None:
+                firefox_profile.use_clone(driver_kwargs["options"], template)
+            return driver_class(**driver_kwargs)
+
+        driver = start() if fresh else self.pool.acquire(start)
+        # used by pytest-selenium to attach screenshots and logs to the report
+        request.node._driver = driver
+        yield driver
+        if fresh:
+            driver.quit()
+        else:
+            self.pool.release(base_url)
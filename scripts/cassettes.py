@@ -0,0 +1,229 @@
+"""Recording and replay of the HTTP calls made by the API tests, so the tests can run
+without an AMO environment. In record mode, every call sent through the 'api_pool'
+session is saved with its response in a JSON cassette per test; in replay mode, the
+base url points to a local stand-in server answering with the recorded responses.
+
+Cassettes are meant to be committed, so they hold no credentials: the request
+headers are not saved and the recorded base url is replaced by a placeholder.
+Requests are matched by method and path, in recorded order; bodies are saved for
+reference only, since tests send random names (the random generator is seeded
+with the test id in both modes, so they usually match anyway)"""
+
+import base64
+import hashlib
+import http.server
+import json
+import os
+import threading
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+# bumped when the cassette format changes; cassettes of other versions are re-recorded
+FORMAT_VERSION = 1
+DEFAULT_DIR = "tests/api/cassettes"
+BASE_URL_PLACEHOLDER = "{base_url}"
+# request bodies larger than this are saved as a hash only
+MAX_SAVED_BODY = 16 * 1024
+
+
+def cassette_path(directory, nodeid):
+    """tests/api/test_x.py::test_y[param] -> <directory>/test_x/test_y[param].json"""
+    module, _, name = nodeid.partition("::")
+    module = os.path.splitext(os.path.basename(module))[0]
+    return os.path.join(directory, module, f"{name.replace('::', '.')}.json")
+
+
+def _encode(content):
+    if content is None:
+        return {"text": ""}
+    if isinstance(content, str):
+        content = content.encode()
+    try:
+        return {"text": content.decode()}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode()}
+
+
+def _decode(body):
+    if "base64" in body:
+        return base64.b64decode(body["base64"])
+    return body["text"].encode()
+
+
+def _is_unprocessed(response):
+    """True for a recorded upload still being processed ('processed': false)"""
+    if response["status"] != 200 or "text" not in response["body"]:
+        return False
+    try:
+        content = json.loads(response["body"]["text"])
+    except ValueError:
+        return False
+    return isinstance(content, dict) and content.get("processed") is False
+
+
+def _path(url):
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+class Cassette:
+    """The interactions recorded for one test"""
+
+    def __init__(self, path, base_url=None, interactions=None):
+        self.path = path
+        self.base_url = base_url
+        self.interactions = interactions or []
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] != FORMAT_VERSION:
+            raise ValueError(
+                f"{path} has format version {data['version']}; record it again"
+            )
+        return cls(path, data["base_url"], data["interactions"])
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": FORMAT_VERSION,
+                    "base_url": self.base_url,
+                    "interactions": self.interactions,
+                },
+                f,
+                indent=1,
+                ensure_ascii=False,
+            )
+        os.replace(temp_path, self.path)
+
+    def add(self, request, response):
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+        if not isinstance(body, bytes):
+            # uploads are streamed; the digests of their files were computed on the way
+            saved_body = {"files": body.digests, "length": len(body)}
+        elif len(body) <= MAX_SAVED_BODY:
+            saved_body = _encode(body)
+        else:
+            saved_body = {"sha256": hashlib.sha256(body).hexdigest(), "length": len(body)}
+        interaction = {
+            "request": {
+                "method": request.method,
+                "path": _path(request.url),
+                "body": saved_body,
+            },
+            "response": {
+                "status": response.status_code,
+                "content_type": response.headers.get("Content-Type", ""),
+                "body": _encode(
+                    response.content.replace(
+                        self.base_url.encode(), BASE_URL_PLACEHOLDER.encode()
+                    )
+                ),
+            },
+        }
+        previous = self.interactions[-1] if self.interactions else None
+        # the polls of an upload that is still being processed are dropped, so the
+        # replay doesn't wait for the processing again; other repeated reads of the
+        # same path are all kept
+        if (
+            previous is not None
+            and request.method == "GET"
+            and previous["request"]["method"] == "GET"
+            and previous["request"]["path"] == interaction["request"]["path"]
+            and _is_unprocessed(previous["response"])
+        ):
+            self.interactions[-1] = interaction
+        else:
+            self.interactions.append(interaction)
+
+    def take(self, method, path):
+        """Removes and returns the first recorded response for the request, or None"""
+        for index, interaction in enumerate(self.interactions):
+            request = interaction["request"]
+            if request["method"] == method and request["path"] == path:
+                return self.interactions.pop(index)["response"]
+        return None
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Saves the calls it sends in the cassette of the running test, if any"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cassette = None
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if self.cassette is not None:
+            self.cassette.add(request, response)
+        return response
+
+
+class _ReplayHandler(http.server.BaseHTTPRequestHandler):
+    def _replay(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        response = self.server.replay(self.command, self.path)
+        if response is None:
+            status, content_type = 404, "application/json"
+            body = json.dumps(
+                {"detail": f"No recorded response for {self.command} {self.path}"}
+            ).encode()
+        else:
+            status, content_type = response["status"], response["content_type"]
+            body = _decode(response["body"]).replace(
+                BASE_URL_PLACEHOLDER.encode(), self.server.url.encode()
+            )
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _replay
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer(http.server.ThreadingHTTPServer):
+    """A local server answering with the responses of the loaded cassette; it runs
+    in a thread of the test process, on a free port"""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0):
+        super().__init__((host, port), _ReplayHandler)
+        self.url = f"http://{host}:{self.server_address[1]}"
+        self.cassette = None
+        self.misses = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def load(self, cassette):
+        with self._lock:
+            self.cassette = cassette
+            self.misses = []
+
+    def replay(self, method, path):
+        with self._lock:
+            response = self.cassette.take(method, path) if self.cassette else None
+            if response is None:
+                self.misses.append(f"{method} {path}")
+            return response
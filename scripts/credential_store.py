@@ -0,0 +1,132 @@
+"""A process-safe store for the user sessions shared by the tests of a run.
+It replaces the '<user>.txt' files that were written in the working directory,
+which raced when several xdist workers were reading, writing and deleting the
+same file. Sessions are kept in a small SQLite database, keyed by user and
+AMO environment, and every change is made inside a write transaction. Sessions
+outlive the run that stored them, but their reference counts don't: the counts
+left by another run (e.g. one that was interrupted) are ignored"""
+
+import time
+import uuid
+
+from scripts.local_db import transaction
+
+DEFAULT_PATH = ".amo-sessions.sqlite3"
+
+
+class CredentialStore:
+    """Keeps one session per user and environment. Tests acquire the session
+    before using it and release it when they are done; a session marked for
+    invalidation is only handed over for deletion once its last user has released it.
+    'run' identifies the test run the reference counts belong to, and has to be
+    shared by all the processes of the run; a new one is made by default."""
+
+    def __init__(self, environment, path=DEFAULT_PATH, run=None):
+        self.environment = environment
+        self.path = path
+        self.run = run or uuid.uuid4().hex
+        with transaction(self.path) as db:
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS sessions (
+                    user TEXT NOT NULL,
+                    environment TEXT NOT NULL,
+                    sessionid TEXT NOT NULL,
+                    refcount INTEGER NOT NULL DEFAULT 0,
+                    invalidate INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL,
+                    run TEXT NOT NULL DEFAULT '',
+                    PRIMARY KEY (user, environment)
+                )"""
+            )
+            columns = [row[1] for row in db.execute("PRAGMA table_info(sessions)")]
+            if "run" not in columns:
+                # stores made before the reference counts were scoped to a run
+                db.execute(
+                    "ALTER TABLE sessions ADD COLUMN run TEXT NOT NULL DEFAULT ''"
+                )
+
+    def get(self, user):
+        """Returns the stored sessionid of the user or None if there is no session"""
+        with transaction(self.path) as db:
+            row = db.execute(
+                "SELECT sessionid FROM sessions WHERE user = ? AND environment = ?",
+                (user, self.environment),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, user, sessionid):
+        """Atomically stores a new session for the user, replacing the previous one;
+        the tests of this run holding the previous session keep their reference count"""
+        with transaction(self.path) as db:
+            db.execute(
+                """INSERT INTO sessions (user, environment, sessionid, updated_at, run)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (user, environment) DO UPDATE
+                SET sessionid = excluded.sessionid, invalidate = 0,
+                    refcount = CASE WHEN run = excluded.run THEN refcount ELSE 0 END,
+                    updated_at = excluded.updated_at, run = excluded.run""",
+                (user, self.environment, sessionid, time.time(), self.run),
+            )
+
+    def acquire(self, user):
+        """Registers one more test using the user session and returns the sessionid;
+        the counts left on the session by another run are dropped"""
+        with transaction(self.path) as db:
+            db.execute(
+                """UPDATE sessions
+                SET refcount = CASE WHEN run = :run THEN refcount + 1 ELSE 1 END,
+                    invalidate = CASE WHEN run = :run THEN invalidate ELSE 0 END,
+                    run = :run
+                WHERE user = :user AND environment = :environment""",
+                {"run": self.run, "user": user, "environment": self.environment},
+            )
+            row = db.execute(
+                "SELECT sessionid FROM sessions WHERE user = ? AND environment = ?",
+                (user, self.environment),
+            ).fetchone()
+        return row[0] if row else None
+
+    def release(self, user, invalidate=False):
+        """Unregisters a test using the user session. With 'invalidate', the session
+        is marked to be deleted once it is no longer in use. Returns the sessionid
+        if the caller was the last user of a session marked for invalidation and is
+        now responsible for deleting it; the session is removed from the store then"""
+        with transaction(self.path) as db:
+            row = db.execute(
+                "SELECT sessionid, refcount, invalidate, run FROM sessions WHERE user = ? AND environment = ?",
+                (user, self.environment),
+            ).fetchone()
+            if row is None:
+                return None
+            sessionid, refcount, marked, run = row
+            if run != self.run:
+                # the counts were left by another run
+                refcount, marked = 0, 0
+            refcount = max(refcount - 1, 0)
+            marked = marked or invalidate
+            if refcount == 0 and marked:
+                db.execute(
+                    "DELETE FROM sessions WHERE user = ? AND environment = ?",
+                    (user, self.environment),
+                )
+                return sessionid
+            db.execute(
+                "UPDATE sessions SET refcount = ?, invalidate = ?, run = ? WHERE user = ? AND environment = ?",
+                (refcount, int(marked), self.run, user, self.environment),
+            )
+        return None
+
+    def remove(self, user, sessionid=None):
+        """Drops the user session from the store, regardless of its users; when a
+        sessionid is given, the session is only dropped if it wasn't refreshed meanwhile"""
+        with transaction(self.path) as db:
+            if sessionid is None:
+                db.execute(
+                    "DELETE FROM sessions WHERE user = ? AND environment = ?",
+                    (user, self.environment),
+                )
+            else:
+                db.execute(
+                    "DELETE FROM sessions WHERE user = ? AND environment = ? AND sessionid = ?",
+                    (user, self.environment, sessionid),
+                )
@@ -0,0 +1,140 @@
+"""Groups of tests that have to run on the same xdist worker, in the order they are
+collected in. A test is grouped with the tests it depends on, declared with
+'@pytest.mark.depends_on(...)' or with the 'dependency' marker of pytest-dependency,
+and with the tests sharing its module or class scoped fixtures. Each connected
+group is a chain; chains that don't share any test can run in parallel.
+
+The workers write the groups to a JSON file once they have collected the tests,
+since the xdist controller only receives their node ids (see 'duration_scheduling.py')
+"""
+
+import json
+import os
+
+DEFAULT_PATH = ".amo-test-groups.json"
+
+
+def fixture_group(item):
+    """Returns the id of the module or class whose scoped fixtures the test uses,
+    or None; tests of the same group should run on the same worker, so that the
+    fixture is only set up once"""
+    fixtureinfo = getattr(item, "_fixtureinfo", None)
+    if fixtureinfo is None:
+        return None
+    scopes = {
+        fixturedef.scope
+        for fixturedefs in fixtureinfo.name2fixturedefs.values()
+        for fixturedef in fixturedefs
+    }
+    module = item.nodeid.split("::")[0]
+    if "class" in scopes and item.cls is not None:
+        return item.nodeid.rsplit("::", 1)[0]
+    if scopes & {"class", "module"}:
+        return module
+    if "package" in scopes:
+        return os.path.dirname(module)
+    return None
+
+
+def _matches(item, name, prefix):
+    """'name' is a node id, or the name of a test relative to 'prefix'"""
+    if prefix:
+        name = f"{prefix}::{name}"
+    nodeid = item.nodeid.replace("::()::", "::")
+    return (
+        nodeid == name
+        or nodeid.startswith(f"{name}::")
+        or nodeid.startswith(f"{name}[")
+    )
+
+
+def _named(items):
+    """Tests given a name with '@pytest.mark.dependency(name=...)'"""
+    return {
+        marker.kwargs["name"]: item
+        for item in items
+        for marker in [item.get_closest_marker("dependency")]
+        if marker is not None and "name" in marker.kwargs
+    }
+
+
+def dependencies(item, items, named):
+    """Returns the collected tests the test depends on. 'depends_on' takes node ids,
+    or names of tests from the same module; 'dependency' names are resolved
+    in the marker scope, as pytest-dependency does"""
+    module = item.nodeid.split("::")[0]
+    depends = []
+    for marker in item.iter_markers("depends_on"):
+        for name in marker.args:
+            prefix = None if "::" in name or name.endswith(".py") else module
+            depends.append((name, prefix))
+    for marker in item.iter_markers("dependency"):
+        scope = marker.kwargs.get("scope", "module")
+        prefix = {"module": module, "class": item.nodeid.rsplit("::", 1)[0]}.get(
+            scope
+        )
+        depends.extend((name, prefix) for name in marker.kwargs.get("depends", []))
+    found = []
+    for name, prefix in depends:
+        if name in named:
+            found.append(named[name])
+            continue
+        found.extend(
+            other
+            for other in items
+            if other is not item and _matches(other, name, prefix)
+        )
+    return found
+
+
+def chains(items):
+    """Returns {node id: chain} for the tests that are part of a chain, where the
+    chain is named after its first collected test"""
+    parents = {item.nodeid: item.nodeid for item in items}
+
+    def root(nodeid):
+        while parents[nodeid] != nodeid:
+            parents[nodeid] = parents[parents[nodeid]]
+            nodeid = parents[nodeid]
+        return nodeid
+
+    def join(first, second):
+        first, second = root(first), root(second)
+        # the chain keeps the name of the test that was collected first
+        if order[second] < order[first]:
+            first, second = second, first
+        parents[second] = first
+
+    order = {item.nodeid: index for index, item in enumerate(items)}
+    named = _named(items)
+    fixture_groups = {}
+    for item in items:
+        group = fixture_group(item)
+        if group is not None:
+            join(fixture_groups.setdefault(group, item.nodeid), item.nodeid)
+        for other in dependencies(item, items, named):
+            join(other.nodeid, item.nodeid)
+
+    roots = {nodeid: root(nodeid) for nodeid in parents}
+    sizes = {}
+    for chain in roots.values():
+        sizes[chain] = sizes.get(chain, 0) + 1
+    return {nodeid: chain for nodeid, chain in roots.items() if sizes[chain] > 1}
+
+
+def save(groups, path=DEFAULT_PATH):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(groups, f, indent=1, sort_keys=True)
+    try:
+        os.replace(temp_path, path)
+    except PermissionError:
+        # on Windows, another worker is replacing the file with the same groups
+        os.remove(temp_path)
+
+
+def load(path=DEFAULT_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
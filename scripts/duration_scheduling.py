@@ -0,0 +1,69 @@
+"""An xdist scheduler that hands out the longest tests first, based on the durations
+recorded in the previous runs, so that the run doesn't end with a single worker
+going through a slow test file while the other workers are idle. The tests of a
+chain (see 'dependency_chains.py') are sent to the same worker, in collection order"""
+
+import statistics
+
+from xdist.scheduler import LoadScopeScheduling
+
+from scripts import dependency_chains
+
+# duration assumed for tests without history when there is no history at all
+DEFAULT_DURATION = 30
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """Work units are single tests or the tests of a chain; units are queued by
+    their expected duration, longest first, and every worker pulls the next unit
+    when it's almost out of work. Only the work queue, the scopes and the unit
+    assignment are changed, which relies on the internals of pytest-xdist 3.5
+    (pinned in requirements.txt)"""
+
+    def __init__(self, config, log=None, store=None):
+        super().__init__(config, log)
+        self.store = store
+        # read when the workers are done collecting, see 'schedule'
+        self.chains = {}
+        # whether the work queue was sorted by expected duration
+        self.ordered = False
+        known = list(store.tests.values())
+        # tests without history are expected to take as long as a typical test
+        self.default_duration = (
+            statistics.median(known) if known else DEFAULT_DURATION
+        )
+
+    def _split_scope(self, nodeid):
+        return self.chains.get(nodeid, nodeid)
+
+    def expected_duration(self, nodeids):
+        durations = (self.store.duration(nodeid) for nodeid in nodeids)
+        return sum(
+            self.default_duration if duration is None else duration
+            for duration in durations
+        )
+
+    def schedule(self):
+        """Lets LoadScopeScheduling split the collection into work units and hand them
+        out; the chains written by the workers are read before the split"""
+        if self.collection is None:
+            self.chains = dependency_chains.load()
+        super().schedule()
+
+    def _assign_work_unit(self, node):
+        """Queues the work units by expected duration instead of size when the first
+        unit is handed out, so that the initial assignment also starts with the
+        longest units"""
+        if not self.ordered:
+            self.ordered = True
+            units = sorted(
+                self.workqueue.items(),
+                key=lambda item: -self.expected_duration(item[1]),
+            )
+            self.workqueue.clear()
+            self.workqueue.update(units)
+            self.log(
+                f"Expected duration of the {len(units)} work units: "
+                f"{sum(self.expected_duration(nodeids) for _, nodeids in units):.0f}s"
+            )
+        super()._assign_work_unit(node)
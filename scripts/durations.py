@@ -0,0 +1,77 @@
+"""Records how long every test takes, so that the next parallel runs can start
+the longest tests first (see 'duration_scheduling.py'). Durations are kept in a
+small JSON file in the working directory; the pytest-html reports produced by
+the CI jobs can be imported to seed it"""
+
+import json
+import os
+import re
+
+DEFAULT_PATH = ".amo-test-durations.json"
+# weight of the last run in the recorded duration, so one slow run doesn't
+# outweigh the history of a test
+SMOOTHING = 0.5
+# name and duration cells of the results table in a pytest-html report
+HTML_REPORT_ROW = re.compile(
+    r'<td class="col-name">([^<]+)</td>\s*<td class="col-duration">([\d.]+)</td>'
+)
+
+
+class DurationStore:
+    """Durations (in seconds) of the tests, keyed by node id"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.tests = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.tests = json.load(f)
+
+    def duration(self, nodeid):
+        return self.tests.get(nodeid)
+
+    def record(self, nodeid, duration):
+        previous = self.duration(nodeid)
+        if previous is not None:
+            duration = SMOOTHING * duration + (1 - SMOOTHING) * previous
+        self.tests[nodeid] = round(duration, 2)
+
+    def import_html_reports(self, paths):
+        """Adds the durations from pytest-html reports for the tests
+        that don't have a recorded duration yet"""
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                rows = HTML_REPORT_ROW.findall(f.read())
+            for nodeid, duration in rows:
+                self.tests.setdefault(nodeid, float(duration))
+
+    def save(self):
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.tests, f, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+class DurationRecorder:
+    """Adds up the setup, call and teardown durations of every test and saves them
+    at the end of the session. With xdist, the reports of all the workers reach
+    the controller, so only the controller writes the store"""
+
+    def __init__(self, store, is_worker):
+        self.store = store
+        self.is_worker = is_worker
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_worker:
+            return
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0) + report.duration
+        )
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker or not self.durations:
+            return
+        for nodeid, duration in self.durations.items():
+            self.store.record(nodeid, duration)
+        self.store.save()
@@ -0,0 +1,139 @@
+"""Firefox preferences used by the tests and a cache of pre-built Firefox profiles.
+A profile template is built once per AMO environment, with the test preferences
+written to its 'user.js' and its start-up caches warmed by one browser launch;
+every test then starts Firefox with a copy of that template instead of having
+Firefox create a new profile from nothing"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+from selenium import webdriver
+
+PROD_URL = "https://addons.mozilla.org"
+DEFAULT_ROOT = os.path.join(tempfile.gettempdir(), "amo-release-tests-profiles")
+# files Firefox uses to mark a profile as being in use; they are not copied
+LOCK_FILES = ("lock", ".parentlock", "parent.lock")
+
+# profile copies made by this process which haven't been removed yet
+_clones = []
+
+
+def preferences(base_url, variables):
+    """Returns the Firefox preferences for the AMO environment under test; for prod
+    installation tests we do not need to set special prefs, so the browser set-up
+    differs between prod and the other AMO environments"""
+    if base_url == PROD_URL:
+        return {
+            "extensions.getAddons.discovery.api_url": "https://services.addons.mozilla.org/api/v4/discovery/?lang=%LOCALE%&edition=%DISTRIBUTION%",
+            "extensions.getAddons.cache.enabled": True,
+            "extensions.getAddons.get.url": "https://services.addons.mozilla.org/api/v4/addons/search/?guid=%IDS%&lang=%LOCALE%",
+            "extensions.update.url": "extensions.update.url	https://versioncheck.addons.mozilla.org/update/VersionCheck.php?reqVersion=%REQ_VERSION%&id=%ITEM_ID%&version=%ITEM_VERSION%&maxAppVersion=%ITEM_MAXAPPVERSION%&status=%ITEM_STATUS%&appID=%APP_ID%&appVersion=%APP_VERSION%&appOS=%APP_OS%&appABI=%APP_ABI%&locale=%APP_LOCALE%&currentAppVersion=%CURRENT_APP_VERSION%&updateType=%UPDATE_TYPE%&compatMode=%COMPATIBILITY_MODE%",
+            "extensions.update.background.url": "https://versioncheck-bg.addons.mozilla.org/update/VersionCheck.php?reqVersion=%REQ_VERSION%&id=%ITEM_ID%&version=%ITEM_VERSION%&maxAppVersion=%ITEM_MAXAPPVERSION%&status=%ITEM_STATUS%&appID=%APP_ID%&appVersion=%APP_VERSION%&appOS=%APP_OS%&appABI=%APP_ABI%&locale=%APP_LOCALE%&currentAppVersion=%CURRENT_APP_VERSION%&updateType=%UPDATE_TYPE%&compatMode=%COMPATIBILITY_MODE%",
+        }
+    return {
+        "extensions.install.requireBuiltInCerts": False,
+        "xpinstall.signatures.required": True,
+        "xpinstall.signatures.dev-root": True,
+        "extensions.webapi.testing": True,
+        "ui.popup.disable_autohide": True,
+        "devtools.console.stdout.content": True,
+        "extensions.getAddons.discovery.api_url": variables[
+            "extensions_getAddons_discovery_api_url"
+        ],
+        "extensions.getAddons.get.url": variables["extensions_getAddons_get_url"],
+        "extensions.update.url": variables["extensions_update_url"],
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def firefox_version(binary="firefox"):
+    """Returns the version reported by the Firefox binary, or '' if it can't be run"""
+    try:
+        result = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return result.stdout.strip()
+
+
+class ProfileCache:
+    """Builds the Firefox profile templates. Templates are shared by all
+    the test processes on the machine and are keyed by the base url, preferences
+    and Firefox version, so a change in the preferences or a Firefox update results
+    in a new template"""
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+
+    def template(self, base_url, prefs):
+        """Returns the path of the profile template for the environment, building it
+        if it doesn't exist yet"""
+        key = hashlib.sha256(
+            json.dumps([base_url, prefs, firefox_version()], sort_keys=True).encode()
+        ).hexdigest()[:16]
+        path = os.path.join(self.root, key)
+        if os.path.isdir(path):
+            return path
+        # the template is built in a private directory and moved in place at the end,
+        # so other workers never see a half-built profile
+        os.makedirs(self.root, exist_ok=True)
+        build_path = tempfile.mkdtemp(prefix=f"{key}-", dir=self.root)
+        with open(os.path.join(build_path, "user.js"), "w") as f:
+            for name, value in prefs.items():
+                f.write(f"user_pref({json.dumps(name)}, {json.dumps(value)});\n")
+        self.warm_up(build_path, base_url)
+        for name in LOCK_FILES:
+            if os.path.exists(os.path.join(build_path, name)):
+                os.remove(os.path.join(build_path, name))
+        try:
+            os.rename(build_path, path)
+        except OSError:
+            # another worker finished building the same template first
+            shutil.rmtree(build_path, ignore_errors=True)
+        return path
+
+    @staticmethod
+    def warm_up(profile, url):
+        """Starts Firefox once with the profile, so that it creates its databases and
+        start-up caches, and loads the AMO homepage to fill the network cache"""
+        options = webdriver.FirefoxOptions()
+        options.add_argument("-headless")
+        options.add_argument("-profile")
+        options.add_argument(profile)
+        browser = webdriver.Firefox(options=options)
+        try:
+            browser.get(url)
+        finally:
+            browser.quit()
+
+
+def clone(template):
+    """Copies the template to a new profile directory used by a single browser and
+    returns its path; a copy is much faster than Firefox creating a new profile"""
+    destination = os.path.join(tempfile.mkdtemp(prefix="amo-profile-"), "profile")
+    shutil.copytree(template, destination, ignore=shutil.ignore_patterns(*LOCK_FILES))
+    _clones.append(destination)
+    return destination
+
+
+def use_clone(options, template):
+    """Makes the browser started with the Firefox options use a new copy of the
+    template; returns the path of the copy"""
+    profile = clone(template)
+    options.add_argument("-profile")
+    options.add_argument(profile)
+    return profile
+
+
+def remove_clones(*profiles):
+    """Removes the given profile copies, or all the copies made by this process"""
+    for profile in profiles or list(_clones):
+        shutil.rmtree(os.path.dirname(profile), ignore_errors=True)
+        if profile in _clones:
+            _clones.remove(profile)
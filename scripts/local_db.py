@@ -0,0 +1,23 @@
+"""Helpers for the small SQLite databases that the test processes of a run share
+in the working directory (user sessions, resource locks)"""
+
+import contextlib
+import sqlite3
+
+
+@contextlib.contextmanager
+def transaction(path, timeout=60):
+    """Opens a write transaction on the database; 'BEGIN IMMEDIATE' takes the
+    database write lock up front, so read-modify-write sequences made inside
+    the transaction are atomic across processes"""
+    db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+    try:
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+    finally:
+        db.close()
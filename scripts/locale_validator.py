@@ -0,0 +1,155 @@
+"""Validates the page translations stored in 'translations.json' in a single pass.
+Every translation key is mapped below to the page it is displayed on and to the
+page object locator of its element; each page of a locale is loaded once and all
+the keys displayed on it are read and compared at the same time"""
+
+import collections
+
+from pages.desktop.base import Header
+from pages.desktop.frontend.extensions import Extensions
+from pages.desktop.frontend.home import Home
+from pages.desktop.frontend.themes import Themes
+from regions.desktop.categories import Categories
+from regions.desktop.shelves import Shelves
+
+# 'scope' - the locator of the element the text is searched in, if any
+# 'index' - which of the elements matching the locator holds the text
+# 'match' - how the displayed text is compared with the translation:
+#     'displayed_in_expected' - the displayed text is part of the translation
+#     'expected_in_displayed' - the translation is part of the displayed text
+#     'expected_in_any' - the translation is one of the texts of the matching elements
+Check = collections.namedtuple(
+    "Check",
+    ["locator", "scope", "index", "match"],
+    defaults=[None, 0, "displayed_in_expected"],
+)
+
+# translations.json section -> path of the page displaying it
+SECTION_PAGES = {
+    "header": "/{locale}",
+    "home_page": "/{locale}",
+    "extensions_page": "/{locale}/firefox/extensions/",
+    "themes_page": "/{locale}/firefox/themes/",
+}
+
+
+def _landing_page_checks(page_class, addon_type):
+    return {
+        "page_header": Check(page_class._title_locator),
+        "page_summary": Check(page_class._header_summary_locator),
+        "shelf_title_categories": Check(Categories._categories_card_header_locator),
+        f"shelf_title_recommended_{addon_type}": Check(
+            Shelves.ShelfList._promo_card_header_locator,
+            scope=Shelves._recommended_addons_locator,
+        ),
+        f"shelf_title_top_rated_{addon_type}": Check(
+            Shelves.ShelfList._promo_card_header_locator,
+            scope=Shelves._top_rated_locator,
+        ),
+        f"shelf_title_trending_{addon_type}": Check(
+            Shelves.ShelfList._promo_card_header_locator,
+            scope=Shelves._trending_addons_locator,
+        ),
+    }
+
+
+CHECKS = {
+    "header": {
+        "blog_link": Check(Header._blog_link_locator, Header._root_locator),
+        "extension_workshop_link": Check(
+            Header._extension_workshop_locator, Header._root_locator
+        ),
+        "developer_hub_link": Check(Header._devhub_locator, Header._root_locator),
+        "login_link": Check(Header._login_locator, Header._root_locator),
+        "extensions_link": Check(Header._extensions_locator, Header._root_locator),
+        "themes_link": Check(Header._themes_locator, Header._root_locator),
+        "more_link": Check(Header._more_menu_locator, Header._root_locator),
+        "more_dropdown_for_firefox_section": Check(
+            Header._more_dropdown_sections_locator, Header._root_locator, 0
+        ),
+        "more_dropdown_other_browsers_section": Check(
+            Header._more_dropdown_sections_locator, Header._root_locator, 1
+        ),
+        "more_dropdown_dictionaries_link": Check(
+            Header._more_dropdown_links_locator, Header._root_locator, 0
+        ),
+        "more_dropdown_addons_for_android_link": Check(
+            Header._more_dropdown_links_locator, Header._root_locator, 1
+        ),
+    },
+    "home_page": {
+        "shelf_title_recommended_extensions": Check(
+            Home._shelves_titles_locator, match="expected_in_any"
+        ),
+        "shelf_title_popular_themes": Check(
+            Home._shelves_titles_locator, match="expected_in_any"
+        ),
+        "shelf_title_recommended_themes": Check(
+            Home._shelves_titles_locator, match="expected_in_any"
+        ),
+        "shelf_title_theme_categories": Check(
+            Home.ThemeCategory._shelf_summary_locator, match="expected_in_displayed"
+        ),
+    },
+    "extensions_page": _landing_page_checks(Extensions, "extensions"),
+    "themes_page": _landing_page_checks(Themes, "themes"),
+}
+
+
+def _read(page, check):
+    """Returns the displayed text(s) for the check, or None if the element is missing"""
+    root = page
+    if check.scope is not None:
+        scopes = page.find_elements(*check.scope)
+        if not scopes:
+            return None
+        root = scopes[0]
+    texts = [element.text for element in root.find_elements(*check.locator)]
+    if check.match == "expected_in_any":
+        return texts
+    return texts[check.index] if len(texts) > check.index else None
+
+
+def _matches(check, displayed, expected):
+    # an element displaying no text is a missing translation, even though the empty
+    # string is part of any expected text
+    if not displayed:
+        return False
+    if check.match == "displayed_in_expected":
+        return displayed in expected
+    return expected in displayed
+
+
+def locales(variables):
+    """The locales in the test variables that have translations to validate"""
+    return [
+        name
+        for name, value in variables.items()
+        if isinstance(value, dict) and SECTION_PAGES.keys() & value.keys()
+    ]
+
+
+def validate(load_page, locale, translations):
+    """Compares all the translations of a locale with the texts displayed by AMO;
+    'load_page' returns the page for a path. Returns one line for each key that
+    doesn't match, or that has no check or page defined"""
+    diff = []
+    for section, keys in translations.items():
+        if section not in SECTION_PAGES:
+            diff.append(f"{locale}.{section}: no page is mapped to this section")
+            continue
+        page = load_page(SECTION_PAGES[section].format(locale=locale))
+        for key, expected in keys.items():
+            check = CHECKS[section].get(key)
+            if check is None:
+                diff.append(f"{locale}.{section}.{key}: no check is defined")
+                continue
+            displayed = _read(page, check)
+            if displayed is None:
+                diff.append(f"{locale}.{section}.{key}: element was not found")
+            elif not _matches(check, displayed, expected):
+                diff.append(
+                    f"{locale}.{section}.{key}: expected {expected!r}, "
+                    f"displayed {displayed!r}"
+                )
+    return diff
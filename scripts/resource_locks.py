@@ -0,0 +1,139 @@
+"""Named locks shared by the xdist workers of a run, so that tests which are serial
+only because they use the same account or addon can run in parallel with tests
+using other resources. The resources of a test are:
+- those declared with '@pytest.mark.uses(user="rating_user", addon="my_sluggish_slug")'
+- the addon of the 'module_addon' fixture, edited by all the tests of its module
+- for tests marked 'serial', the user of their 'login' or 'create_session' marker
+A 'serial' test without any resources still runs alone, holding an exclusive lock"""
+
+import logging
+import os
+import socket
+import time
+
+import psutil
+import pytest
+
+from scripts.local_db import transaction
+
+DEFAULT_PATH = ".amo-locks.sqlite3"
+# lock held by the serial tests that didn't declare their resources; it can only
+# be taken when no other lock is held and it blocks all the other locks
+EXCLUSIVE = "*"
+
+logger = logging.getLogger(__name__)
+
+
+def resources(item):
+    """Returns the sorted names of the locks the test needs, e.g. 'user:api_user'"""
+    names = set()
+    for marker in item.iter_markers("uses"):
+        for kind, values in marker.kwargs.items():
+            for value in [values] if isinstance(values, str) else values:
+                names.add(f"{kind}:{value}")
+    if "module_addon" in getattr(item, "fixturenames", ()):
+        names.add(f"addon:{item.nodeid.split('::')[0]}")
+    serial = item.get_closest_marker("serial") is not None
+    if serial:
+        for name in ("login", "create_session"):
+            marker = item.get_closest_marker(name)
+            if marker is not None and marker.args:
+                names.add(f"user:{marker.args[0]}")
+    if serial and not names:
+        names.add(EXCLUSIVE)
+    return sorted(names)
+
+
+class ResourceLocks:
+    """All the locks of a test are taken in one transaction, so two tests waiting for
+    the same pair of resources can't deadlock. Locks left behind by a process that
+    is no longer running are dropped when another process wants them"""
+
+    def __init__(self, path=DEFAULT_PATH, timeout=3600, poll_interval=0.5):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.host = socket.gethostname()
+        with transaction(self.path) as db:
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS locks (
+                    name TEXT PRIMARY KEY,
+                    host TEXT NOT NULL,
+                    pid INTEGER NOT NULL,
+                    holder TEXT NOT NULL,
+                    acquired_at REAL NOT NULL
+                )"""
+            )
+
+    def _drop_orphaned(self, db):
+        for name, pid in db.execute(
+            "SELECT name, pid FROM locks WHERE host = ?", (self.host,)
+        ).fetchall():
+            if not psutil.pid_exists(pid):
+                db.execute("DELETE FROM locks WHERE name = ?", (name,))
+
+    def try_acquire(self, names, holder):
+        """Takes all the locks if none of them is held; returns the current
+        holders of the conflicting locks otherwise"""
+        with transaction(self.path) as db:
+            self._drop_orphaned(db)
+            held = dict(db.execute("SELECT name, holder FROM locks").fetchall())
+            if EXCLUSIVE in names:
+                conflicts = set(held.values())
+            else:
+                conflicts = {
+                    held[name] for name in [EXCLUSIVE, *names] if name in held
+                }
+            if conflicts:
+                return conflicts
+            db.executemany(
+                """INSERT INTO locks (name, host, pid, holder, acquired_at)
+                VALUES (?, ?, ?, ?, ?)""",
+                [(name, self.host, os.getpid(), holder, time.time()) for name in names],
+            )
+        return set()
+
+    def acquire(self, names, holder):
+        """Waits until all the locks can be taken"""
+        deadline = time.monotonic() + self.timeout
+        reported = False
+        while True:
+            conflicts = self.try_acquire(names, holder)
+            if not conflicts:
+                return
+            if not reported:
+                logger.info(
+                    "%s is waiting for %s, held by %s", holder, names, sorted(conflicts)
+                )
+                reported = True
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"{holder} could not lock {names} in {self.timeout}s, "
+                    f"they are held by {sorted(conflicts)}"
+                )
+            time.sleep(self.poll_interval)
+
+    def release(self, names):
+        with transaction(self.path) as db:
+            db.executemany(
+                "DELETE FROM locks WHERE name = ? AND host = ? AND pid = ?",
+                [(name, self.host, os.getpid()) for name in names],
+            )
+
+
+class ResourceLockPlugin:
+    """Holds the locks of a test from its setup until its teardown is done"""
+
+    def __init__(self, locks):
+        self.locks = locks
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        names = resources(item)
+        if names:
+            self.locks.acquire(names, item.nodeid)
+        try:
+            yield
+        finally:
+            if names:
+                self.locks.release(names)
@@ -0,0 +1,79 @@
+"""A run-scoped vault holding the authenticated user sessions used in tests.
+Instead of going through the FxA login flow in every test marked with 'login',
+the vault keeps the 'sessionid' obtained for each user account and hands it out
+again for as long as AMO still recognizes it as a valid session"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class SessionVault:
+    """Stores one session per user account for the duration of a test run.
+    Sessions are checked against the accounts profile API before being reused
+    and are dropped from the vault once AMO no longer accepts them. The sessions
+    themselves live in a CredentialStore shared by all the test processes."""
+
+    # number of seconds a successful session check is trusted before
+    # the session is checked again against the profile API
+    VALIDATION_TTL = 300
+
+    def __init__(self, client, store):
+        # the ApiClient the sessions are checked with
+        self.client = client
+        self.store = store
+        self._sessions = {}
+        self._validated_at = {}
+
+    def is_valid(self, sessionid):
+        """Returns True if AMO recognizes the sessionid as an active user session"""
+        return self.client.with_auth(sessionid).get_profile().status_code == 200
+
+    def get(self, user):
+        """Returns a valid sessionid for the user or None if the user needs to log in.
+        Sessions stored by the other test processes are picked up as well"""
+        sessionid = self.store.get(user)
+        if sessionid is None:
+            self.invalidate(user)
+            return None
+        validated_at = self._validated_at.get(user)
+        if (
+            self._sessions.get(user) == sessionid
+            and validated_at
+            and time.monotonic() - validated_at < self.VALIDATION_TTL
+        ):
+            return sessionid
+        if self.is_valid(sessionid):
+            self._sessions[user] = sessionid
+            self._validated_at[user] = time.monotonic()
+            return sessionid
+        logger.info(
+            'The stored session for "%s" has expired; a new login is required', user
+        )
+        self.invalidate(user)
+        self.store.remove(user, sessionid)
+        return None
+
+    def store_session(self, user, sessionid):
+        """Adds a freshly obtained session to the vault and to the shared store"""
+        self._sessions[user] = sessionid
+        self._validated_at[user] = time.monotonic()
+        self.store.put(user, sessionid)
+
+    def acquire(self, user):
+        """Registers a test as a user of the stored session"""
+        return self.store.acquire(user)
+
+    def release(self, user, invalidate=False):
+        """Unregisters a test as a user of the stored session; returns the sessionid
+        if the session needs to be deleted by the caller (see CredentialStore.release)"""
+        sessionid = self.store.release(user, invalidate)
+        if sessionid is not None:
+            self.invalidate(user)
+        return sessionid
+
+    def invalidate(self, user):
+        """Removes the user session from the vault"""
+        self._sessions.pop(user, None)
+        self._validated_at.pop(user, None)
@@ -0,0 +1,56 @@
+"""A module generating the TOTP codes used by the 2FA enabled accounts at login.
+Codes are generated based on the position in the current 30 seconds window and
+every code is reserved before it is used, so that the same code is never sent twice,
+not even by two different xdist workers logging in with the same account"""
+
+import hashlib
+import os
+import tempfile
+import time
+
+import pyotp
+
+# directory shared by all the test processes running on the same machine
+RESERVATIONS_DIR = os.path.join(tempfile.gettempdir(), "amo-release-tests-totp")
+# if the current code expires in less than this many seconds, it is not used anymore
+MIN_REMAINING_SECONDS = 3
+
+
+def _reserve(key, counter):
+    """Atomically marks the code of the given time step as used; returns False if the
+    code had already been reserved by this or by another test process"""
+    os.makedirs(RESERVATIONS_DIR, exist_ok=True)
+    # the authenticator key is never written to disk, only a digest of it
+    key_digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    path = os.path.join(RESERVATIONS_DIR, f"{key_digest}-{counter}")
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    # remove the reservations made for codes that have already expired
+    for name in os.listdir(RESERVATIONS_DIR):
+        digest, _, step = name.partition("-")
+        if digest == key_digest and step.isdigit() and int(step) < counter - 2:
+            try:
+                os.remove(os.path.join(RESERVATIONS_DIR, name))
+            except OSError:
+                pass
+    return True
+
+
+def next_code(key, send_early=True):
+    """Returns an unused TOTP code for the authenticator key. The current code is used
+    when it has enough time left; otherwise the code of the next window is sent early
+    (FxA accepts codes from the adjacent window) or, with 'send_early' disabled,
+    we wait only for the few seconds left until the current window ends"""
+    totp = pyotp.TOTP(key)
+    while True:
+        now = time.time()
+        counter = int(now // totp.interval)
+        remaining = totp.interval - now % totp.interval
+        if remaining >= MIN_REMAINING_SECONDS and _reserve(key, counter):
+            return totp.generate_otp(counter)
+        if send_early and _reserve(key, counter + 1):
+            return totp.generate_otp(counter + 1)
+        print(f"TOTP codes are used up for this window, waiting {remaining:.1f}s")
+        time.sleep(remaining)
@@ -0,0 +1,237 @@
+"""Measures how long the tests spend waiting, in 'WebDriverWait.until' (and
+'until_not') and in 'time.sleep', and where the waits are made, so the sleeps and
+waits that cost the most across a run can be fixed first. For every call site
+(the innermost file:line of the project making the call), the number of calls,
+the total time, the number of polls of the waits and how many waits succeeded on
+their first poll are recorded per test.
+
+Registered with '--profile-waits <path>'. With xdist, the records of each test
+travel to the controller in the test report, which prints the ranked table at the
+end of the run and writes the per test and per call site totals to the file"""
+
+import collections
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+from selenium.webdriver.support.wait import WebDriverWait
+
+DEFAULT_PATH = "wait-profile.json"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+# rows of the table printed at the end of the run
+TOP = 30
+# call site, 'wait' or 'sleep', calls, seconds, polls, waits done on the first poll,
+# waits that failed
+Record = collections.namedtuple(
+    "Record", ["site", "kind", "calls", "seconds", "polls", "first_poll", "failed"]
+)
+
+
+def _call_site():
+    """The innermost project file:line in the stack, outside this module"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(ROOT) and filename != __file__:
+            return f"{os.path.relpath(filename, ROOT)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "<external>"
+
+
+def _merge(totals, record):
+    key = (record.site, record.kind)
+    previous = totals.get(key)
+    if previous is None:
+        totals[key] = Record(*record)
+    else:
+        totals[key] = Record(
+            record.site,
+            record.kind,
+            *(a + b for a, b in zip(previous[2:], record[2:])),
+        )
+
+
+class WaitProfiler:
+    """Patches the waits and sleeps of the process and records the ones made by the
+    main thread while a test runs; waits nested in a wait (including the sleeps
+    between polls) are part of the outer wait"""
+
+    def __init__(self):
+        self.nodeid = None
+        self.records = {}
+        self._local = threading.local()
+        self._originals = None
+
+    def _recording(self):
+        return (
+            self.nodeid is not None
+            and threading.current_thread() is threading.main_thread()
+            and not getattr(self._local, "busy", False)
+        )
+
+    def _measure(self, kind, call, condition=None):
+        if not self._recording():
+            return call() if condition is None else call(condition)
+        site = _call_site()
+        polls = 0
+
+        def counted(driver):
+            nonlocal polls
+            polls += 1
+            return condition(driver)
+
+        self._local.busy = True
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            result = call() if condition is None else call(counted)
+            succeeded = True
+            return result
+        finally:
+            self._local.busy = False
+            _merge(
+                self.records,
+                Record(
+                    site,
+                    kind,
+                    1,
+                    time.perf_counter() - start,
+                    polls,
+                    int(succeeded and polls == 1),
+                    int(not succeeded),
+                ),
+            )
+
+    def install(self):
+        until, until_not, sleep = self._originals = (
+            WebDriverWait.until,
+            WebDriverWait.until_not,
+            time.sleep,
+        )
+        profiler = self
+
+        def profiled_until(wait, method, message=""):
+            return profiler._measure(
+                "wait", lambda method: until(wait, method, message), method
+            )
+
+        def profiled_until_not(wait, method, message=""):
+            return profiler._measure(
+                "wait", lambda method: until_not(wait, method, message), method
+            )
+
+        def profiled_sleep(seconds):
+            return profiler._measure("sleep", lambda: sleep(seconds))
+
+        WebDriverWait.until = profiled_until
+        WebDriverWait.until_not = profiled_until_not
+        time.sleep = profiled_sleep
+
+    def uninstall(self):
+        if self._originals is not None:
+            WebDriverWait.until, WebDriverWait.until_not, time.sleep = self._originals
+            self._originals = None
+
+    def start(self, nodeid):
+        self.nodeid = nodeid
+        self.records = {}
+
+    def stop(self):
+        self.nodeid = None
+        return list(self.records.values())
+
+
+def format_table(totals, top=TOP):
+    """The call sites ranked by the time spent waiting in them"""
+    rows = sorted(totals.values(), key=lambda record: record.seconds, reverse=True)
+    total = sum(record.seconds for record in rows)
+    lines = [
+        f"{total:.1f}s were spent waiting; the call sites waiting the longest were:",
+        f"{'time':>9} {'calls':>6} {'polls':>6} {'1st poll':>8} {'failed':>6}  site",
+    ]
+    for record in rows[:top]:
+        first_poll = (
+            f"{record.first_poll / record.calls:.0%}" if record.kind == "wait" else "-"
+        )
+        lines.append(
+            f"{record.seconds:8.1f}s {record.calls:6} {record.polls:6} "
+            f"{first_poll:>8} {record.failed:6}  {record.site} ({record.kind})"
+        )
+    return "\n".join(lines)
+
+
+class WaitProfilerPlugin:
+    """Registered with '--profile-waits'; the profiler is installed in every process,
+    the records are added up and reported by the controller"""
+
+    def __init__(self, path=DEFAULT_PATH, is_worker=False):
+        self.path = path
+        self.is_worker = is_worker
+        self.profiler = WaitProfiler()
+        self.tests = {}
+        self.totals = {}
+
+    def pytest_configure(self, config):
+        self.profiler.install()
+
+    def pytest_unconfigure(self, config):
+        self.profiler.uninstall()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.profiler.start(item.nodeid)
+        yield
+        self.profiler.stop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        # the records go with the last report of the test, which xdist sends to the
+        # controller along with its user properties
+        if report.when == "teardown" and self.profiler.records:
+            records = [list(record) for record in self.profiler.records.values()]
+            report.user_properties.append(("wait_profile", records))
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_worker:
+            return
+        for name, records in report.user_properties:
+            if name != "wait_profile":
+                continue
+            test = self.tests.setdefault(report.nodeid, {})
+            for record in records:
+                _merge(test, Record(*record))
+                _merge(self.totals, Record(*record))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.totals:
+            return
+        terminalreporter.write_sep("=", "wait profile")
+        terminalreporter.write_line(format_table(self.totals))
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker or not self.totals:
+            return
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "sites": [
+                        record._asdict()
+                        for record in sorted(
+                            self.totals.values(),
+                            key=lambda record: record.seconds,
+                            reverse=True,
+                        )
+                    ],
+                    "tests": {
+                        nodeid: [record._asdict() for record in records.values()]
+                        for nodeid, records in self.tests.items()
+                    },
+                },
+                f,
+                indent=1,
+            )
@@ -0,0 +1,198 @@
+"""Counts and times the WebDriver commands sent by every test, so that the tests and
+page objects spending the most time in geckodriver round trips can be found. Every
+command goes through 'WebDriver.execute' (element calls included), which is
+wrapped on the driver handed out by the 'selenium' fixture; each command is
+attributed to the innermost page object or region method it was sent from.
+
+Registered with '--webdriver-trace <path>': a summary is added to the pytest-html
+report of each test and one JSON line per test is appended to the trace file. Tests
+sending more commands than their budget ('command_budget' marker, or
+'--command-budget' for all tests) fail at teardown. The page objects of a trace can
+be ranked with:
+
+    python -m scripts.webdriver_trace webdriver-trace.jsonl"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+
+import pytest
+
+DEFAULT_PATH = "webdriver-trace.jsonl"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE_OBJECT_DIRS = tuple(
+    os.path.join(ROOT, folder) + os.sep for folder in ("pages", "regions")
+)
+TESTS_DIR = os.path.join(ROOT, "tests") + os.sep
+
+
+def _caller():
+    """Returns 'Class.method' for the innermost page object or region method in the
+    stack, else the name of the test or fixture function the command was sent from"""
+    frame = sys._getframe(2)
+    fallback = "other"
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(PAGE_OBJECT_DIRS):
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return f"{type(owner).__name__}.{frame.f_code.co_name}"
+            module = os.path.splitext(os.path.basename(filename))[0]
+            return f"{module}.{frame.f_code.co_name}"
+        if fallback == "other" and filename.startswith(TESTS_DIR):
+            fallback = frame.f_code.co_name
+        frame = frame.f_back
+    return fallback
+
+
+class CommandTracer:
+    """Records the commands sent by the drivers it is installed on while a test runs"""
+
+    def __init__(self):
+        self.nodeid = None
+        self.commands = []
+
+    def install(self, driver):
+        """Wraps the driver's 'execute'; reused browsers are only wrapped once"""
+        if getattr(driver, "_command_tracer", None) is self:
+            return driver
+        execute = driver.execute
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                if self.nodeid is not None:
+                    self.commands.append(
+                        (driver_command, _caller(), time.perf_counter() - start)
+                    )
+
+        driver.execute = traced_execute
+        driver._command_tracer = self
+        return driver
+
+    def start(self, nodeid):
+        self.nodeid = nodeid
+        self.commands = []
+
+    def stop(self):
+        self.nodeid = None
+
+    def summary(self):
+        """{'commands', 'seconds', 'by_command', 'by_caller'}, where the last two map
+        a command or caller name to [count, seconds]"""
+        by_command = collections.defaultdict(lambda: [0, 0.0])
+        by_caller = collections.defaultdict(lambda: [0, 0.0])
+        for command, caller, seconds in self.commands:
+            for totals, key in ((by_command, command), (by_caller, caller)):
+                totals[key][0] += 1
+                totals[key][1] += seconds
+        return {
+            "commands": len(self.commands),
+            "seconds": round(sum(command[2] for command in self.commands), 3),
+            "by_command": _rounded(by_command),
+            "by_caller": _rounded(by_caller),
+        }
+
+
+def _rounded(totals):
+    return {
+        key: [count, round(seconds, 3)]
+        for key, (count, seconds) in sorted(
+            totals.items(), key=lambda item: item[1][1], reverse=True
+        )
+    }
+
+
+def _html_summary(summary, budget):
+    rows = "".join(
+        f"<tr><td>{caller}</td><td>{count}</td><td>{seconds:.2f}s</td></tr>"
+        for caller, (count, seconds) in list(summary["by_caller"].items())[:15]
+    )
+    limit = f" (budget {budget})" if budget is not None else ""
+    return (
+        f"<p>{summary['commands']} WebDriver commands{limit} took "
+        f"{summary['seconds']:.2f}s</p><table><tr><th>Sent from</th><th>Commands</th>"
+        f"<th>Time</th></tr>{rows}</table>"
+    )
+
+
+class WebDriverTracePlugin:
+    """Registered with '--webdriver-trace'; the 'selenium' fixture installs the
+    tracer on its driver. Every xdist worker appends to the same trace file"""
+
+    def __init__(self, path=DEFAULT_PATH, default_budget=None):
+        self.path = path
+        self.default_budget = default_budget
+        self.tracer = CommandTracer()
+
+    def budget(self, item):
+        marker = item.get_closest_marker("command_budget")
+        return marker.args[0] if marker else self.default_budget
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.tracer.start(item.nodeid)
+        yield
+        self.tracer.stop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if not self.tracer.commands:
+            return
+        budget = self.budget(item)
+        summary = self.tracer.summary()
+        pytest_html = item.config.pluginmanager.getplugin("html")
+        if report.when == "call" and pytest_html is not None:
+            extra = getattr(report, "extra", [])
+            extra.append(pytest_html.extras.html(_html_summary(summary, budget)))
+            report.extra = extra
+        if report.when != "teardown":
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"nodeid": item.nodeid, "budget": budget, **summary}))
+            f.write("\n")
+        if budget is not None and summary["commands"] > budget and report.passed:
+            report.outcome = "failed"
+            report.longrepr = (
+                f"{summary['commands']} WebDriver commands were sent, over the budget "
+                f"of {budget}; most were sent from {next(iter(summary['by_caller']))}"
+            )
+
+
+def rank(paths, by="caller"):
+    """Adds up the commands of the traced tests by caller ('Class.method') or by
+    page object class ('class'); returns (name, count, seconds) by time spent"""
+    totals = collections.defaultdict(lambda: [0, 0.0])
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                for caller, (count, seconds) in json.loads(line)["by_caller"].items():
+                    name = caller.split(".")[0] if by == "class" else caller
+                    totals[name][0] += count
+                    totals[name][1] += seconds
+    return sorted(
+        ((name, count, seconds) for name, (count, seconds) in totals.items()),
+        key=lambda row: row[2],
+        reverse=True,
+    )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_PATH])
+    parser.add_argument("--by", choices=["caller", "class"], default="class")
+    parser.add_argument("--top", type=int, default=20)
+    options = parser.parse_args(args)
+    for name, count, seconds in rank(options.paths, options.by)[: options.top]:
+        print(f"{seconds:9.2f}s {count:7} commands  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,7 @@
+import hashlib
 import json
-import time
 
 import pytest
-import requests
 
 from api import payloads, api_helpers
 from pages.desktop.frontend.home import Home
@@ -24,12 +23,10 @@ _addon_create = "/api/v5/addons/addon/"
 
 
 @pytest.mark.serial
-def test_unauthenticated_addon_upload(base_url):
+def test_unauthenticated_addon_upload(base_url, api_pool):
     with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            files={"upload": file},
-            data={"channel": "unlisted"},
+        upload = api_pool.post(
+            _upload, files={"upload": file}, data={"channel": "unlisted"}
         )
     assert upload.status_code == 401, f"Actual status code was {upload.status_code}"
     assert (
@@ -38,18 +35,14 @@ def test_unauthenticated_addon_upload(base_url):
 
 
 @pytest.mark.serial
-def test_upload_addon_without_dev_agreement(base_url, selenium):
+def test_upload_addon_without_dev_agreement(base_url, selenium, api_pool):
     """Try to upload add-on with a user that hasn't accepted the dev agreements"""
     amo = Home(selenium, base_url).open().wait_for_page_to_load()
     amo.login("regular_user")
     session_cookie = selenium.get_cookie("sessionid")
+    api_client = api_pool.with_auth(session_cookie["value"])
     with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_cookie["value"]}'},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
+        upload = api_client.upload(file, "unlisted")
     assert upload.status_code == 403, f"Actual status code was {upload.status_code}"
     assert (
         "Please read and accept our Firefox Add-on Distribution Agreement as well as our Review Policies and Rules"
@@ -59,11 +52,10 @@ def test_upload_addon_without_dev_agreement(base_url, selenium):
 
 @pytest.mark.serial
 @pytest.mark.login("api_user")
-def test_bad_authentication_addon_upload(selenium, base_url):
+def test_bad_authentication_addon_upload(selenium, base_url, api_pool):
     with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session q7e50318gibhehbw1gl1k57ofckb4f94"},
+        upload = api_pool.with_auth("q7e50318gibhehbw1gl1k57ofckb4f94").post(
+            _upload,
             files={"upload": file},
             data={"channel": "unlisted"},
         )
@@ -76,27 +68,15 @@ def test_bad_authentication_addon_upload(selenium, base_url):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_crx_archive(base_url, session_auth):
+def test_upload_addon_crx_archive(base_url, api_client):
     """Use a .crx file to upload an addon and make sure the submission is successful"""
     with open("sample-addons/crx_ext.crx", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "unlisted")
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     create_addon.raise_for_status()
     assert (
         create_addon.status_code == 201
@@ -120,40 +100,24 @@ def test_upload_addon_crx_archive(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_unsupported_file_types(base_url, session_auth, file_type):
+def test_upload_addon_unsupported_file_types(base_url, api_client, file_type):
     """Try to upload unsupported archive types or files as extensions; AMO is supporting
     only three file types for addon uploads: .zip, .xpi, .crx"""
     with open(f"sample-addons/{file_type}", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "unlisted")
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    # the processed upload holds the validation messages returned by the API
+    validation = api_client.wait_for_upload_processed(uuid)["validation"]
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-    # get the validation messages returned by the API
-    validation = requests.get(
-        url=f"{base_url}{_upload}{uuid}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
     assert (
         "Unsupported file type, please upload a supported file (.crx, .xpi, .zip)."
-        in validation.json()["validation"]["messages"][0]["message"]
-    ), f'Actual response for "{file_type}" was {validation.json()["validation"]}'
+        in validation["messages"][0]["message"]
+    ), f'Actual response for "{file_type}" was {validation}'
 
 
 @pytest.mark.parametrize(
@@ -169,53 +133,32 @@ def test_upload_addon_unsupported_file_types(base_url, session_auth, file_type):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_with_broken_archives(base_url, session_auth, file_type):
+def test_upload_addon_with_broken_archives(base_url, api_client, file_type):
     """Try to upload an addon with a corrupt or invalid archive and check that the
     validation message identifies them as such; for example, a 'tar' compression
     renamed to look as a 'zip' file should be detected as invalid"""
     with open(f"sample-addons/{file_type}", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "unlisted")
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    # the processed upload holds the validation messages returned by the API
+    validation = api_client.wait_for_upload_processed(uuid)["validation"]
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
-    # get the validation messages returned by the API
-    validation = requests.get(
-        url=f"{base_url}{_upload}{uuid}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
     assert (
         "Invalid or corrupt add-on file."
-        in validation.json()["validation"]["messages"][0]["message"]
-    ), f'Actual response for "{file_type}" was {validation.json()["validation"]}'
+        in validation["messages"][0]["message"]
+    ), f'Actual response for "{file_type}" was {validation}'
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_unlisted_extension(base_url, session_auth):
+def test_upload_unlisted_extension(base_url, session_auth, api_client):
     with open("sample-addons/unlisted-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
+        upload = api_client.upload(file, "unlisted")
     upload.raise_for_status()
     resp = upload.json()
     # print the response for debugging purposes
@@ -224,29 +167,39 @@ def test_upload_unlisted_extension(base_url, session_auth):
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
     data = {"version": {"upload": uuid}}
-    # sleep to allow the first request to be processed
-    time.sleep(5)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(data),
-    )
+    api_client.wait_for_upload_processed(uuid)
+    create_addon = api_client.create_addon(data)
     create_addon.raise_for_status()
     resp = create_addon.json()
     print(json.dumps(resp, indent=2))
     # verify the addon status ("incomplete" for unlisted)
     assert "incomplete" in resp["status"]
     # get the edit url for the add-on to verify that it was created and visible in devhub
-    r = requests.get(resp["edit_url"], cookies={"sessionid": session_auth}, timeout=10)
+    r = api_client.get(resp["edit_url"], cookies={"sessionid": session_auth})
     assert r.status_code == 200
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_submit_extension_with_invalid_uuid_format(base_url, session_auth):
+def test_upload_extension_built_in_memory(base_url, api_client):
+    """Addons built by 'xpi_builder' are in-memory files without a file descriptor;
+    they are streamed like local files and the digest of what was sent must match
+    the built archive"""
+    manifest = {**payloads.minimal_manifest, "name": "Extension built in memory"}
+    with api_helpers.make_addon(manifest) as file:
+        built_digest = hashlib.sha256(file.getvalue()).hexdigest()
+        upload = api_client.upload(file, "unlisted")
+    upload.raise_for_status()
+    assert (
+        upload.sent_digests["upload"] == built_digest
+    ), f"Sent {upload.sent_digests['upload']}, built {built_digest}"
+    details = api_client.wait_for_upload_processed(upload.json()["uuid"])
+    assert details["valid"], f"Actual validation was {details['validation']}"
+
+
+@pytest.mark.serial
+@pytest.mark.create_session("api_user")
+def test_submit_extension_with_invalid_uuid_format(base_url, api_client):
     """The UUID format doesn't match the expected format for the uuid value"""
     uuid = [
         "some-invalid-uuid",
@@ -256,14 +209,7 @@ def test_submit_extension_with_invalid_uuid_format(base_url, session_auth):
     ]
     for item in uuid:
         data = {"version": {"upload": item}}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(data),
-        )
+        create_addon = api_client.create_addon(data)
         # capture the response details to ease debugging
         print(
             f'For UUID "{item}": Response status is '
@@ -285,19 +231,12 @@ def test_submit_extension_with_invalid_uuid_format(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_submit_extension_with_incorrect_uuid(base_url, session_auth):
+def test_submit_extension_with_incorrect_uuid(base_url, api_client):
     """The UUID format is accepted but there is no valid upload found for the given uuid"""
     uuid = ["d4ce752a971b4a5aafcd175122726431", 12345]
     for item in uuid:
         data = {"version": {"upload": item}}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(data),
-        )
+        create_addon = api_client.create_addon(data)
         print(
             f'For UUID "{item}": Response status is '
             f"{create_addon.status_code}; {create_addon.text}\n"
@@ -320,34 +259,20 @@ def test_submit_extension_with_incorrect_uuid(base_url, session_auth):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_submit_xpi_with_trademark_restricted_user(
-    base_url, session_auth, trademark_name
+    base_url, api_client, trademark_name
 ):
     """Upload an addon that includes the 'Firefox' or 'Mozilla' names;
     regular users are not allowed to submit such addons"""
     # create a minimal manifest with a trademark name
     manifest = {**payloads.minimal_manifest, "name": trademark_name}
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     resp = upload.json()
-    # sleep to allow the upload  request to be processed
-    time.sleep(5)
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -375,36 +300,22 @@ def test_submit_xpi_with_trademark_restricted_user(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_submit_addon_with_reserved_guid(base_url, session_auth, guid):
+def test_submit_addon_with_reserved_guid(base_url, api_client, guid):
     """Upload an addon that has a reserved guid suffix, unavailable for regular users"""
     manifest = {
         **payloads.minimal_manifest,
         "name": "Reserved guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the upload  request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f'For guid "{guid}": response status was {create_addon.status_code}, {create_addon.text}'
@@ -416,7 +327,7 @@ def test_submit_addon_with_reserved_guid(base_url, session_auth, guid):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_duplicate_guid(base_url, session_auth, variables):
+def test_upload_extension_with_duplicate_guid(base_url, api_client, variables):
     """Addon guids are unique and cannot be re-used for new addon submissions"""
     guid = variables["duplicate_guid"]
     # make an add-on with an already existing guid
@@ -425,28 +336,14 @@ def test_upload_extension_with_duplicate_guid(base_url, session_auth, variables)
         "name": "Duplicate guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 409
     ), f"Actual status code was {create_addon.status_code}"
@@ -457,32 +354,20 @@ def test_upload_extension_with_duplicate_guid(base_url, session_auth, variables)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_without_name_in_manifest(base_url, session_auth):
+def test_upload_extension_without_name_in_manifest(base_url, api_client):
     """The 'name' key is mandatory for successful submissions; uploading an
     addon with a manifest that misses a 'name' key should fail"""
     # create a manifest that doesn't include the mandatory 'name' key
     manifest = {**payloads.minimal_manifest}
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
     # we need to inspect the validation results returned by the linter
     # to check if the 'name' field has produced a validation error
-    get_upload_details = requests.get(
-        url=f"{base_url}{_upload}{uuid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
-    error = get_upload_details.json()
+    error = api_client.wait_for_upload_processed(uuid)
     # pull the validation messages and check the 'name' field error
     assert (
         "must have required property 'name'"
@@ -490,14 +375,7 @@ def test_upload_extension_without_name_in_manifest(base_url, session_auth):
     )
     payload = payloads.listed_addon_minimal(uuid)
     # try to upload the add-on without a name anyway; it should fail
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -505,35 +383,21 @@ def test_upload_extension_without_name_in_manifest(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_without_summary(base_url, session_auth):
+def test_upload_extension_without_summary(base_url, api_client):
     """An addon summary is mandatory for successful submissions; uploading an addon without a
     'description' key and no 'summary' included in the JSON payload should fail"""
     # create a minimal manifest, without adding a 'description' field
     manifest = {**payloads.minimal_manifest, "name": "Addon without Summary"}
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
     # try to upload the addon without a summary anyway; it should fail
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -545,7 +409,7 @@ def test_upload_extension_without_summary(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
+def test_upload_extension_with_incorrect_version_number(base_url, api_client):
     """The addon version number is defined in the manifest and needs to follow some naming rules"""
     # create a minimal manifest, with an invalid 'version'
     manifest = {
@@ -553,26 +417,14 @@ def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
         "name": "Addon with invalid version",
         "version": "1abc.1.1a#c",
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     uuid = resp["uuid"]
     # we need to inspect the validation results returned by the linter
     # to check if the 'version' field has produced a validation error
-    get_upload_details = requests.get(
-        url=f"{base_url}{_upload}{uuid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
-    error = get_upload_details.json()
+    error = api_client.wait_for_upload_processed(uuid)
     # check the upload validation results for 'version' field errors
     assert (
         "The version string should be simplified."
@@ -580,14 +432,7 @@ def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
     )
     payload = payloads.listed_addon_minimal(uuid)
     # try to upload the add-on with the invalid version; it should fail
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -595,7 +440,7 @@ def test_upload_extension_with_incorrect_version_number(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_method(base_url, session_auth):
+def test_upload_extension_with_put_method(base_url, api_client):
     """Use the PUT method to create a new addon; unlike POST,
     PUT requires the addon guid to be specified in the request"""
     guid = f"random-guid@{reusables.get_random_string(6)}"
@@ -608,32 +453,18 @@ def test_upload_extension_with_put_method(base_url, session_auth):
         "name": name,
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = {
         **payloads.listed_addon_minimal(uuid),
         "summary": {"en-US": "Addon summary"},
     }
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.put_addon(guid, payload)
     response = create_addon.json()
     print(json.dumps(response, indent=2))
     # check that the addon was created with the guid set
@@ -642,7 +473,7 @@ def test_upload_extension_with_put_method(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_guid_mismatch(base_url, session_auth):
+def test_upload_extension_with_put_guid_mismatch(base_url, api_client):
     """The PUT method requires the same guid to be specified in the manifest and in the request url;
     this test verifies that the submission fails if there is a guid mismatch between the two
     """
@@ -653,29 +484,15 @@ def test_upload_extension_with_put_guid_mismatch(base_url, session_auth):
         "name": "PUT-guid-mismatch",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}mismatch-guid@foobar/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.put_addon("mismatch-guid@foobar", payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -686,31 +503,18 @@ def test_upload_extension_with_put_guid_mismatch(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_no_guid_in_manifest(base_url, session_auth):
+def test_upload_extension_with_put_no_guid_in_manifest(base_url, api_client):
     """The PUT method requires a guid to be specified in the manifest;
     if no guid is specified, the request should fail"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}manifest-no-guid@foobar/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.put_addon("manifest-no-guid@foobar", payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -721,7 +525,7 @@ def test_upload_extension_with_put_no_guid_in_manifest(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_no_guid_in_request(base_url, session_auth):
+def test_upload_extension_with_put_no_guid_in_request(base_url, api_client):
     """The PUT method requires a guid to be specified in the request;
     if no guid is specified in the url, the request should fail"""
     guid = f"random-guid@{reusables.get_random_string(6)}"
@@ -731,28 +535,14 @@ def test_upload_extension_with_put_no_guid_in_request(base_url, session_auth):
         "name": "PUT-no-guid-in-request-url",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.put(_addon_create, json=payload)
     # the request sent is valid with a POST request; with PUT is not accepted
     assert (
         create_addon.status_code == 405
@@ -764,7 +554,7 @@ def test_upload_extension_with_put_no_guid_in_request(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_put_invalid_guid_format(base_url, session_auth):
+def test_upload_extension_with_put_invalid_guid_format(base_url, api_client):
     """Uploading an addon with an invalid guid format should fail the PUT request"""
     guid = f"invalid-{reusables.get_random_string(6)}"  # creates an invalid guid
     manifest = {
@@ -772,40 +562,21 @@ def test_upload_extension_with_put_invalid_guid_format(base_url, session_auth):
         "name": "Invalid guid format",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(5)
     resp = upload.json()
     print(resp)
     uuid = resp["uuid"]
     # check that the upload validation results point at a faulty guid
-    get_upload_details = requests.get(
-        url=f"{base_url}{_upload}{uuid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
-    error = get_upload_details.json()
+    error = api_client.wait_for_upload_processed(uuid)
     assert (
         "/browser_specific_settings/gecko/id"
         in error["validation"]["messages"][0]["instancePath"]
     )
     # try to submit the addon with an invalid guid anyway; it should fail
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.put(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.put_addon(guid, payload)
     assert (
         create_addon.status_code == 404
     ), f"Actual status code was {create_addon.status_code}"
@@ -813,22 +584,16 @@ def test_upload_extension_with_put_invalid_guid_format(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_default_locale_has_no_translations(base_url, session_auth):
+def test_upload_extension_default_locale_has_no_translations(base_url, api_client):
     """Try to upload an addon while setting a 'default_locale' for which there are no
     available translations in the mandatory fields, i.e. 'name' and 'summary'"""
     with open("sample-addons/localizations.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    # sleep to allow the first request to be processed
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     resp = upload.json()
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     slug = reusables.get_random_string(10)
     # set a default locale that doesn't have any translations in the xpi or the request JSON
     payload = {
@@ -836,14 +601,7 @@ def test_upload_extension_default_locale_has_no_translations(base_url, session_a
         "slug": slug,
         "default_locale": "ja",
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -857,33 +615,20 @@ def test_upload_extension_default_locale_has_no_translations(base_url, session_a
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_extension_with_localizations_in_xpi(base_url, session_auth, variables):
+def test_upload_extension_with_localizations_in_xpi(base_url, api_client, variables):
     """Addon translations set in a 'locales' file in the .xpi should be reflected
     in the API response returned after the addon is successfully created"""
     with open("sample-addons/localizations.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    # sleep to allow the first request to be processed
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     resp = upload.json()
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     # set a unique addon slug to make sure we don't run into duplicates
     slug = reusables.get_random_string(10)
     payload = {**payloads.listed_addon_minimal(uuid), "slug": slug}
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     create_addon.raise_for_status()
     response = create_addon.json()
     # verify that the translations from the xpi are reflected in the api response
@@ -894,23 +639,17 @@ def test_upload_extension_with_localizations_in_xpi(base_url, session_auth, vari
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_localized_extension_json_overwrite(base_url, session_auth):
+def test_upload_localized_extension_json_overwrite(base_url, api_client):
     """If an addon with a 'locales' file defined in the .xpi sets different translations
     in the request JSON object, the JSON values should override the locales file from the .xpi
     """
     with open("sample-addons/localizations.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    # sleep to allow the first request to be processed
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     resp = upload.json()
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     # set a unique addon slug to make sure we don't run into duplicates
     slug = reusables.get_random_string(10)
     payload = {
@@ -918,14 +657,7 @@ def test_upload_localized_extension_json_overwrite(base_url, session_auth):
         "slug": slug,
         "default_locale": "en-US",
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     create_addon.raise_for_status()
     response = create_addon.json()
     # verify that xpi translations have been overwritten by the JSON payload translations
@@ -936,7 +668,7 @@ def test_upload_localized_extension_json_overwrite(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_addon_with_guid_from_deleted_addon(base_url, session_auth):
+def test_upload_addon_with_guid_from_deleted_addon(base_url, api_client):
     """Create an addon, delete it and then try to reuse the GUID to submit a
     new addon; the request should fail since GUIDs cannot be reused"""
     guid = f"reused-guid@{reusables.get_random_string(6)}"
@@ -946,66 +678,34 @@ def test_upload_addon_with_guid_from_deleted_addon(base_url, session_auth):
         "name": "Reuse GUID of deleted addon",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
     # upload the addon with the custom GUID for the first time
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "unlisted")
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 200,
         f"Upload response: status code = {create_addon.status_code}; message: {create_addon.text}",
     )
     # get the token that would allow the actual delete request to be sent
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{guid}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = api_client.get_delete_confirm(guid)
     token = get_delete_confirm.json()["delete_confirm"]
     # delete the addon and verify that the delete request was successful
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
-    )
+    delete_addon = api_client.delete_addon(guid, token)
     assert (
         delete_addon.status_code == 204
     ), f"Actual response: {delete_addon.status_code}, {delete_addon.text}"
     # upload the addon using the same custom GUID for the second time
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.listed_addon_minimal(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     # verify that the submission fails because it uses a duplicate GUID
     assert (
         create_addon.status_code == 409
@@ -1017,35 +717,23 @@ def test_upload_addon_with_guid_from_deleted_addon(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_theme(base_url, session_auth):
+def test_upload_theme(base_url, api_client):
     with open("sample-addons/theme.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-        time.sleep(5)
+        upload = api_client.upload(file, "listed")
         assert (
             upload.status_code == 200,
             f"Upload response: status code = {upload.status_code}; message: {upload.text}",
         )
         # get the addon uuid generated after upload
         uuid = upload.json()["uuid"]
+        api_client.wait_for_upload_processed(uuid)
         # set a license type specific for themes
         theme_license = "CC-BY-3.0"
         payload = {
             **payloads.theme_details(uuid, theme_license),
             "slug": f"theme-{reusables.get_random_string(10)}",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         assert (
             create_addon.status_code == 200,
             f"Upload response: status code = {create_addon.status_code}; message: {create_addon.text}",
@@ -1056,33 +744,21 @@ def test_upload_theme(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_theme_with_wrong_license(base_url, session_auth):
+def test_upload_theme_with_wrong_license(base_url, api_client):
     """Try to upload a theme while using a license that is specific for extensions"""
     with open("sample-addons/theme.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-        time.sleep(5)
+        upload = api_client.upload(file, "listed")
         upload.raise_for_status()
         # get the addon uuid generated after upload
         uuid = upload.json()["uuid"]
+        api_client.wait_for_upload_processed(uuid)
         # set a license slug that is allowed only for extension submissions
         ext_license = "MPL-2.0"
         payload = {
             **payloads.theme_details(uuid, ext_license),
             "slug": f"theme-{reusables.get_random_string(10)}",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         assert (
             create_addon.status_code == 400
         ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1092,32 +768,21 @@ def test_upload_theme_with_wrong_license(base_url, session_auth):
 
 
 @pytest.mark.serial
-def test_upload_language_pack_unauthorized_user(selenium, base_url):
+def test_upload_language_pack_unauthorized_user(selenium, base_url, api_pool):
     """Users not part of the language pack submission group are not allowed to submit langpacks"""
     # get the sessionid for a regular user
     page = Home(selenium, base_url).open().wait_for_page_to_load()
     page.login("developer")
     session_auth = selenium.get_cookie("sessionid")
+    api_client = api_pool.with_auth(session_auth["value"])
     with open("sample-addons/lang-pack.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_auth["value"]}'},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.lang_tool_details(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f'Session {session_auth["value"]}',
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1128,28 +793,16 @@ def test_upload_language_pack_unauthorized_user(selenium, base_url):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_language_pack_with_authorized_user(base_url, session_auth):
+def test_upload_language_pack_with_authorized_user(base_url, api_client):
     """Upload a langpack with a user that belongs to the language pack submissions group"""
     with open("sample-addons/lang-pack.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = payloads.lang_tool_details(uuid)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 201
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1160,31 +813,19 @@ def test_upload_language_pack_with_authorized_user(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_language_pack_incorrect_category(base_url, session_auth):
+def test_upload_language_pack_incorrect_category(base_url, api_client):
     """Language packs only accept 'general' as a category value; other values should fail"""
     with open("sample-addons/lang-pack.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = {
         **payloads.lang_tool_details(uuid),
         "categories": {"firefox": ["bookmarks"]},
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1195,28 +836,16 @@ def test_upload_language_pack_incorrect_category(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_privileged_addon_with_unauthorized_account(base_url, session_auth):
+def test_upload_privileged_addon_with_unauthorized_account(base_url, api_client):
     """Upload an addon signed with a mozilla signature using an unauthorized account"""
     with open("sample-addons/mozilla-signed.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
+        upload = api_client.upload(file, "unlisted")
         upload.raise_for_status()
         # get the addon uuid generated after upload
         uuid = upload.json()["uuid"]
+        api_client.wait_for_upload_processed(uuid)
         payload = {**payloads.listed_addon_minimal(uuid)}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         assert (
             create_addon.status_code == 400
         ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1225,29 +854,18 @@ def test_upload_privileged_addon_with_unauthorized_account(base_url, session_aut
 
 @pytest.mark.serial
 @pytest.mark.login("staff_user")
-def test_upload_privileged_addon_with_authorized_account(selenium, base_url):
+def test_upload_privileged_addon_with_authorized_account(selenium, base_url, api_pool):
     """Upload an addon signed with a mozilla signature using an account holding the right permissions"""
     session_auth = selenium.get_cookie("sessionid")
+    api_client = api_pool.with_auth(session_auth["value"])
     with open("sample-addons/mozilla-signed.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_auth["value"]}'},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
+        upload = api_client.upload(file, "unlisted")
         upload.raise_for_status()
         # get the addon uuid generated after upload
         uuid = upload.json()["uuid"]
+        api_client.wait_for_upload_processed(uuid)
         payload = {**payloads.listed_addon_minimal(uuid)}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f'Session {session_auth["value"]}',
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         assert (
             create_addon.status_code == 201
         ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1262,7 +880,7 @@ def test_upload_privileged_addon_with_authorized_account(selenium, base_url):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_upload_addon_with_reserved_guid_authorized_account(base_url, session_auth):
+def test_upload_addon_with_reserved_guid_authorized_account(base_url, api_client):
     """Upload an addon with a reserved guid using an account that holds the right permissions"""
     # create a restricted GUID
     guid = f"{reusables.get_random_string(10)}@mozilla.org"
@@ -1271,27 +889,14 @@ def test_upload_addon_with_reserved_guid_authorized_account(base_url, session_au
         "name": "Reserved guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "unlisted")
         upload.raise_for_status()
         # get the addon uuid generated after upload
         uuid = upload.json()["uuid"]
+        api_client.wait_for_upload_processed(uuid)
         payload = {**payloads.listed_addon_minimal(uuid)}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         assert (
             create_addon.status_code == 201
         ), f"Actual response: {create_addon.status_code}, {create_addon.text}"
@@ -1302,7 +907,7 @@ def test_upload_addon_with_reserved_guid_authorized_account(base_url, session_au
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
 def test_upload_addon_with_trademark_name_authorized_account(
-    selenium, base_url, session_auth
+    selenium, base_url, api_client
 ):
     """Upload an addon that includes the 'Firefox' trademark name with a user that holds the right permissions"""
     # create an addon with a trademark name
@@ -1311,26 +916,13 @@ def test_upload_addon_with_trademark_name_authorized_account(
         **payloads.minimal_manifest,
         "name": addon_name,
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-        time.sleep(5)
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "unlisted")
         upload.raise_for_status()
         uuid = upload.json()["uuid"]
+        api_client.wait_for_upload_processed(uuid)
         payload = payloads.listed_addon_minimal(uuid)
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         # verify that the addon was created successfully
         assert (
             create_addon.status_code == 201
@@ -1340,20 +932,15 @@ def test_upload_addon_with_trademark_name_authorized_account(
 
 @pytest.mark.serial
 @pytest.mark.skip(reason= "skip, need to update the user")
-def test_upload_addon_restricted_user(selenium, base_url):
+def test_upload_addon_restricted_user(selenium, base_url, api_pool):
     """Try to upload an addon with a user that is on the restricted list for addon submissions"""
     # get the sessionid for a regular user
     page = Home(selenium, base_url).open().wait_for_page_to_load()
     page.login("restricted_user")
     session_auth = selenium.get_cookie("sessionid")
+    api_client = api_pool.with_auth(session_auth["value"])
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f'Session {session_auth["value"]}'},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "unlisted")
     assert (
         "The email address used for your account is not allowed for submissions."
         in upload.text
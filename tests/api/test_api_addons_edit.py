@@ -1,17 +1,16 @@
 import json
-import time
 
 import pytest
-import requests
 
 from api import payloads, api_helpers
 from pages.desktop.frontend.home import Home
 from scripts import reusables
 
 # endpoints used in the addon edit tests
-_upload = "/api/v5/addons/upload/"
 _addon_create = "/api/v5/addons/addon/"
 
+# the tests using 'module_addon' edit the same addon of this module, in order
+
 # These tests are covering various valid and invalid scenarios for editing
 # listed addon details such as: name, slug, summary, description, categories,
 # homepage, support site, support email, visibility, contribution urls, tags.
@@ -27,14 +26,9 @@ _addon_create = "/api/v5/addons/addon/"
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_listed_extension_tc_id_c4369(base_url, session_auth):
+def test_upload_listed_extension_tc_id_c4369(base_url, api_client):
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+        upload = api_client.upload(file, "listed")
     resp = upload.json()
     print(json.dumps(resp, indent=2))
     upload.raise_for_status()
@@ -42,36 +36,23 @@ def test_upload_listed_extension_tc_id_c4369(base_url, session_auth):
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
     payload = payloads.listed_addon_details(uuid)
-    # sleep to allow the first request to be processed
-    time.sleep(10)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    api_client.wait_for_upload_processed(uuid)
+    create_addon = api_client.create_addon(payload)
     print(create_addon)
     create_addon.raise_for_status()
     response = create_addon.json()
     print(json.dumps(response, indent=2))
     # verify that the data we sent has been registered correctly in the response we get
     api_helpers.verify_addon_response_details(payload, response, "create")
+    # the edit tests use an addon of their own, so this one can be deleted
+    api_client.delete_addon(response["id"]).raise_for_status()
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_listed_addon_details(base_url, session_auth):
+def test_edit_listed_addon_details(base_url, api_client, module_addon):
     payload = payloads.edit_addon_details
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}my_sluggish_slug/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = api_client.edit_addon(module_addon(), payload)
     edit_addon.raise_for_status()
     response = edit_addon.json()
     print(json.dumps(response, indent=2))
@@ -81,21 +62,15 @@ def test_edit_listed_addon_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_add_invalid_categories(base_url, session_auth):
+def test_extension_add_invalid_categories(base_url, api_client):
     """Try to upload an addon that has invalid android categories set in the JSON payload"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     invalid_android_catg = ["", 123, None]
     for item in invalid_android_catg:
         payload = {
@@ -103,14 +78,7 @@ def test_extension_add_invalid_categories(base_url, session_auth):
             "categories": [item],
             "slug": "invalid-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         print(
             f'For android category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -123,21 +91,15 @@ def test_extension_add_invalid_categories(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_one_category_and_other_category(base_url, session_auth):
+def test_extension_one_category_and_other_category(base_url, api_client):
     """Try to upload an addon that has invalid android categories set in the JSON payload"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     invalid_android_catg = ["Appearance"]
     for item in invalid_android_catg:
         payload = {
@@ -145,14 +107,7 @@ def test_extension_one_category_and_other_category(base_url, session_auth):
             "categories": ["Other", item],
             "slug": "invalid-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         print(
             f'For android category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -165,21 +120,15 @@ def test_extension_one_category_and_other_category(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_add_invalid_firefox_categories(base_url, session_auth):
+def test_extension_add_invalid_firefox_categories(base_url, api_client):
     """Try to upload an addon that has invalid firefox categories set in the JSON payload"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     invalid_firefox_catg = ["fashion", "security-privacy", "", 12.3]
     for item in invalid_firefox_catg:
         payload = {
@@ -187,14 +136,7 @@ def test_extension_add_invalid_firefox_categories(base_url, session_auth):
             "categories": {"android": ["performance"], "firefox": [item]},
             "slug": "invalid-firefox-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         print(
             f'For firefox category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -208,21 +150,15 @@ def test_extension_add_invalid_firefox_categories(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_other_category_is_standalone(base_url, session_auth):
+def test_extension_other_category_is_standalone(base_url, api_client):
     """Extensions with a category set to 'other' cannot have another category set"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     payload = {
         **payloads.listed_addon_details(uuid),
         "categories": {
@@ -231,14 +167,7 @@ def test_extension_other_category_is_standalone(base_url, session_auth):
         },
         "slug": "other-category",
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.create_addon(payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -250,33 +179,20 @@ def test_extension_other_category_is_standalone(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_invalid_slug(base_url, session_auth):
+def test_extension_invalid_slug(base_url, api_client):
     """Addon slugs can be composed only from letters and numbers"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     invalid_slugs = [102030, "---", "?name", "@#_" ")(", None]
     for item in invalid_slugs:
         # crete a new dictionary from the original payload, with invalid slug values
         payload = {**payloads.listed_addon_details(uuid), "slug": item}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.create_addon(payload)
         print(
             f'For slug "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -296,21 +212,14 @@ def test_extension_invalid_slug(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_duplicate_slug(base_url, session_auth, variables):
+def test_edit_extension_duplicate_slug(base_url, api_client, variables, module_addon):
     """Use a slug that already belongs to another addon"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     payload = {
         **payloads.edit_addon_details,
         "slug": variables["approved_addon_with_sources"],
     }
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = api_client.edit_addon(addon, payload)
     assert (
         edit_addon.status_code == 400
     ), f"Actual status code was {edit_addon.status_code}"
@@ -321,21 +230,14 @@ def test_edit_extension_duplicate_slug(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_name(base_url, session_auth):
+def test_edit_extension_invalid_name(base_url, api_client, module_addon):
     """Addon names are required to have at least one letter or number character to be valid"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     invalid_names = ["", ".", "****", None]
     for item in invalid_names:
         # crete a new dictionary from the original payload, with invalid name values
         payload = {**payloads.edit_addon_details, "name": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For name "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -371,19 +273,14 @@ def test_edit_extension_invalid_name(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_with_trademark_in_name(base_url, session_auth, trademark_name):
+def test_edit_extension_with_trademark_in_name(
+    base_url, api_client, trademark_name, module_addon
+):
     """Verifies that addon names can't be edited to include a Mozilla or Firefox trademark"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # crete a new dictionary from the original payload, with variable name values
     name = {**payloads.edit_addon_details, "name": {"en-US": trademark_name}}
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(name),
-    )
+    edit_addon = api_client.edit_addon(addon, name)
     print(
         f'For name "{trademark_name}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
     )
@@ -399,22 +296,15 @@ def test_edit_extension_with_trademark_in_name(base_url, session_auth, trademark
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_summary(base_url, session_auth):
+def test_edit_extension_invalid_summary(base_url, api_client, module_addon):
     """Addon summaries need to be in string format and below 250 characters"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     over_250_summary = reusables.get_random_string(251)
     summaries = ["", over_250_summary, None]
     # crete a new dictionary from the original payload, with invalid summary values
     for item in summaries:
         payload = {**payloads.edit_addon_details, "summary": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For summary "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -439,9 +329,9 @@ def test_edit_extension_invalid_summary(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_homepage(base_url, session_auth):
+def test_edit_extension_invalid_homepage(base_url, api_client, module_addon):
     """Try to add some invalid and unaccepted homepage urls for an addon"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     invalid_homepage = [
         "",
         ".",
@@ -454,14 +344,7 @@ def test_edit_extension_invalid_homepage(base_url, session_auth):
     for item in invalid_homepage:
         # crete a new dictionary from the original payload, with variable homepage values
         homepage = {**payloads.edit_addon_details, "homepage": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(homepage),
-        )
+        edit_addon = api_client.edit_addon(addon, homepage)
         print(
             f'For homepage "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -487,21 +370,14 @@ def test_edit_extension_invalid_homepage(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_support_email(base_url, session_auth):
+def test_edit_extension_invalid_support_email(base_url, api_client, module_addon):
     """Try to add some invalid and unaccepted emails for an addon"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     invalid_email = ["", ".", "abc123", "mail.com", "abc@defg", 123, None]
     for item in invalid_email:
         # crete a new dictionary from the original payload, with variable email values
         email = {**payloads.edit_addon_details, "support_email": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(email),
-        )
+        edit_addon = api_client.edit_addon(addon, email)
         print(
             f'For email "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -526,9 +402,11 @@ def test_edit_extension_invalid_support_email(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth):
+def test_edit_extension_invalid_experimental_and_payment(
+    base_url, api_client, module_addon
+):
     """Try to set the 'experimental' and 'requires_payment' fields to other values than boolean"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # 'is_experimental' and 'requires_payment' can only be True or False
     invalid_values = ["", "abc123", None, 123]
     for item in invalid_values:
@@ -538,14 +416,7 @@ def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth)
             "is_experimental": item,
             "requires_payment": item,
         }
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For email "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -565,9 +436,9 @@ def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_valid_contribute_domains(base_url, session_auth):
+def test_edit_extension_valid_contribute_domains(base_url, api_client, module_addon):
     """Add a valid contributions url to an addon; requests should be successful"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     valid_domains = [
         "https://buymeacoffee.com",
         "https://donate.mozilla.org",
@@ -584,14 +455,7 @@ def test_edit_extension_valid_contribute_domains(base_url, session_auth):
     for item in valid_domains:
         # crete a new dictionary from the original payload, with variable domain values
         payload = {**payloads.edit_addon_details, "contributions_url": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For domain "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -602,10 +466,12 @@ def test_edit_extension_valid_contribute_domains(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_contribute_domains(base_url, session_auth, variables):
+def test_edit_extension_invalid_contribute_domains(
+    base_url, api_client, variables, module_addon
+):
     """Set an invalid or an unaccepted value as the addon's contribution url;
     accepted domains are predefined and must all start with 'https'"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     invalid_domains = [
         "",
         123,
@@ -619,14 +485,7 @@ def test_edit_extension_invalid_contribute_domains(base_url, session_auth, varia
     for item in invalid_domains:
         # crete a new dictionary from the original payload, with variable domain values
         payload = {**payloads.edit_addon_details, "contributions_url": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For domain "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -658,23 +517,16 @@ def test_edit_extension_invalid_contribute_domains(base_url, session_auth, varia
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_addon_tags(base_url, session_auth):
+def test_edit_extension_invalid_addon_tags(base_url, api_client, module_addon):
     """Try to set some invalid or unaccepted tags to an addon; valid tags are predefined"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # set some invalid or combinations of invalid tags; for example,
     # a combination of a valid and an invalid tag should not be accepted
     invalid_tags = [["", "abc123"], None, [123, "search"], True]
     for item in invalid_tags:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "tags": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For tags "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -709,15 +561,11 @@ def test_edit_extension_invalid_addon_tags(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_valid_icon(base_url, session_auth, icon):
+def test_edit_extension_add_valid_icon(base_url, api_client, icon, module_addon):
     """Upload a custom icon for an addon; JPG and PNG are the only accepted formats"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     with open(icon, "rb") as img:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"icon": img},
-        )
+        edit_addon = api_client.upload_icon(addon, img)
         print(
             f'For icon "{icon}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -755,17 +603,13 @@ def test_edit_extension_add_valid_icon(base_url, session_auth, icon):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_extension_add_invalid_icons(
-    base_url, session_auth, count, icon, variables
+    base_url, api_client, count, icon, variables, module_addon
 ):
     """Verify that requests fail if icons do not meet these acceptance criteria:
     PNG or JPG, square images, non-animated images, valid image file"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     with open(icon, "rb") as img:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"icon": img},
-        )
+        edit_addon = api_client.upload_icon(addon, img)
         print(
             f'For icon "{icon}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -791,18 +635,14 @@ def test_edit_extension_add_invalid_icons(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_valid_screenshots(base_url, session_auth, count, preview):
+def test_edit_extension_add_valid_screenshots(
+    base_url, api_client, count, preview, module_addon
+):
     """Set valid preview images for an addon; only JPG and JPG formats are accepted"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     with open(preview, "rb") as img:
-        edit_addon = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/previews/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"image": img},
-            data={
-                "position": count
-            },  # sets the order in which the previews should appear
-        )
+        # the position sets the order in which the previews should appear
+        edit_addon = api_client.add_preview(addon, img, position=count)
         print(
             f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -816,29 +656,19 @@ def test_edit_extension_add_valid_screenshots(base_url, session_auth, count, pre
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_previews_add_caption(base_url, session_auth):
+def test_edit_extension_previews_add_caption(base_url, api_client, module_addon):
     """Adds a short text for each screenshot uploaded for an addon"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # capture the preview ids to be used in the PATCH request and add them to a list
     previews_id = []
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get_addon(addon)
     r = get_addon.json()
     for image in r["previews"]:
         previews_id.append(image.get("id"))
     payload = payloads.preview_captions
     # add a caption for all the available previews
     for preview in previews_id:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/previews/{preview}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_preview(addon, preview, payload)
         response = edit_addon.json()
         assert (
             edit_addon.json()["caption"] == payload["caption"]
@@ -847,13 +677,10 @@ def test_edit_extension_previews_add_caption(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_no_image_attached(base_url, session_auth):
+def test_edit_extension_no_image_attached(base_url, api_client, module_addon):
     """Send a screenshot upload request without adding an image"""
-    addon = payloads.edit_addon_details["slug"]
-    edit_addon = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/previews/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    edit_addon = api_client.post(f"{_addon_create}{addon}/previews/")
     assert (
         edit_addon.status_code == 400
     ), f"Actual status code was {edit_addon.status_code}"
@@ -882,17 +709,13 @@ def test_edit_extension_no_image_attached(base_url, session_auth):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_extension_add_invalid_image(
-    base_url, session_auth, count, preview, variables
+    base_url, api_client, count, preview, variables, module_addon
 ):
     """Verify that requests fail if images do not meet these acceptance criteria:
     PNG or JPG, non-animated images, valid image file"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     with open(preview, "rb") as img:
-        edit_addon = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/previews/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"image": img},
-        )
+        edit_addon = api_client.add_preview(addon, img)
         print(
             f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -905,54 +728,38 @@ def test_edit_extension_add_invalid_image(
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_delete_previews(base_url, session_auth):
+def test_edit_extension_delete_previews(base_url, api_client, module_addon):
     """Verify that addon previews can be deleted"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # get the preview ids for the available images
     preview_ids = []
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get_addon(addon)
     r = get_addon.json()
     for image in r["previews"]:
         preview_ids.append(image.get("id"))
     for preview_id in preview_ids:
-        delete_image = requests.delete(
-            url=f"{base_url}{_addon_create}{addon}/previews/{preview_id}",
-            headers={"Authorization": f"Session {session_auth}"},
-        )
+        delete_image = api_client.delete_preview(addon, preview_id)
         assert (
             delete_image.status_code == 204
         ), f"Actual status code was {delete_image.status_code}"
     # get the add-on details again
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get_addon(addon)
     # check that there are no screenshots left for this addon
     assert len(get_addon.json()["previews"]) == 0
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_with_translations(base_url, session_auth):
+def test_edit_default_locale_with_translations(base_url, api_client, module_addon):
     """Change the 'default_locale' of the addon to another locale for which we
     already have translations for the mandatory fields - i.e. 'name' and 'summary'"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # list all the addon translations and try to set them as the default locale
     available_translations = ["de", "fr", "ro"]
     for locale in available_translations:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -966,23 +773,18 @@ def test_edit_default_locale_with_translations(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_with_missing_translations(base_url, session_auth):
+def test_edit_default_locale_with_missing_translations(
+    base_url, api_client, module_addon
+):
     """Change the 'default_locale' of the addon to another locale for which we
     don't have translations for all the required fields - i.e. 'homepage', 'email'"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # list some locales for which there are n translations and try to set them as the default locale
     unavailable_translations = ["pl", "pt-BR"]
     for locale in unavailable_translations:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -998,21 +800,14 @@ def test_edit_default_locale_with_missing_translations(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_invalid_values(base_url, session_auth):
+def test_edit_default_locale_invalid_values(base_url, api_client, module_addon):
     """Use some invalid/unaccepted data types for setting a 'default_locale'"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     invalid_locales = ["foo", 123, None, ["de", "fr"], ""]
     for locale in invalid_locales:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.edit_addon(addon, payload)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -1032,23 +827,17 @@ def test_edit_default_locale_invalid_values(base_url, session_auth):
 
 
 @pytest.mark.serial
-def test_edit_addon_with_incorrect_account(base_url, selenium):
+def test_edit_addon_with_incorrect_account(base_url, selenium, api_pool, module_addon):
     """Edit the add-on details while being authenticated with a different, non-owner developer account"""
     amo = Home(selenium, base_url).open().wait_for_page_to_load()
     # login with a user that has no authorship over the addon we want to edit
     amo.login("submissions_user")
     session_cookie = selenium.get_cookie("sessionid")
-    addon = payloads.edit_addon_details["slug"]
+    api_client = api_pool.with_auth(session_cookie["value"])
+    addon = module_addon()
     # crete a new dictionary from the original payload, with a different name values
     payload = {**payloads.edit_addon_details, "name": {"en-US": "some_name"}}
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f'Session {session_cookie["value"]}',
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = api_client.edit_addon(addon, payload)
     assert (
         edit_addon.status_code == 403
     ), f"Actual status code was {edit_addon.status_code}"
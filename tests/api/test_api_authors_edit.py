@@ -1,11 +1,8 @@
-import json
-import requests
 import pytest
 
 from api import payloads
 
-# endpoints used in the version edit tests
-_addon_create = "/api/v5/addons/addon/"
+# the tests using 'module_addon' edit the same addon of this module, in order
 
 # API endpoints covered are:
 # add new author: https://addons-server.readthedocs.io/en/latest/topics/api/authors.html#pending-author-create
@@ -20,19 +17,12 @@ _addon_create = "/api/v5/addons/addon/"
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_new_author(base_url, session_auth, variables):
-    addon = payloads.edit_addon_details["slug"]
+def test_addon_add_new_author(base_url, api_client, variables, module_addon):
+    addon = module_addon()
     author = variables["api_post_valid_author"]
     # create the payload with the fields required for a new author set-up
     payload = {**payloads.author_stats, "user_id": author, "position": 1}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    add_author = api_client.invite_author(addon, payload)
     assert (
         add_author.status_code == 201
     ), f"Actual response: {add_author.status_code}, {add_author.text}"
@@ -42,29 +32,20 @@ def test_addon_add_new_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_author_decline_invitation(base_url, session_auth, variables):
+def test_addon_author_decline_invitation(base_url, api_client, variables, module_addon):
     """With a user that was invited to become an addon author, decline the invitation received"""
-    addon = payloads.edit_addon_details["slug"]
-    decline_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/decline/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    decline_invite = api_client.decline_author_invite(addon)
     assert (
         decline_invite.status_code == 200
     ), f"Actual response: {decline_invite.status_code}, {decline_invite.text}"
     # try to re-decline invitation to make sure only once it's possible and there are no unexpected errors raised
-    redecline_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/decline/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    redecline_invite = api_client.decline_author_invite(addon)
     assert (
         redecline_invite.status_code == 403
     ), f"Actual response: {decline_invite.status_code}, {decline_invite.text}"
     # After having declined an invitation, try to confirm it; this should not be allowed
-    confirm_declined_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    confirm_declined_invite = api_client.confirm_author_invite(addon)
     assert (
         confirm_declined_invite.status_code == 403
     ), f"Actual response: {decline_invite.status_code}, {decline_invite.text}"
@@ -72,19 +53,14 @@ def test_addon_author_decline_invitation(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_author_without_display_name(base_url, session_auth, variables):
+def test_addon_add_author_without_display_name(
+    base_url, api_client, variables, module_addon
+):
     """It is mandatory for a user to have a display name set in order to be accepted as an addon author"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_author_no_display_name"]
     payload = {"user_id": author, "position": 2}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    add_author = api_client.invite_author(addon, payload)
     assert (
         add_author.status_code == 400
     ), f"Actual response: {add_author.status_code}, {add_author.text}"
@@ -96,19 +72,12 @@ def test_addon_add_author_without_display_name(base_url, session_auth, variables
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_restricted_author(base_url, session_auth, variables):
+def test_addon_add_restricted_author(base_url, api_client, variables, module_addon):
     """If a user is added to the email restriction list, it is not possible to add it as an addon author"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_author_no_dev_agreement"]
     payload = {"user_id": author, "position": 2}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    add_author = api_client.invite_author(addon, payload)
     assert (
         add_author.status_code == 400
     ), f"Actual response {add_author.status_code}, {add_author.text}"
@@ -120,18 +89,11 @@ def test_addon_add_restricted_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_add_invalid_authors(base_url, session_auth, variables):
+def test_addon_add_invalid_authors(base_url, api_client, variables, module_addon):
     """Try to add a non exiting user as an addon author"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     payload = {**payloads.author_stats, "user_id": 9999999999, "position": 2}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    add_author = api_client.invite_author(addon, payload)
     assert (
         add_author.status_code == 400
     ), f"Actual response {add_author.status_code}, {add_author.text}"
@@ -142,27 +104,19 @@ def test_addon_add_invalid_authors(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_confirm_invitation_with_wrong_user(base_url, session_auth, variables):
+def test_addon_confirm_invitation_with_wrong_user(
+    base_url, api_client, variables, module_addon
+):
     """Send an author invitation to a user and try to confirm the invite with a different user"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
     payload = {**payloads.author_stats, "user_id": author, "position": 1}
-    add_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    add_author = api_client.invite_author(addon, payload)
     assert (
         add_author.status_code == 201
     ), f"Actual response {add_author.status_code}, {add_author.text}"
     # confirm invitation with a user different from the one invited
-    confirm_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    confirm_invite = api_client.confirm_author_invite(addon)
     assert (
         confirm_invite.status_code == 403
     ), f"Actual response: {confirm_invite.status_code}, {confirm_invite.text}"
@@ -170,30 +124,26 @@ def test_addon_confirm_invitation_with_wrong_user(base_url, session_auth, variab
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_list_pending_authors(base_url, session_auth, variables):
+def test_addon_list_pending_authors(base_url, api_client, variables, module_addon):
     """Check that users invited to become addon authors are listed in the pending authors queue"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # this is the author that should be pending for confirmation
     author = variables["api_post_valid_author"]
-    get_pending_authors = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_pending_authors = api_client.list_pending_authors(addon)
     get_pending_authors.raise_for_status()
     assert author == get_pending_authors.json()[0].get("user_id")
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_get_pending_author_details(base_url, session_auth, variables):
+def test_addon_get_pending_author_details(
+    base_url, api_client, variables, module_addon
+):
     """Check that the author details (role, position, visibility) set up in the request
     are returned in the pending author details API"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
-    get_pending_author_details = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_pending_author_details = api_client.get_pending_author(addon, author)
     get_pending_author_details.raise_for_status()
     pending_author = get_pending_author_details.json()
     # check that the author details match the actual author that is currently pending
@@ -204,20 +154,13 @@ def test_addon_get_pending_author_details(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_edit_pending_author(base_url, session_auth, variables):
+def test_addon_edit_pending_author(base_url, api_client, variables, module_addon):
     """As the user who initiated the author request, edit the details (role, visibility) of
     the invite and make sure that the changes are applied correctly"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
     payload = {"role": "owner", "listed": True}
-    edit_pending_author_details = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_pending_author_details = api_client.edit_pending_author(addon, author, payload)
     edit_pending_author_details.raise_for_status()
     pending_author = edit_pending_author_details.json()
     # check that the author details have been updated
@@ -228,15 +171,12 @@ def test_addon_edit_pending_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_delete_pending_author(base_url, session_auth, variables):
+def test_addon_delete_pending_author(base_url, api_client, variables, module_addon):
     """As the user who initiated the author request, delete the invite before the
     new author had the chance to confirm it"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
-    delete_pending_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    delete_pending_author = api_client.delete_pending_author(addon, author)
     assert (
         delete_pending_author.status_code == 204
     ), f"Actual response: {delete_pending_author.status_code}, {delete_pending_author.text}"
@@ -244,13 +184,12 @@ def test_addon_delete_pending_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_author_confirm_deleted_invitation(base_url, session_auth, variables):
+def test_addon_author_confirm_deleted_invitation(
+    base_url, api_client, variables, module_addon
+):
     """With the author that was invited, try to accept the deleted invite to make sure it is not possible"""
-    addon = payloads.edit_addon_details["slug"]
-    confirm_deleted_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    confirm_deleted_invite = api_client.confirm_author_invite(addon)
     assert (
         confirm_deleted_invite.status_code == 403
     ), f"Actual response: {confirm_deleted_invite.status_code}, {confirm_deleted_invite.text}"
@@ -258,43 +197,26 @@ def test_addon_author_confirm_deleted_invitation(base_url, session_auth, variabl
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_invite_multiple_authors(base_url, session_auth, variables):
+def test_addon_invite_multiple_authors(base_url, api_client, variables, module_addon):
     """Check that an addon owner can invite multiple users to become addon authors
     in addition to the one added previously"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # invite the first author
     first_author = variables["api_post_valid_author"]
     payload = {**payloads.author_stats, "user_id": first_author, "position": 1}
-    first_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    first_invite = api_client.invite_author(addon, payload)
     assert (
         first_invite.status_code == 201
     ), f"Actual response: {first_invite.status_code}, {first_invite.text}"
     # invite the second author
     second_author = variables["api_post_additional_author"]
     payload = {**payloads.author_stats, "user_id": second_author, "position": 2}
-    second_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    second_invite = api_client.invite_author(addon, payload)
     assert (
         second_invite.status_code == 201
     ), f"Actual response: {second_invite.status_code}, {second_invite.text}"
     # verify that both users are present in the pending authors list
-    get_pending_authors = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_pending_authors = api_client.list_pending_authors(addon)
     print("First author is: " + str(get_pending_authors.json()[0].get("user_id")))
     print("Second author is: " + str(get_pending_authors.json()[1].get("user_id")))
     print("Get_Pending_Authors: " + str(get_pending_authors.json()))
@@ -304,19 +226,12 @@ def test_addon_invite_multiple_authors(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_invite_same_author_twice(base_url, session_auth, variables):
+def test_addon_invite_same_author_twice(base_url, api_client, variables, module_addon):
     """Check that an author can only be invited once, if the invitation is still active"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_additional_author"]
     payload = {**payloads.author_stats, "user_id": author, "position": 2}
-    duplicate_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    duplicate_invite = api_client.invite_author(addon, payload)
     assert (
         duplicate_invite.status_code == 400
     ), f"Actual response: {duplicate_invite.status_code}, {duplicate_invite.text}"
@@ -327,20 +242,16 @@ def test_addon_invite_same_author_twice(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_confirm_invitation_with_correct_user(base_url, session_auth, variables):
-    addon = payloads.edit_addon_details["slug"]
-    accept_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+def test_addon_confirm_invitation_with_correct_user(
+    base_url, api_client, variables, module_addon
+):
+    addon = module_addon()
+    accept_invite = api_client.confirm_author_invite(addon)
     assert (
         accept_invite.status_code == 200
     ), f"Actual response: {accept_invite.status_code}, {accept_invite.text}"
     # try to re-confirm invitation to make sure only once it's possible and there are no unexpected errors
-    reconfirm_invite = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    reconfirm_invite = api_client.confirm_author_invite(addon)
     assert (
         reconfirm_invite.status_code == 403
     ), f"Actual response {reconfirm_invite.status_code}, {reconfirm_invite.text}"
@@ -348,21 +259,16 @@ def test_addon_confirm_invitation_with_correct_user(base_url, session_auth, vari
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_add_authors(base_url, session_auth, variables):
+def test_addon_developer_role_cannot_add_authors(
+    base_url, api_client, variables, module_addon
+):
     """Check that an author with a 'developer' role doesn't have the rights to invite other authors
     for an addon; only authors with 'owner' roles have the rights to invite other users
     """
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_additional_author"]
     payload = {**payloads.author_stats, "user_id": author, "position": 3}
-    invite_author = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    invite_author = api_client.invite_author(addon, payload)
     assert (
         invite_author.status_code == 403
     ), f"Actual response: {invite_author.status_code}, {invite_author.text}"
@@ -374,22 +280,15 @@ def test_addon_developer_role_cannot_add_authors(base_url, session_auth, variabl
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
 def test_addon_developer_role_cannot_edit_pending_author(
-    base_url, session_auth, variables
+    base_url, api_client, variables, module_addon
 ):
     """Check that an author with a 'developer' role doesn't have the rights to edit details
     for other pending authors; only authors with 'owner' roles have the rights to make changes
     """
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_additional_author"]
     payload = {"role": "owner", "listed": True}
-    edit_authors = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_authors = api_client.edit_pending_author(addon, author, payload)
     assert (
         edit_authors.status_code == 403
     ), f"Actual response: {edit_authors.status_code}, {edit_authors.text}"
@@ -398,16 +297,13 @@ def test_addon_developer_role_cannot_edit_pending_author(
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
 def test_addon_developer_role_cannot_delete_pending_author(
-    base_url, session_auth, variables
+    base_url, api_client, variables, module_addon
 ):
     """Check that an author with a 'developer' role doesn't have the rights to delete other
     pending authors; only authors with 'owner' roles have the rights to delete them"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_additional_author"]
-    delete_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    delete_author = api_client.delete_pending_author(addon, author)
     assert (
         delete_author.status_code == 403
     ), f"Actual response: {delete_author.status_code}, {delete_author.text}"
@@ -415,15 +311,12 @@ def test_addon_developer_role_cannot_delete_pending_author(
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_list_active_authors(base_url, session_auth, variables):
+def test_addon_list_active_authors(base_url, api_client, variables, module_addon):
     """Verify that the list of active addon authors contains only the confirmed users"""
     addon_owner = variables["api_addon_author_owner"]
     additional_author = variables["api_post_valid_author"]
-    addon = payloads.edit_addon_details["slug"]
-    get_authors = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/authors/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    get_authors = api_client.list_authors(addon)
     response = get_authors.json()
     # we should have only two valid authors for this addon
     assert len(response) == 2
@@ -433,19 +326,12 @@ def test_addon_list_active_authors(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_author_owner_is_required(base_url, session_auth, variables):
+def test_addon_author_owner_is_required(base_url, api_client, variables, module_addon):
     """Try to downgrade the current single addon owner to a developer role.
     The request should fail as an addon requires at least one active owner"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_addon_author_owner"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"role": "developer"}),
-    )
+    edit_author = api_client.edit_author(addon, author, {"role": "developer"})
     assert (
         edit_author.status_code == 400
     ), f"Actual response: {edit_author.status_code}, {edit_author.text}"
@@ -456,18 +342,13 @@ def test_addon_author_owner_is_required(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_one_listed_author_is_required(base_url, session_auth, variables):
+def test_addon_one_listed_author_is_required(
+    base_url, api_client, variables, module_addon
+):
     """Check that an addon needs to have at least one author listed on the site"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_addon_author_owner"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"listed": False}),
-    )
+    edit_author = api_client.edit_author(addon, author, {"listed": False})
     assert (
         edit_author.status_code == 400
     ), f"Actual response: {edit_author.status_code}, {edit_author.text}"
@@ -478,18 +359,11 @@ def test_addon_one_listed_author_is_required(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_change_non_active_author_details(base_url, session_auth):
+def test_addon_change_non_active_author_details(base_url, api_client, module_addon):
     """Try to edit the details of a user that is not listed as an addon author
     and make sure no unexpected errors are raised"""
-    addon = payloads.edit_addon_details["slug"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/0123/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payloads.author_stats),
-    )
+    addon = module_addon()
+    edit_author = api_client.edit_author(addon, "0123", payloads.author_stats)
     assert (
         edit_author.status_code == 404
     ), f"Actual response: {edit_author.status_code}, {edit_author.text}"
@@ -497,17 +371,12 @@ def test_addon_change_non_active_author_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_unauthorized_user_change_author_details(base_url, session_auth, variables):
+def test_unauthorized_user_change_author_details(base_url, api_client, variables):
     """With a user that is not listed as an addon author, try to edit author details
     and make sure no unexpected errors are raised"""
     author = variables["api_post_valid_author"]
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}staff_user_adoon /authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payloads.author_stats),
+    edit_author = api_client.edit_author(
+        variables["staff_user_addon"], author, payloads.author_stats
     )
     assert (
         edit_author.status_code == 403
@@ -516,14 +385,11 @@ def test_unauthorized_user_change_author_details(base_url, session_auth, variabl
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_delete_owner_author(base_url, session_auth, variables):
+def test_addon_delete_owner_author(base_url, api_client, variables, module_addon):
     """Check that the only owner of an addon cannot be deleted"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_addon_author_owner"]
-    delete_owner = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    delete_owner = api_client.delete_author(addon, author)
     assert (
         delete_owner.status_code == 400
     ), f"Actual response: {delete_owner.status_code}, {delete_owner.text}"
@@ -534,20 +400,15 @@ def test_addon_delete_owner_author(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_edit_authors(base_url, session_auth, variables):
+def test_addon_developer_role_cannot_edit_authors(
+    base_url, api_client, variables, module_addon
+):
     """An author with a developer role should not be allowed to edit existing authors,
     like elevating their role to owners for example"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
     # send the patch author requests with the developer role
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"role": "owner"}),
-    )
+    edit_author = api_client.edit_author(addon, author, {"role": "owner"})
     assert (
         edit_author.status_code == 403
     ), f"Actual response: {edit_author.status_code}, {edit_author.text}"
@@ -558,15 +419,14 @@ def test_addon_developer_role_cannot_edit_authors(base_url, session_auth, variab
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_delete_authors(base_url, session_auth, variables):
+def test_addon_developer_role_cannot_delete_authors(
+    base_url, api_client, variables, module_addon
+):
     """An author with a developer role should not be allowed to delete existing authors"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
     # send the patch author requests with the developer role
-    delete_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    delete_author = api_client.delete_author(addon, author)
     assert (
         delete_author.status_code == 403
     ), f"Actual response: {delete_author.status_code}, {delete_author.text}"
@@ -577,14 +437,11 @@ def test_addon_developer_role_cannot_delete_authors(base_url, session_auth, vari
 
 @pytest.mark.serial
 @pytest.mark.create_session("staff_user")
-def test_addon_developer_role_cannot_delete_addon(base_url, session_auth):
+def test_addon_developer_role_cannot_delete_addon(base_url, api_client, module_addon):
     """Verify that an addon cannot be deleted by an author with a developer role;
     only owners are allowed to delete addons"""
-    addon = payloads.edit_addon_details["slug"]
-    delete_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    delete_addon = api_client.get_delete_confirm(addon)
     assert (
         delete_addon.status_code == 403
     ), f"Actual response: {delete_addon.status_code}, {delete_addon.text}"
@@ -597,16 +454,13 @@ def test_addon_developer_role_cannot_delete_addon(base_url, session_auth):
 @pytest.mark.create_session("staff_user")
 @pytest.mark.clear_session
 def test_addon_developer_role_can_request_author_details(
-    selenium, base_url, variables, session_auth
+    selenium, base_url, variables, api_client, module_addon
 ):
     """Verify that an author with a developer role can view details for existing addon authors"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
     # send the patch author requests with the developer role
-    get_author_details = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_author_details = api_client.get_author(addon, author)
     assert (
         get_author_details.status_code == 200
     ), f"Actual response: {get_author_details.status_code}, {get_author_details.text}"
@@ -617,20 +471,13 @@ def test_addon_developer_role_can_request_author_details(
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_change_author_stats(base_url, session_auth, variables):
+def test_addon_change_author_stats(base_url, api_client, variables, module_addon):
     """Change the details - role, visibility, position - of an exiting author
     and verify that changes were applied correctly"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     author = variables["api_post_valid_author"]
     payload = {**payloads.author_stats, "role": "owner", "position": 0, "listed": True}
-    edit_author = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/authors/{author}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_author = api_client.edit_author(addon, author, payload)
     edit_author.raise_for_status()
     new_stats = edit_author.json()
     assert new_stats["listed"] == payload["listed"]
@@ -640,24 +487,20 @@ def test_addon_change_author_stats(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_addon_delete_all_active_and_pending_authors(base_url, session_auth, variables):
+def test_addon_delete_all_active_and_pending_authors(
+    base_url, api_client, variables, module_addon
+):
     """As the addon owner, delete all additional authors (pending or active)"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     active_author = variables["api_post_valid_author"]
     pending_author = variables["api_post_additional_author"]
     # delete active author (invitation accepted)
-    delete_active_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/authors/{active_author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    delete_active_author = api_client.delete_author(addon, active_author)
     assert (
         delete_active_author.status_code == 204
     ), f"Actual response: {delete_active_author.status_code}, {delete_active_author.text}"
     # delete the pending author (invitation not confirmed)
-    delete_pending_author = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/pending-authors/{pending_author}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    delete_pending_author = api_client.delete_pending_author(addon, pending_author)
     assert (
         delete_pending_author.status_code == 204
     ), f"Actual response: {delete_pending_author.status_code}, {delete_pending_author.text}"
@@ -1,16 +1,10 @@
-import json
-import time
-
 import pytest
-import requests
 
 from api import payloads, api_helpers
 
 from scripts import reusables
 
-# endpoints used in the version edit tests
-_addon_create = "/api/v5/addons/addon/"
-_upload = "/api/v5/addons/upload/"
+# the tests using 'module_addon' edit the same addon of this module, in order
 
 # These tests are covering various valid and invalid scenarios for editing
 # addon version details such as: compatibility, license, release notes, source code,
@@ -26,24 +20,14 @@ _upload = "/api/v5/addons/upload/"
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_details(base_url, session_auth):
+def test_edit_version_details(base_url, api_client, module_addon):
     """Edit the version specific fields, i.e. 'release_notes', 'license, 'compatibility'"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = payloads.edit_version_details
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     edit_version.raise_for_status()
     response = edit_version.json()
     # verify that the data we sent has been registered correctly in the response we get
@@ -54,27 +38,17 @@ def test_edit_version_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_custom_license_no_text(base_url, session_auth):
+def test_edit_version_custom_license_no_text(base_url, api_client, module_addon):
     """When setting a custom license, it is mandatory for that license to contain a text"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {
         **payloads.custom_license,
         "custom_license": {"name": {"en-US": "no-text-provided"}},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     assert (
         edit_version.status_code == 400
     ), f"Actual status code was {edit_version.status_code}"
@@ -85,25 +59,15 @@ def test_edit_version_custom_license_no_text(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_set_custom_license(base_url, session_auth):
+def test_edit_version_set_custom_license(base_url, api_client, module_addon):
     """Instead of using a predefined addon license provided by AMO, add a
     custom license with 'name' and 'text' defined by the addon author"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = payloads.custom_license
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     edit_version.raise_for_status()
     response = edit_version.json()
     assert payload["custom_license"]["name"] == response["license"]["name"]
@@ -113,29 +77,17 @@ def test_edit_version_set_custom_license(base_url, session_auth):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 @pytest.mark.fail
-def test_upload_new_listed_version(base_url, session_auth):
+def test_upload_new_listed_version(base_url, api_client, module_addon):
     """Uploads a new listed version for an existing addon"""
     with open("sample-addons/listed-addon-new-version.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
-    addon = payloads.edit_addon_details["slug"]
+    api_client.wait_for_upload_processed(uuid)
+    addon = module_addon()
     payload = payloads.new_version_details(uuid)
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.create_version(addon, payload)
     new_version.raise_for_status()
     response = new_version.json()
     # verify that the new version was created with the data provided
@@ -148,33 +100,23 @@ def test_upload_new_listed_version(base_url, session_auth):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 @pytest.mark.fail
-def test_upload_new_version_with_existing_version_number(base_url, session_auth):
+def test_upload_new_version_with_existing_version_number(
+    base_url, api_client, module_addon
+):
     """Uploads a new version with an existing version number; the upload should fail"""
     with open("sample-addons/listed-addon-new-version.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     print("Post upload json: " + f"{upload}")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    api_client.wait_for_upload_processed(uuid)
     print("UUID json: " + f"{uuid}")
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     print("addon json: " + f"{addon}")
     payload = payloads.new_version_details(uuid)
     print("payload json: " + f"{payload}")
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.create_version(addon, payload)
     print("payload json: " + f"{new_version}")
     assert (
         new_version.status_code == 409
@@ -186,40 +128,27 @@ def test_upload_new_version_with_existing_version_number(base_url, session_auth)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_unlisted_version_with_put_method(base_url, session_auth):
+def test_upload_new_unlisted_version_with_put_method(
+    base_url, api_client, module_addon
+):
     """Takes an addon with listed version only and submits an unlisted version;
     this is creating an addon with mixed versions. Use the PUT endpoint in this
      case to check that it also works for a new version submission process"""
-    addon = payloads.edit_addon_details["slug"]
+    addon = module_addon()
     # get the addon guid required for the PUT method
-    get_addon_details = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon_details = api_client.get_addon(addon)
     guid = get_addon_details.json()["guid"]
     # upload a new unlisted version
     with open("sample-addons/mixed-addon-versions.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "unlisted")
     upload.raise_for_status()
     resp = upload.json()
     # verify that the upload was created as unlisted
     assert "unlisted" in resp["channel"]
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
-    new_version = requests.put(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"version": {"upload": uuid}}),
-    )
+    api_client.wait_for_upload_processed(uuid)
+    new_version = api_client.put_addon(guid, {"version": {"upload": uuid}})
     new_version.raise_for_status()
     response = new_version.json()
     # this property needs to exist if the unlisted submission was successful
@@ -228,30 +157,20 @@ def test_upload_new_unlisted_version_with_put_method(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_different_addon_type(base_url, session_auth):
+def test_upload_new_version_with_different_addon_type(
+    base_url, api_client, module_addon
+):
     """Take an exiting addon of type 'extensions' and try to upload a new version
     of type 'statictheme' for it; the submission should fail"""
     with open("sample-addons/theme.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
-    addon = payloads.edit_addon_details["slug"]
+    api_client.wait_for_upload_processed(uuid)
+    addon = module_addon()
     payload = {"upload": uuid}
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.create_version(addon, payload)
     assert (
         new_version.status_code == 400
     ), f"Actual response: status code = {new_version.status_code}, message = {new_version.text}"
@@ -263,7 +182,7 @@ def test_upload_new_version_with_different_addon_type(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_different_guid(base_url, session_auth):
+def test_upload_new_version_with_different_guid(base_url, api_client, module_addon):
     """Take an exiting addon and submit a new version that has a different GUID
     from what we have on AMO for this addon; the submission should fail"""
     guid = f"random-guid@{reusables.get_random_string(6)}"
@@ -274,28 +193,15 @@ def test_upload_new_version_with_different_guid(base_url, session_auth):
         "name": "New version with different guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
-    addon = payloads.edit_addon_details["slug"]
+    api_client.wait_for_upload_processed(uuid)
+    addon = module_addon()
     payload = {"upload": uuid}
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.create_version(addon, payload)
     assert (
         new_version.status_code == 400
     ), f"Actual response: status code = {new_version.status_code}, message = {new_version.text}"
@@ -307,33 +213,26 @@ def test_upload_new_version_with_different_guid(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_sources(base_url, session_auth):
+def test_upload_new_version_with_sources(
+    base_url, session_auth, api_client, module_addon
+):
     """Uploads a new version for an exiting addon while also attaching additional source code"""
     manifest = {
         **payloads.minimal_manifest,
         "name": "EN-US Name edited",
         "version": "3.0",
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    with api_helpers.make_addon(manifest) as file:
+        upload = api_client.upload(file, "listed")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
-    addon = payloads.edit_addon_details["slug"]
+    api_client.wait_for_upload_processed(uuid)
+    addon = module_addon()
     # submit the version and attach source code
     with open("sample-addons/listed-addon.zip", "rb") as source:
-        new_version = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/versions/",
-            headers={"Authorization": f"Session {session_auth}"},
-            data={"upload": uuid},
-            files={"source": source},
+        new_version = api_client.create_version(
+            addon, {"upload": uuid}, source=source
         )
     response = new_version.json()
     new_version.raise_for_status()
@@ -341,7 +240,7 @@ def test_upload_new_version_with_sources(base_url, session_auth):
     assert f"{base_url}/firefox/downloads/source/" in response["source"]
     url = response["source"]
     # compare the actual source file uploaded with the one returned by the API to make sure they match
-    response_source = requests.get(url, cookies={"sessionid": session_auth}, timeout=10)
+    response_source = api_client.download(url, cookies={"sessionid": session_auth})
     api_helpers.compare_source_files(
         "sample-addons/listed-addon.zip", response_source, "POST"
     )
@@ -349,40 +248,30 @@ def test_upload_new_version_with_sources(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_change_sources(base_url, session_auth):
+def test_edit_version_change_sources(base_url, session_auth, api_client, module_addon):
     """Upload different source file for an existing version and make sure that changes were applied"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     print("Request addon create: " + f"{request.json()}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
-    get_old_source = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_old_source = api_client.get_version(addon, version)
     print("get old source request: " + f"{get_old_source.json()}")
     # download the previous source code attached to the version
-    previous_source = requests.get(
-        get_old_source.json()["source"], cookies={"sessionid": session_auth}, timeout=10
+    previous_source = api_client.download(
+        get_old_source.json()["source"], cookies={"sessionid": session_auth}
     )
     with open("sample-addons/unlisted-addon.zip", "rb") as source:
-        change_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": source},
-        )
+        change_source = api_client.upload_source(addon, version, source)
 
-    print("previous source: " + f"{previous_source.json()}")
+    print("previous source: " + f"{previous_source}")
     print("change source: " + f"{change_source.json()}")
 
     # download the new source code attached to the  version
-    new_source = requests.get(
-        change_source.json()["source"], cookies={"sessionid": session_auth}, timeout=10
+    new_source = api_client.download(
+        change_source.json()["source"], cookies={"sessionid": session_auth}
     )
-    print("new source: " + f"{new_source.json()}")
+    print("new source: " + f"{new_source}")
 
     # compare that the previous source and the new source do not match
     api_helpers.compare_source_files(previous_source, new_source, "PATCH")
@@ -404,21 +293,16 @@ def test_edit_version_change_sources(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_upload_supported_source_files(base_url, session_auth, file_type):
+def test_edit_version_upload_supported_source_files(
+    base_url, session_auth, api_client, file_type, module_addon
+):
     """Upload all the supported source file types and make sure the request is successful"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     with open(f"sample-addons/{file_type}", "rb") as file:
-        upload_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": file},
-        )
+        upload_source = api_client.upload_source(addon, version, file)
     print(upload_source)
     assert (
         upload_source.status_code == 200
@@ -426,31 +310,24 @@ def test_edit_version_upload_supported_source_files(base_url, session_auth, file
     # verify that the file upload was successful by comparing the uploaded file with the file returned by the API
     response = upload_source.json()
     url = response["source"]
-    response_source = requests.get(url, cookies={"sessionid": session_auth}, timeout=10)
+    response_source = api_client.download(url, cookies={"sessionid": session_auth})
     api_helpers.compare_source_files(
-        f"sample-addons/{file_type}", response_source, "post"
+        f"sample-addons/{file_type}", response_source, "POST"
     )
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_sources_cannot_be_changed_for_approved_versions(
-    base_url, session_auth, variables
+    base_url, api_client, variables
 ):
     """Addons that were Approved by a reviewer can't have their source files changed"""
     addon = variables["approved_addon_with_sources"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     with open("sample-addons/source-img.zip", "rb") as file:
-        upload_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": file},
-        )
+        upload_source = api_client.upload_source(addon, version, file)
     assert (
         upload_source.status_code == 400
     ), f"Actual response: {upload_source.status_code}, {upload_source.text}"
@@ -481,24 +358,14 @@ def test_sources_cannot_be_changed_for_approved_versions(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_license(base_url, session_auth, slug):
+def test_edit_version_invalid_license(base_url, api_client, slug, module_addon):
     """Extension license slugs have to match one of the predefined licenses accepted by AMO"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "license": slug}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     print(
         f'For license slug "{slug}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -518,13 +385,12 @@ def test_edit_version_invalid_license(base_url, session_auth, slug):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_both_license_and_custom_license(base_url, session_auth):
+def test_edit_version_both_license_and_custom_license(
+    base_url, api_client, module_addon
+):
     """An addon can have either a predefined license or a custom license but not both"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     # add a custom license besides the 'license' we already have in the edit version payload
@@ -532,14 +398,7 @@ def test_edit_version_both_license_and_custom_license(base_url, session_auth):
         **payloads.edit_version_details,
         "custom_license": {"name": {"en-US": "custom-name"}},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     assert (
         edit_version.status_code == 400
     ), f"Actual status code was {edit_version.status_code}"
@@ -568,24 +427,16 @@ def test_edit_version_both_license_and_custom_license(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_custom_license_format(base_url, session_auth, value):
+def test_edit_version_invalid_custom_license_format(
+    base_url, api_client, value, module_addon
+):
     """Custom licenses should be a dictionary containing the license name and text; other formats should fail"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.custom_license, "custom_license": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     print(
         f'For custom_license "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -617,29 +468,19 @@ def test_edit_version_invalid_custom_license_format(base_url, session_auth, valu
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_version_invalid_custom_license_name_and_text(
-    base_url, session_auth, value
+    base_url, api_client, value, module_addon
 ):
     """Custom licenses should be a dictionary containing the license name and text;
     also, the name and text need to be specified in a valid locale"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {
         **payloads.custom_license,
         "custom_license": {"name": value, "text": value},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     print(
         f'For custom_license "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -676,24 +517,16 @@ def test_edit_version_invalid_custom_license_name_and_text(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_compatibility_format(base_url, session_auth, value):
+def test_edit_version_invalid_compatibility_format(
+    base_url, api_client, value, module_addon
+):
     """The compatibility field needs to be either a dictionary or a list; other formats should fail"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     print(
         f'For compatibility "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -733,26 +566,16 @@ def test_edit_version_invalid_compatibility_format(base_url, session_auth, value
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_version_valid_compatibility_values(
-    base_url, session_auth, request_value, response_value
+    base_url, api_client, request_value, response_value, module_addon
 ):
     """Tests the compatibility field with a set of valid values"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     print(request)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": request_value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     print(edit_version)
     print(
         f'For compatibility "{request_value}": Response status is '
@@ -787,25 +610,17 @@ def test_edit_version_valid_compatibility_values(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_compatibility_values(base_url, session_auth, value):
+def test_edit_version_invalid_compatibility_values(
+    base_url, api_client, value, module_addon
+):
     """Compatibility values should be a combination of valid applications (firefox or android)
     and application versions (existing versions of Firefox for desktop/android)"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     print(
         f'For compatibility "{value}": Response status is '
         f"{edit_version.status_code}; {edit_version.text}\n"
@@ -830,59 +645,30 @@ def test_edit_version_invalid_compatibility_values(base_url, session_auth, value
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_disable_current_version(base_url, session_auth):
+def test_edit_version_disable_current_version(base_url, api_client, module_addon):
     """Disable then re-enable the current version of an addon as a developer"""
-    addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    addon = module_addon()
+    request = api_client.get_addon(addon)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {"is_disabled": True}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     assert (
         edit_version.status_code == 200
     ), f"Actual response was: {edit_version.status_code}; {edit_version.text}"
     # verify that the version has been disabled successfully
-    version_status = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-    )
+    version_status = api_client.get_version(addon, version)
     assert (
         version_status.json()["is_disabled"] is True
     ), f"Actual response was: {version_status.json()}"
     # re-enable the version
     payload = {"is_disabled": False}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_version = api_client.edit_version(addon, version, payload)
     assert (
         edit_version.status_code == 200
     ), f"Actual response was: {edit_version.status_code}; {edit_version.text}"
     # verify that the version has been re-enabled successfully
-    version_status = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-    )
+    version_status = api_client.get_version(addon, version)
     assert (
         version_status.json()["is_disabled"] is False
     ), f"Actual response was: {version_status.json()}"
@@ -890,13 +676,10 @@ def test_edit_version_disable_current_version(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_non_existent_addon(base_url, session_auth):
+def test_delete_extension_non_existent_addon(base_url, api_client):
     """Try to obtain a delete token for a non-existent addon"""
     addon = "rand-om123"
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = api_client.get_delete_confirm(addon)
     assert (
         get_delete_confirm.status_code == 404
     ), f"Actual response: {get_delete_confirm.status_code}, {get_delete_confirm.text}"
@@ -904,13 +687,10 @@ def test_delete_extension_non_existent_addon(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_from_another_author(base_url, session_auth, variables):
+def test_delete_extension_from_another_author(base_url, api_client, variables):
     """Try to delete someone else's addon; the request should fail"""
     addon = variables["detail_extension_slug"]
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = api_client.get_delete_confirm(addon)
     assert (
         get_delete_confirm.status_code == 403
     ), f"Actual response: {get_delete_confirm.status_code}, {get_delete_confirm.text}"
@@ -937,14 +717,12 @@ def test_delete_extension_from_another_author(base_url, session_auth, variables)
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_with_invalid_tokens(base_url, session_auth, token):
+def test_delete_extension_with_invalid_tokens(
+    base_url, api_client, token, module_addon
+):
     """Use invalid formats or data types for the token required to delete an addon"""
-    addon = payloads.edit_addon_details["slug"]
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
-    )
+    addon = module_addon()
+    delete_addon = api_client.delete_addon(addon, token)
     assert (
         delete_addon.status_code == 400
     ), f'For token "{token}", status code = {delete_addon.status_code}, message = {delete_addon.text}'
@@ -961,27 +739,19 @@ def test_delete_extension_with_invalid_tokens(base_url, session_auth, token):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 @pytest.mark.clear_session
-def test_delete_extension_valid_token(selenium, base_url, session_auth, variables):
-    addon = payloads.edit_addon_details["slug"]
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+def test_delete_extension_valid_token(
+    selenium, base_url, api_client, variables, module_addon
+):
+    addon = module_addon()
+    get_delete_confirm = api_client.get_delete_confirm(addon)
     get_delete_confirm.raise_for_status()
     r = get_delete_confirm.json()
     token = r["delete_confirm"]
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
-    )
+    delete_addon = api_client.delete_addon(addon, token)
     assert (
         delete_addon.status_code == 204
     ), f"Actual status code was {delete_addon.status_code}"
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get_addon(addon)
     assert (
         get_addon.status_code == 404
     ), f"Actual status code was {get_addon.status_code}"
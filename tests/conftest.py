@@ -1,22 +1,249 @@
+import json
 import os
+import random
 
 import pytest
-import requests
 
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from api.addon_factory import AddonFactory
+from api.client import ApiClient
 from pages.desktop.frontend.home import Home
 from pages.desktop.frontend.login import Login
+from pages.desktop.html_page import HtmlPage
+from scripts import (
+    addon_pool,
+    amo_stand_in,
+    artifact_sweeper,
+    cassettes,
+    dependency_chains,
+    firefox_profile,
+    wait_profiler,
+    webdriver_trace,
+)
+from scripts.addon_cleanup import AddonCleanup, run_tag
+from scripts.browser_pool import ReusedBrowserPlugin
+from scripts.credential_store import CredentialStore
+from scripts.durations import DurationRecorder, DurationStore
+from scripts.resource_locks import ResourceLockPlugin, ResourceLocks
+from scripts.session_vault import SessionVault
 
 # Window resolutions
 DESKTOP = (1920, 1080)
 
+# the summary of the API calls made through 'api_pool', written by its teardown
+api_timings_key = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reuse-browser",
+        action="store_true",
+        default=False,
+        help="keep one browser per test process and reset its state between tests",
+    )
+    parser.addoption(
+        "--browser-max-tests",
+        type=int,
+        default=25,
+        help="number of tests after which a reused browser is restarted",
+    )
+    parser.addoption(
+        "--firefox-profile-cache",
+        action="store_true",
+        default=False,
+        help="start the browsers with copies of a profile built once per environment",
+    )
+    parser.addoption(
+        "--addon-pool-size",
+        type=int,
+        default=0,
+        help="number of ready addons kept per template and user for 'leased_addon'",
+    )
+    parser.addoption(
+        "--cassette-mode",
+        choices=["off", "record", "replay"],
+        default="off",
+        help="record the API calls of the tests, or replay them from a local server",
+    )
+    parser.addoption(
+        "--cassette-dir",
+        default=cassettes.DEFAULT_DIR,
+        help="folder of the recorded API calls, one file per test",
+    )
+    parser.addoption(
+        "--api-stand-in",
+        action="store_true",
+        default=False,
+        help="run the API tests against a local stand-in of the AMO API",
+    )
+    parser.addoption(
+        "--stand-in-latency",
+        type=float,
+        default=0,
+        help="seconds the API stand-in takes to process an upload",
+    )
+    parser.addoption(
+        "--sweep-artifacts",
+        action="store_true",
+        default=False,
+        help="delete the artifacts left over on the test accounts by previous runs",
+    )
+    parser.addoption(
+        "--webdriver-trace",
+        nargs="?",
+        const=webdriver_trace.DEFAULT_PATH,
+        default=None,
+        help="count and time the WebDriver commands of every test, written to a file",
+    )
+    parser.addoption(
+        "--command-budget",
+        type=int,
+        default=None,
+        help="with --webdriver-trace, fail tests sending more WebDriver commands",
+    )
+    parser.addoption(
+        "--profile-waits",
+        nargs="?",
+        const=wait_profiler.DEFAULT_PATH,
+        default=None,
+        help="rank the places where tests wait or sleep the longest, saved to a file",
+    )
+    parser.addoption(
+        "--schedule-by-duration",
+        action="store_true",
+        default=False,
+        help="with xdist, run the longest tests first, based on the recorded durations",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("api_stand_in") and (
+        config.getoption("cassette_mode") == "replay"
+    ):
+        raise pytest.UsageError("--api-stand-in can't be used with replayed cassettes")
+    if config.getoption("reuse_browser"):
+        config.pluginmanager.register(
+            ReusedBrowserPlugin(config.getoption("browser_max_tests"), DESKTOP),
+            "reused_browser",
+        )
+    config.pluginmanager.register(
+        DurationRecorder(DurationStore(), hasattr(config, "workerinput")),
+        "duration_recorder",
+    )
+    trace_path = config.getoption("webdriver_trace")
+    if trace_path:
+        # the trace of the previous run is replaced; the workers append to it
+        if not hasattr(config, "workerinput"):
+            open(trace_path, "w").close()
+        config.pluginmanager.register(
+            webdriver_trace.WebDriverTracePlugin(
+                trace_path, config.getoption("command_budget")
+            ),
+            "webdriver_trace",
+        )
+    if config.getoption("profile_waits"):
+        config.pluginmanager.register(
+            wait_profiler.WaitProfilerPlugin(
+                config.getoption("profile_waits"), hasattr(config, "workerinput")
+            ),
+            "wait_profiler",
+        )
+    # tests sharing an account or an addon only need to be kept apart across workers
+    if hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            ResourceLockPlugin(ResourceLocks()), "resource_locks"
+        )
+
+
+def pytest_sessionstart(session):
+    config = session.config
+    if not config.getoption("sweep_artifacts") or hasattr(config, "workerinput"):
+        return
+    # fixtures are not available yet, the base url is read from the variables files
+    base_url = None
+    for path in config.getoption("variables") or []:
+        with open(path) as f:
+            base_url = json.load(f).get("base_url", base_url)
+    artifact_sweeper.write_report(artifact_sweeper.sweep(base_url))
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("api_stand_in"):
+        return
+    skip = pytest.mark.skip(reason="the API stand-in doesn't serve pages to browsers")
+    for item in items:
+        if "selenium" in item.fixturenames:
+            item.add_marker(skip)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_finish(session):
+    # written before the worker reports its collection to the xdist controller
+    config = session.config
+    if hasattr(config, "workerinput") and config.getoption("schedule_by_duration"):
+        dependency_chains.save(dependency_chains.chains(session.items))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("schedule_by_duration"):
+        return None
+    from scripts.duration_scheduling import DurationScheduling
+
+    # the reports of the previous CI runs cover the tests without recorded durations
+    store = DurationStore()
+    store.import_html_reports(config.rootpath.glob("*.html"))
+    return DurationScheduling(config, log, store)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    # the session fixtures are torn down by now
+    if api_timings_key in config.stash:
+        terminalreporter.write_sep("=", "api timings")
+        terminalreporter.write_line(config.stash[api_timings_key])
+
+
+def pytest_unconfigure(config):
+    firefox_profile.remove_clones()
+
 
 @pytest.fixture(scope="session")
-def base_url(base_url, variables):
+def cassette_server(request):
+    """The local server replaying the recorded API calls, in replay mode"""
+    if request.config.getoption("cassette_mode") != "replay":
+        yield None
+        return
+    server = cassettes.ReplayServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def api_stand_in(request, variables):
+    """The local stand-in of the AMO API, with --api-stand-in; it is seeded with the
+    accounts and addons that the variables file refers to"""
+    if not request.config.getoption("api_stand_in"):
+        yield None
+        return
+    server = amo_stand_in.AmoStandIn(
+        validation_latency=request.config.getoption("stand_in_latency")
+    )
+    server.seed(variables)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(base_url, variables, cassette_server, api_stand_in):
+    if cassette_server is not None:
+        return cassette_server.url
+    if api_stand_in is not None:
+        return api_stand_in.url
     return variables["base_url"]
 
 
@@ -26,8 +253,21 @@ def sensitive_url(request, base_url):
     return False
 
 
+@pytest.fixture(scope="session")
+def firefox_profile_template(request, base_url, variables):
+    """Path of the pre-built Firefox profile for the environment under test, or None
+    if the tests don't run with '--firefox-profile-cache'"""
+    if not request.config.getoption("firefox_profile_cache"):
+        return None
+    return firefox_profile.ProfileCache().template(
+        base_url, firefox_profile.preferences(base_url, variables)
+    )
+
+
 @pytest.fixture
-def firefox_options(firefox_options, base_url, variables):
+def firefox_options(
+    request, firefox_options, base_url, variables, firefox_profile_template
+):
     """Firefox options.
 
     These options configure firefox to allow for addon installation,
@@ -41,50 +281,23 @@ def firefox_options(firefox_options, base_url, variables):
         mozAddonManager
     '-foreground': Firefox will run in the foreground with priority
     '-headless': Firefox will run headless
+    '-profile': Firefox will start with a copy of the pre-built profile, when
+        running with '--firefox-profile-cache'
 
     """
-    # for prod installation tests, we do not need to set special prefs, so we
-    # separate the browser set-up based on the AMO environments
-    if base_url == "https://addons.mozilla.org":
+    for name, value in firefox_profile.preferences(base_url, variables).items():
+        firefox_options.set_preference(name, value)
+    if base_url == firefox_profile.PROD_URL:
         firefox_options.add_argument("-headless")
-        firefox_options.log.level = "trace"
-        firefox_options.set_preference(
-            "extensions.getAddons.discovery.api_url",
-            "https://services.addons.mozilla.org/api/v4/discovery/?lang=%LOCALE%&edition=%DISTRIBUTION%",
-        )
-        firefox_options.set_preference("extensions.getAddons.cache.enabled", True)
-        firefox_options.set_preference(
-            "extensions.getAddons.get.url",
-            "https://services.addons.mozilla.org/api/v4/addons/search/?guid=%IDS%&lang=%LOCALE%",
-        )
-        firefox_options.set_preference(
-            "extensions.update.url",
-            "extensions.update.url	https://versioncheck.addons.mozilla.org/update/VersionCheck.php?reqVersion=%REQ_VERSION%&id=%ITEM_ID%&version=%ITEM_VERSION%&maxAppVersion=%ITEM_MAXAPPVERSION%&status=%ITEM_STATUS%&appID=%APP_ID%&appVersion=%APP_VERSION%&appOS=%APP_OS%&appABI=%APP_ABI%&locale=%APP_LOCALE%&currentAppVersion=%CURRENT_APP_VERSION%&updateType=%UPDATE_TYPE%&compatMode=%COMPATIBILITY_MODE%"
-        )
-        firefox_options.set_preference(
-            "extensions.update.background.url",
-            "https://versioncheck-bg.addons.mozilla.org/update/VersionCheck.php?reqVersion=%REQ_VERSION%&id=%ITEM_ID%&version=%ITEM_VERSION%&maxAppVersion=%ITEM_MAXAPPVERSION%&status=%ITEM_STATUS%&appID=%APP_ID%&appVersion=%APP_VERSION%&appOS=%APP_OS%&appABI=%APP_ABI%&locale=%APP_LOCALE%&currentAppVersion=%CURRENT_APP_VERSION%&updateType=%UPDATE_TYPE%&compatMode=%COMPATIBILITY_MODE%"
-        )
     else:
-        firefox_options.set_preference("extensions.install.requireBuiltInCerts", False)
-        firefox_options.set_preference("xpinstall.signatures.required", True)
-        firefox_options.set_preference("xpinstall.signatures.dev-root", True)
-        firefox_options.set_preference("extensions.webapi.testing", True)
-        firefox_options.set_preference("ui.popup.disable_autohide", True)
-        firefox_options.set_preference("devtools.console.stdout.content", True)
-        firefox_options.set_preference(
-            "extensions.getAddons.discovery.api_url",
-            variables["extensions_getAddons_discovery_api_url"],
-        )
-        firefox_options.set_preference(
-            "extensions.getAddons.get.url",
-            variables["extensions_getAddons_get_url"],
-        )
-        firefox_options.set_preference(
-            "extensions.update.url", variables["extensions_update_url"]
-        )
         firefox_options.add_argument("-foreground")
-        firefox_options.log.level = "trace"
+    firefox_options.log.level = "trace"
+    # every browser gets its own copy of the pre-built profile; with '--reuse-browser'
+    # the copy is made by the browser pool, only when it starts a new browser
+    reused = request.config.getoption("reuse_browser")
+    if firefox_profile_template is not None and not reused:
+        profile = firefox_profile.use_clone(firefox_options, firefox_profile_template)
+        request.addfinalizer(lambda: firefox_profile.remove_clones(profile))
     return firefox_options
 
 
@@ -93,96 +306,347 @@ def firefox_notifications(notifications):
     return notifications
 
 
+@pytest.fixture(scope="session")
+def session_vault(request, base_url, api_pool):
+    """Run-scoped store of the user sessions obtained through FxA logins, so that
+    each user account goes through the login flow once per run instead of once per test;
+    sessions are shared between xdist workers through the credential store, where the
+    run tag scopes the counts of the tests using them to this run"""
+    store = CredentialStore(base_url, run=run_tag(request.config))
+    return SessionVault(api_pool, store)
+
+
+def marked_user(request, fixture):
+    """Returns the user of the test's 'login' or 'create_session' marker"""
+    closest_marker = request.node.get_closest_marker
+    marker = closest_marker("login") or closest_marker("create_session")
+    if marker is None:
+        pytest.fail(f"{fixture} needs a test marked 'login' or 'create_session'")
+    return marker.args[0]
+
+
+def fxa_login(selenium, base_url, user):
+    """Logs the user in through the FxA flow in the browser and
+    returns the value of the AMO sessionid cookie"""
+    home = Home(selenium, base_url).open().wait_for_page_to_load()
+    home.header.click_login()
+    home.wait.until(
+        EC.visibility_of_element_located((By.NAME, "email")),
+        message=f"FxA email input field was not displayed in {selenium.current_url}",
+    )
+    Login(selenium, base_url).account(user)
+    home.wait.until(
+        EC.url_contains("addons"),
+        message=f"AMO could not be loaded in {selenium.current_url}",
+    )
+    return selenium.get_cookie("sessionid")["value"]
+
+
+def release_session(api_pool, session_vault, user, invalidate):
+    """Signals that a test finished using the user session. If the session was marked
+    for invalidation by a 'clear_session' test and this was its last user, the session
+    is deleted with the DELETE session API; this way the session is deleted only once,
+    without pulling it from under tests that are still running in other workers"""
+    sessionid = session_vault.release(user, invalidate)
+    if sessionid is None:
+        return
+    client = api_pool.with_auth(sessionid)
+    # clear session by calling the DELETE session API
+    delete_session = client.delete_session()
+    assert (
+        delete_session.status_code == 200
+    ), f"Actual status code was {delete_session.status_code}"
+    # test that session was invalidated correctly by trying to access the account with the deleted session
+    get_user = client.get_profile()
+    assert (
+        get_user.status_code == 401
+    ), f"Actual status code was {get_user.status_code}"
+    assert (
+        "Valid user session not found matching the provided session key."
+        in get_user.text
+    ), f"Actual response message was {get_user.text}"
+
+
 @pytest.fixture(
     scope="function",
     params=[DESKTOP],
     ids=["Desktop"],
 )
-def selenium(selenium, base_url, session_auth, request):
+def selenium(selenium, base_url, api_pool, session_auth, session_vault, request):
     """Fixture to set a custom resolution for tests running on Desktop
     and handle browser sessions when needed"""
+    trace = request.config.pluginmanager.get_plugin("webdriver_trace")
+    if trace is not None:
+        trace.tracer.install(selenium)
     selenium.set_window_size(*request.param)
     # establishing actions  based on markers
     create_session = request.node.get_closest_marker("create_session")
     login = request.node.get_closest_marker("login")
     clear_session = request.node.get_closest_marker("clear_session")
+    # users whose sessions were acquired by this fixture (session_auth handles its own)
+    acquired = []
     # this is used when we want to open an AMO page with a sessionid
     # cookie (i.e. a logged-in user) already set
     if create_session:
         # need to set the url context if we want to apply a cookie
         # in order to avoid InvalidCookieDomainException error
         selenium.get(base_url)
-        # set the sessionid cookie
-        selenium.add_cookie(
-            {
-                "name": "sessionid",
-                "value": session_auth,
-            }
-        )
+        if session_auth is None:
+            # the vault had no valid session for this user, so we log in once
+            # and store the new session for the tests that follow
+            user = create_session.args[0]
+            session_vault.store_session(user, fxa_login(selenium, base_url, user))
+            session_vault.acquire(user)
+            acquired.append(user)
+        else:
+            # set the sessionid cookie
+            selenium.add_cookie(
+                {
+                    "name": "sessionid",
+                    "value": session_auth,
+                }
+            )
     # this is used when we want to start the browser with a normal login
-    # mostly used for the scope of getting the session cookie and storing it for later use
+    # mostly used for the scope of getting the session cookie and storing it for later use;
+    # the FxA flow is only performed if the vault doesn't hold a valid session for the user
     if login:
-        home = Home(selenium, base_url).open().wait_for_page_to_load()
-        home.header.click_login()
-        home.wait.until(
-            EC.visibility_of_element_located((By.NAME, "email")),
-            message=f"FxA email input field was not displayed in {selenium.current_url}",
-        )
         user = login.args[0]
-        Login(selenium, base_url).account(user)
-        home.wait.until(
-            EC.url_contains("addons"),
-            message=f"AMO could not be loaded in {selenium.current_url}",
-        )
-        session_cookie = selenium.get_cookie("sessionid")
-        with open(user + ".txt", "w") as file:
-            file.write(session_cookie["value"])
+        sessionid = session_vault.get(user)
+        if sessionid is None:
+            session_vault.store_session(user, fxa_login(selenium, base_url, user))
+        else:
+            selenium.get(base_url)
+            selenium.add_cookie({"name": "sessionid", "value": sessionid})
+            selenium.get(base_url)
+        session_vault.acquire(user)
+        acquired.append(user)
     yield selenium
 
-    # delete the user session and files created for a test suite;
-    # this is normally used in the last test of a suite to handle the clean-up part
-    if clear_session:
-        # clear session by calling the DELETE session API
-        delete_session = requests.delete(
-            url=f"{base_url}/api/v5/accounts/session/",
-            headers={"Authorization": f"Session {session_auth}"},
-        )
-        assert (
-            delete_session.status_code == 200
-        ), f"Actual status code was {delete_session.status_code}"
-        # test that session was invalidated correctly by trying to access the account with the deleted session
-        get_user = requests.get(
-            url=f"{base_url}/api/v5/accounts/profile/",
-            headers={"Authorization": f"Session {session_auth}"},
-        )
-        assert (
-            get_user.status_code == 401
-        ), f"Actual status code was {get_user.status_code}"
-        assert (
-            "Valid user session not found matching the provided session key."
-            in get_user.text
-        ), f"Actual response message was {get_user.text}"
-        user_file = create_session.args[0]
-        if os.path.exists(f"{user_file}.txt"):
-            os.remove(f"{user_file}.txt")
-        else:
-            # fail if the file does not exist
-            raise FileNotFoundError("The file does not exist")
+    # release the sessions used by the test; a test marked with 'clear_session' is normally
+    # the last test of a suite and marks the session to be deleted once no other test uses it
+    for user in acquired:
+        release_session(api_pool, session_vault, user, invalidate=bool(clear_session))
+
+
+def offline_session(config, user):
+    """The session used for the user when the API tests don't run against AMO, else
+    None: the replay server doesn't check sessions, and the stand-in accepts any
+    session and names the user after it"""
+    if config.getoption("cassette_mode") == "replay":
+        return "replayed-session"
+    if config.getoption("api_stand_in"):
+        return f"{amo_stand_in.SESSION_PREFIX}{user}"
+    return None
 
 
 @pytest.fixture(scope="function")
-def session_auth(request):
-    """Fixture that reads and returns the sessionid cookie; to be used as a
-    standalone fixture for in API tests that require authentication and
-    also complements the selenium fixture  when we want to start
-    the browser with an active user session"""
+def session_auth(request, api_pool, session_vault):
+    """Fixture that returns a valid sessionid for the user passed in the 'create_session'
+    marker; to be used as a standalone fixture for in API tests that require authentication
+    and also complements the selenium fixture  when we want to start
+    the browser with an active user session. Sessions are taken from the session vault,
+    which only requires a new login once the stored session has expired"""
     marker = request.node.get_closest_marker("create_session")
-    # the user file is passed in the test as a marker argument
+    if marker and offline_session(request.config, marker.args[0]):
+        yield offline_session(request.config, marker.args[0])
+        return
+    sessionid = None
+    # the user is passed in the test as a marker argument
     if marker:
-        user_file = marker.args[0]
-        with open(f"{user_file}.txt", "r") as file:
-            sessionid = str(file.read())
-        return sessionid
+        user = marker.args[0]
+        sessionid = session_vault.get(user)
+        # tests running with a browser can log in again through the selenium fixture;
+        # API-only tests need a session created by a previous 'login' test
+        if sessionid is None and "selenium" not in request.fixturenames:
+            pytest.fail(
+                f'No valid session was found for "{user}"; '
+                f'run a test marked with login("{user}") first'
+            )
+        if sessionid is not None:
+            session_vault.acquire(user)
+    yield sessionid
+
+    if sessionid is not None:
+        release_session(
+            api_pool,
+            session_vault,
+            marker.args[0],
+            invalidate=bool(request.node.get_closest_marker("clear_session")),
+        )
+
+
+@pytest.fixture(scope="session")
+def cassette_recorder(request):
+    """The adapter saving the API calls of the tests, in record mode"""
+    if request.config.getoption("cassette_mode") != "record":
+        return None
+    return cassettes.RecordingAdapter(pool_connections=4, pool_maxsize=8)
+
+
+@pytest.fixture(scope="session")
+def api_pool(request, base_url, cassette_recorder):
+    """A keep-alive AMO API client shared by all the tests running in a worker;
+    the recorded call timings are reported in the terminal summary"""
+    client = ApiClient(base_url)
+    if cassette_recorder is not None:
+        client.session.mount(base_url, cassette_recorder)
+    yield client
+    if client.timings:
+        request.config.stash[api_timings_key] = client.timing_summary()
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def cassette(request):
+    """Records or replays the API calls of the tests using the API pool, depending
+    on --cassette-mode; the random generator is seeded with the test id, so the
+    random names sent by the test are the same in both modes"""
+    mode = request.config.getoption("cassette_mode")
+    if mode == "off" or "api_pool" not in request.fixturenames:
+        yield None
+        return
+    # browser tests can't be replayed, so their API calls are not recorded either
+    if "selenium" in request.fixturenames:
+        if mode == "replay":
+            pytest.skip("tests using a browser can't be replayed")
+        yield None
+        return
+    random.seed(request.node.nodeid)
+    path = cassettes.cassette_path(
+        request.config.getoption("cassette_dir"), request.node.nodeid
+    )
+    if mode == "record":
+        recorder = request.getfixturevalue("cassette_recorder")
+        base_url = request.getfixturevalue("base_url")
+        recorder.cassette = cassettes.Cassette(path, base_url)
+        yield recorder.cassette
+        recorder.cassette.save()
+        recorder.cassette = None
+        return
+    if not os.path.exists(path):
+        pytest.skip(f"no API calls were recorded in {path}")
+    server = request.getfixturevalue("cassette_server")
+    server.load(cassettes.Cassette.load(path))
+    yield server.cassette
+    server.load(None)
+    assert not server.misses, f"Calls without a recorded response: {server.misses}"
+
+
+@pytest.fixture
+def api_client(api_pool, session_auth):
+    """AMO API client authenticated with the session of the user passed in the
+    'create_session' marker (unauthenticated if the test has no such marker)"""
+    return api_pool.with_auth(session_auth)
+
+
+@pytest.fixture
+def addon_factory(request, selenium, api_pool, session_vault):
+    """Creates addons through the API for the user the browser is logged in with
+    (the user of the 'login' or 'create_session' marker), so DevHub tests can
+    open the page they cover directly; the addons are deleted after the test"""
+    # the selenium fixture has stored a session for the user by now
+    sessionid = session_vault.get(marked_user(request, "addon_factory"))
+    factory = AddonFactory(api_pool.with_auth(sessionid))
+    yield factory.create
+    factory.delete_all()
+
+
+@pytest.fixture(scope="module")
+def module_addon(request, api_pool, session_vault):
+    """Returns a function returning the id of a listed addon of 'api_user', shared by
+    the tests of a module that edit it one after the other. The addon is created by
+    the first call, so its API calls are part of that test (and of its cassette), and
+    it is deleted after the module. Being module scoped, the fixture keeps the tests
+    using it on one xdist worker, as a chain of their own (see dependency_chains)"""
+    user = "api_user"
+    created = []
+
+    def get():
+        if not created:
+            sessionid = offline_session(request.config, user) or session_vault.get(user)
+            if sessionid is None:
+                pytest.fail(
+                    f'No valid session was found for "{user}"; '
+                    f'run a test marked with login("{user}") first'
+                )
+            factory = AddonFactory(api_pool.with_auth(sessionid))
+            created.append((factory, factory.create().id))
+        return created[0][1]
+
+    yield get
+    for factory, _ in created:
+        factory.delete_all()
+
+
+@pytest.fixture(scope="session")
+def addon_pools(base_url):
+    """The addon pool replenishers started by the tests of this process, by user;
+    they are stopped at the end of the session"""
+    replenishers = {}
+    yield replenishers
+    for replenisher in replenishers.values():
+        replenisher.stop()
+
+
+@pytest.fixture
+def leased_addon(request, base_url, api_pool, session_vault, addon_pools):
+    """Returns a function leasing an addon of a template from 'addon_pool.TEMPLATES'
+    for the user of the 'login' or 'create_session' marker and returning its slug.
+    With --addon-pool-size, the addon comes from the pool kept by the background
+    replenisher; otherwise it is created on the spot. The test can change or delete
+    the addon, it is deleted after the test in any case"""
+    size = request.config.getoption("addon_pool_size")
+    leased = []
+    created = []
+
+    def lease(template):
+        user = marked_user(request, "leased_addon")
+        if not size:
+            addon_id, slug = addon_pool.create_addon(
+                api_pool.with_auth(session_vault.get(user)), template
+            )
+            created.append(addon_id)
+            return slug
+        if user not in addon_pools:
+            client = ApiClient(base_url, session_vault.get(user))
+            replenisher = addon_pool.PoolReplenisher(
+                addon_pool.AddonPool(base_url, user), client, size
+            )
+            replenisher.start()
+            addon_pools[user] = replenisher
+        replenisher = addon_pools[user]
+        replenisher.templates.add(template)
+        row_id, slug = replenisher.pool.lease(template, request.node.nodeid)
+        leased.append((replenisher.pool, row_id))
+        return slug
+
+    yield lease
+    for pool, row_id in leased:
+        pool.give_back(row_id)
+    if created:
+        client = api_pool.with_auth(
+            session_vault.get(marked_user(request, "leased_addon"))
+        )
+        # the addons are deleted by id, since the test may have changed their slug
+        for addon_id in created:
+            if client.get_addon(addon_id).status_code != 404:
+                client.delete_addon(addon_id)
+
+
+@pytest.fixture(scope="session")
+def html_page(api_pool, base_url):
+    """Loads the server-side rendered HTML of an AMO page (a path relative to the
+    base url, or a full url) without a browser; used by the tests marked with 'ssr'.
+    Pages are only read, so each url is fetched once per test process"""
+    pages = {}
+
+    def load(path):
+        url = path if path.startswith("http") else f"{base_url}{path}"
+        if url not in pages:
+            pages[url] = HtmlPage.load(api_pool.session, url)
+        return pages[url]
+
+    return load
 
 
 @pytest.fixture
@@ -194,21 +658,37 @@ def wait():
     )
 
 
+@pytest.fixture(scope="session")
+def addon_cleanup(request, base_url):
+    """Deletes the addons registered by the tests of this process at the end of the
+    session, through the API and several at a time; only the addons whose name
+    holds the run tag are deleted"""
+    client = ApiClient(base_url)
+    cleanup = AddonCleanup(client, run_tag(request.config))
+    yield cleanup
+    errors = cleanup.run()
+    client.close()
+    assert not errors, f"Some addons created by the tests were not deleted: {errors}"
+
+
 @pytest.fixture
-def delete_themes(selenium, base_url):
-    """Use this fixture in devhub theme submission tests when we want to
-    immediately delete the theme once the test has completed"""
-    yield
-
-    from pages.desktop.developers.devhub_home import DevHubHome
-
-    page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
-    manage_addons = page.click_my_addons_header_link()
-    manage_addons.click_on_my_themes()
-    while len(manage_addons.addon_list) > 0:
-        addon = manage_addons.addon_list[0]
-        edit = addon.click_addon_name()
-        manage = edit.click_manage_versions_link()
-        delete = manage.delete_addon()
-        delete.input_delete_confirmation_string()
-        delete.confirm_delete_addon()
+def delete_themes(selenium, addon_cleanup):
+    """Use this fixture in devhub theme submission tests to delete the themes of the
+    logged in user at the end of the session; it returns the run tag, which has to
+    be part of the name of the themes that should be deleted"""
+    yield addon_cleanup.tag
+
+    sessionid = selenium.get_cookie("sessionid")
+    if sessionid is not None:
+        addon_cleanup.register(sessionid["value"], "themes")
+
+
+@pytest.fixture(scope="session")
+def review_texts(request, variables):
+    """The texts of the reviews and replies written by the tests; they end with the
+    run tag, which is how the artifact sweeper recognizes the ratings left behind"""
+    tag = run_tag(request.config)
+    return {
+        "initial": f"{variables['initial_text_input']} {tag}",
+        "edited": f"{variables['edited_text_input']} {tag}",
+    }
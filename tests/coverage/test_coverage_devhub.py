@@ -8,33 +8,14 @@ from pages.desktop.developers.manage_authors_and_license import ManageAuthorsAnd
 from scripts import reusables
 
 
-def submit_addon_method(selenium, base_url):
-    devhub_page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
-    submit_addon = devhub_page.click_submit_addon_button()
-    submit_addon.select_listed_option()
-    submit_addon.click_continue()
-    submit_addon.upload_addon("listed-addon.zip")
-    submit_addon.is_validation_successful()
-    assert submit_addon.success_validation_message.is_displayed()
-    source = submit_addon.click_continue_upload_button()
-    source.select_no_to_omit_source()
-    confirmation_page = source.continue_listed_submission()
-    random_string = reusables.get_random_string(10)
-    summary = reusables.get_random_string(10)
-    confirmation_page.set_addon_name(random_string)
-    confirmation_page.set_addon_summary(summary)
-    confirmation_page.select_categories(1)
-    confirmation_page.select_license_options[0].click()
-    confirmation_page.submit_addon()
-    return f"listed-addon{random_string}"
-
-
 @pytest.mark.coverage
 @pytest.mark.login("submissions_user")
-def test_cancel_review_request_tc_id_c1803555(selenium, base_url, variables, wait):
+def test_cancel_review_request_tc_id_c1803555(
+    selenium, base_url, variables, wait, addon_factory
+):
     # Test Case: C1803555 -> AMO Coverage > Devhub
     """Submit the first version of an add-on"""
-    addon_slug = submit_addon_method(selenium, base_url)
+    addon_slug = addon_factory().slug
     manage_versions = ManageVersions(selenium, base_url)
     manage_versions.open_manage_versions_page_for_addon(selenium, base_url, addon_slug)
     """Page is displayed"""
@@ -60,10 +41,6 @@ def test_cancel_review_request_tc_id_c1803555(selenium, base_url, variables, wai
         variables["addon_version_disabled_by_mozilla"]
         in manage_versions.disabled_by_mozilla_text.text,
     )
-    """Clean-up: Delete created add-on"""
-    delete_addon_modal = manage_versions.delete_addon()
-    delete_addon_modal.input_delete_confirmation_string()
-    delete_addon_modal.confirm_delete_addon()
 
 
 @pytest.mark.coverage
@@ -114,10 +91,12 @@ def test_disable_an_addon_at_submission_tc_id_c1898098(selenium, base_url, wait,
 
 @pytest.mark.coverage
 @pytest.mark.create_session("submissions_user")
-def test_change_the_license_tc_id_c1901412(selenium, base_url, variables, wait):
+def test_change_the_license_tc_id_c1901412(
+    selenium, base_url, variables, wait, leased_addon
+):
     # Test Case: C1901412 AMO Coverage > Devhub
     """Submit a new add-on"""
-    addon_slug = submit_addon_method(selenium, base_url)
+    addon_slug = leased_addon("listed_extension")
     """From Manage Authors and License page -> select a new License for the add-on and Save Changes"""
     manage_authors_page = ManageAuthorsAndLicenses(selenium, base_url)
     manage_authors_page.open_manage_authors_and_licenses_page(selenium, base_url, addon_slug)
@@ -133,20 +112,16 @@ def test_change_the_license_tc_id_c1901412(selenium, base_url, variables, wait):
     selenium.get(f"{base_url}/firefox/addon/{addon_slug}")
     addon_detail_page = Detail(selenium, base_url).wait_for_page_to_load()
     assert addon_detail_page.addon_icon.is_displayed()
-    """Clean-up: Delete created add-on"""
-    manage_versions_page = ManageVersions(selenium, base_url)
-    manage_versions_page.open_manage_versions_page_for_addon(selenium, base_url, addon_slug)
-    delete_addon_modal = manage_versions_page.delete_addon()
-    delete_addon_modal.input_delete_confirmation_string()
-    delete_addon_modal.confirm_delete_addon()
 
 
 @pytest.mark.coverage
 @pytest.mark.create_session("submissions_user")
-def test_manage_authors_and_license_page_tc_id_c1901410(selenium, variables, wait, base_url):
+def test_manage_authors_and_license_page_tc_id_c1901410(
+    selenium, variables, wait, base_url, leased_addon
+):
     # Test Case: C1901410 AMO Coverage > Devhub
     """Submit a new add-on"""
-    addon_slug = submit_addon_method(selenium, base_url)
+    addon_slug = leased_addon("listed_extension")
     """Go to "Manage Authors and License page" of an addon"""
     manage_authors_page = ManageAuthorsAndLicenses(selenium, base_url)
     manage_authors_page.open_manage_authors_and_licenses_page(selenium, base_url, addon_slug)
@@ -195,12 +170,6 @@ def test_manage_authors_and_license_page_tc_id_c1901410(selenium, variables, wai
             variables["text_block_for_use"]
             in addon_detail_page.addon_info_text.text
     )
-    """Clean-up: Delete created add-on"""
-    manage_versions_page = ManageVersions(selenium, base_url)
-    manage_versions_page.open_manage_versions_page_for_addon(selenium, base_url, addon_slug)
-    delete_addon_modal = manage_versions_page.delete_addon()
-    delete_addon_modal.input_delete_confirmation_string()
-    delete_addon_modal.confirm_delete_addon()
 
 
 @pytest.mark.coverage
@@ -221,6 +190,3 @@ def test_addon_submission_without_id_mv3_extensions_tc_id_c1950460(selenium, bas
             variables["mv3_extension_without_id_message"]
             in submit_addon.success_validation_message.text
     )
-
-
-
@@ -1,6 +1,7 @@
 import pytest
 
 from pages.desktop.developers.devhub_home import DevHubHome
+from pages.desktop.developers.edit_addon import EditAddon
 from pages.desktop.developers.manage_versions import ManageVersions
 from pages.desktop.developers.submit_addon import (
     SubmitAddon,
@@ -79,7 +80,8 @@ def test_submit_listed_wizard_theme_tc_id_c97500(selenium, base_url, variables,
     submit_addon.select_listed_option()
     submit_addon.click_continue()
     create_theme = submit_addon.click_create_theme_button()
-    theme_name = f"wizard_theme_{reusables.get_random_string(5)}"
+    # the run tag in the name marks the theme to be deleted by 'delete_themes'
+    theme_name = f"wizard_theme_{delete_themes}_{reusables.get_random_string(5)}"
     create_theme.set_theme_name(theme_name)
     create_theme.upload_theme_header("theme_header.png")
     wait.until(lambda _: create_theme.uploaded_image_preview.is_displayed())
@@ -361,7 +363,9 @@ def test_submit_addon_3mb_size_tc_id_c2274214(selenium, base_url, wait, variable
 
 @pytest.mark.serial
 @pytest.mark.create_session("submissions_user")
-def test_addon_last_modified_date(selenium, base_url):
+def test_addon_last_modified_date(selenium, base_url, addon_factory):
+    # the addon created here is the latest modified addon of the user
+    addon_factory()
     page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
     # check the last modified date in the latest submitted addon on Devhub homepage (should be current date)
     print(page.my_addons_list[0].my_addon_modified_date_text)
@@ -375,12 +379,13 @@ def test_addon_last_modified_date(selenium, base_url):
 
 @pytest.mark.serial
 @pytest.mark.create_session("submissions_user")
-def test_submit_mixed_addon_versions_tc_id_c14981(selenium, base_url, variables, wait):
+def test_submit_mixed_addon_versions_tc_id_c14981(
+    selenium, base_url, variables, wait, addon_factory
+):
     """Uploads an unlisted version to an exiting listed addon"""
-    page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
-    my_addons = page.click_my_addons_header_link()
-    # open the edit page of the latest listed add-on submitted
-    edit_addon = my_addons.addon_list[0].click_addon_name()
+    addon_slug = addon_factory().slug
+    EditAddon.open_edit_page(addon_slug, base_url, selenium)
+    edit_addon = EditAddon(selenium, base_url).wait_for_page_to_load()
     submit_version = edit_addon.click_upload_version_link()
     submit_version.change_version_distribution()
     # select unlisted option for the new version
@@ -398,14 +403,16 @@ def test_submit_mixed_addon_versions_tc_id_c14981(selenium, base_url, variables,
         variables["unlisted_submission_confirmation"]
         in confirmation_page.submission_confirmation_messages[0].text
     )
-    manage_addons = confirmation_page.click_manage_listing_button()
-    edit_addon = manage_addons.addon_list[0].click_addon_name()
+    EditAddon.open_edit_page(addon_slug, base_url, selenium)
+    edit_addon = EditAddon(selenium, base_url).wait_for_page_to_load()
     # verify that the unlisted addon badge is now visible on the edit details page
     assert edit_addon.unlisted_version_tooltip.is_displayed()
 
 
 @pytest.mark.serial
-def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url, variables):
+def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(
+    selenium, base_url, variables, api_pool
+):
     """Uploads a new version to an existing addon and verifies that is auto-approved"""
     page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
     page.devhub_login("developer")
@@ -413,7 +420,9 @@ def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url
     # in order to upload a new version, we need to increment on the existing version number
     # to obtain the current version number, we make an API request that returns the value
     auth = selenium.get_cookie("sessionid")["value"]
-    version_string = api_helpers.get_addon_version_string(base_url, addon, auth)
+    version_string = api_helpers.get_addon_version_string(
+        api_pool.with_auth(auth), addon
+    )
     # create a new addon version with the incremented versio number
     manifest = {
         "manifest_version": 2,
@@ -421,11 +430,11 @@ def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url
         "version": f"{float(version_string) + 1}",
         "name": "New version auto-approval",
     }
-    api_helpers.make_addon(manifest)
+    archive = api_helpers.make_addon_file(manifest)
     # go to the unlisted distribution page to submit a new version
     selenium.get(f"{base_url}/developers/addon/{addon}/versions/submit/")
     submit_version = SubmitAddon(selenium).wait_for_page_to_load()
-    submit_version.upload_addon("make-addon.zip")
+    submit_version.upload_addon(archive)
     # wait for the validation to finish and check if it is successful
     submit_version.is_validation_successful()
     assert submit_version.success_validation_message.is_displayed()
@@ -469,12 +478,12 @@ def test_submit_unicode_addon_tc_id_c4590(
         "name": addon_name,
         "description": description,
     }
-    api_helpers.make_addon(manifest)
+    archive = api_helpers.make_addon_file(manifest)
     selenium.get(f"{base_url}/developers/addon/submit/upload-listed")
     submit_addon = SubmitAddon(selenium, base_url).wait_for_page_to_load()
     # checking that the Firefox compatibility checkbox is selected by default
     wait.until(lambda _: submit_addon.firefox_compat_checkbox.is_selected())
-    submit_addon.upload_addon("make-addon.zip")
+    submit_addon.upload_addon(archive)
     # waits for the validation to complete and checks that is successful
     submit_addon.is_validation_successful()
     # on submit source code page, select 'No' to upload source code
@@ -56,15 +56,15 @@ def test_extension_landing_header(base_url, selenium):
 @pytest.mark.nondestructive
 def test_recommended_extensions_shelf(base_url, selenium):
     extensions = Extensions(selenium, base_url).open()
-    shelf_items = extensions.shelves.recommended_addons.list
+    shelf_items = extensions.shelves.recommended_addons.list_snapshot
     assert "Recommended extensions" in extensions.shelves.recommended_addons.card_header
     # the following statements are checking that each shelf has four addons
     # and each addon has a name, icon and number of users
     assert len(shelf_items) == 4
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item["name"].text
+        assert item["icon"].displayed
+        assert item["users"].displayed
 
 
 @pytest.mark.sanity
@@ -76,22 +76,22 @@ def test_browse_more_recommended_extensions(base_url, selenium):
     search_results = Search(selenium, base_url)
     select = Select(search_results.filter_by_badging)
     assert select.first_selected_option.text == "Recommended"
-    for result in search_results.result_list.search_results:
-        assert "Recommended" in result.promoted_badge_label
+    for result in search_results.result_list.search_results_snapshot:
+        assert "Recommended" in result["promoted_badge_label"].text
 
 
 @pytest.mark.nondestructive
 def test_top_rated_extensions(base_url, selenium):
     extensions = Extensions(selenium, base_url).open()
-    shelf_items = extensions.shelves.top_rated_addons.list
+    shelf_items = extensions.shelves.top_rated_addons.list_snapshot
     assert "Top rated extensions" in extensions.shelves.top_rated_addons.card_header
     # the following statements are checking that each shelf has four addons
     # and each addon has a name, icon and number of users
     assert len(shelf_items) == 4
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item["name"].text
+        assert item["icon"].displayed
+        assert item["users"].displayed
 
 
 @pytest.mark.sanity
@@ -103,8 +103,8 @@ def test_browse_more_top_rated_extensions(base_url, selenium):
     search_results = Search(selenium, base_url)
     select = Select(search_results.filter_by_badging)
     assert select.first_selected_option.text == "Recommended"
-    for result in search_results.result_list.search_results:
-        assert "Recommended" in result.promoted_badge_label
+    for result in search_results.result_list.search_results_snapshot:
+        assert "Recommended" in result["promoted_badge_label"].text
     # using a list slice below (normal len is 25) to validate rating ordering
     # because not all addons in the list have a rating on stage
     ratings = search_results.result_list.search_results[0:16]
@@ -115,15 +115,15 @@ def test_browse_more_top_rated_extensions(base_url, selenium):
 @pytest.mark.nondestructive
 def test_trending_extensions(base_url, selenium):
     extensions = Extensions(selenium, base_url).open()
-    shelf_items = extensions.shelves.trending_addons.list
+    shelf_items = extensions.shelves.trending_addons.list_snapshot
     assert "Trending extensions" in extensions.shelves.trending_addons.card_header
     # the following statements are checking that each shelf has four addons
     # and each addon has a name, icon and number of users
     assert len(shelf_items) == 4
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item["name"].text
+        assert item["icon"].displayed
+        assert item["users"].displayed
 
 
 @pytest.mark.sanity
@@ -135,5 +135,5 @@ def test_browse_more_trending_extensions(base_url, selenium):
     search_results = Search(selenium, base_url)
     select = Select(search_results.filter_by_badging)
     assert select.first_selected_option.text == "Recommended"
-    for result in search_results.result_list.search_results:
-        assert "Recommended" in result.promoted_badge_label
+    for result in search_results.result_list.search_results_snapshot:
+        assert "Recommended" in result["promoted_badge_label"].text
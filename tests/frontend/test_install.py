@@ -8,6 +8,10 @@ from pages.desktop.about_addons import AboutAddons
 from pages.desktop.frontend.details import Detail
 from pages.desktop.frontend.versions import Versions
 
+# install tests need a pristine browser profile, even when browsers are reused
+pytestmark = pytest.mark.fresh_browser
+
+
 def test_install_uninstall_extension_tc_id_c393003(
     selenium, base_url, firefox, firefox_notifications, wait
 ):
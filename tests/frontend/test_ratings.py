@@ -56,7 +56,7 @@ def test_throttled_request_update_rating_spam(selenium, base_url, variables):
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.login("rating_user")
-def test_rating_with_text_tc_id_c94034(selenium, base_url, variables):
+def test_rating_with_text_tc_id_c94034(selenium, base_url, variables, review_texts):
     extension = variables["detail_extension_slug"]
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
@@ -65,7 +65,7 @@ def test_rating_with_text_tc_id_c94034(selenium, base_url, variables):
     # waits for the write a review form to be displayed
     addon.ratings.wait_for_rating_form()
     addon.ratings.write_a_review.click()
-    review_text = variables["initial_text_input"]
+    review_text = review_texts["initial"]
     addon.ratings.review_text_input(review_text)
     addon.ratings.submit_review()
     assert "review" in addon.ratings.delete_rating_link.text
@@ -93,13 +93,13 @@ def test_user_review_permalink_tc_id_c1494903(selenium, base_url, variables):
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.create_session("rating_user")
-def test_edit_review_tc_id_c94035(selenium, base_url, variables):
+def test_edit_review_tc_id_c94035(selenium, base_url, variables, review_texts):
     extension = variables["detail_extension_slug"]
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
     # addon.login('rating_user')
     addon.ratings.edit_review.click()
-    edited_review_text = variables["edited_text_input"]
+    edited_review_text = review_texts["edited"]
     addon.ratings.clear_review_text_field()
     addon.ratings.review_text_input(edited_review_text)
     # updates the review text and verifies that the changes are saved
@@ -408,7 +408,7 @@ def test_click_on_review_posting_time_link(selenium, base_url, variables):
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.create_session("rating_user")
-def test_write_review_in_all_reviews_page(selenium, base_url, variables):
+def test_write_review_in_all_reviews_page(selenium, base_url, variables, review_texts):
     extension = variables["detail_extension_slug"]
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
@@ -424,7 +424,7 @@ def test_write_review_in_all_reviews_page(selenium, base_url, variables):
     addon.ratings.cancel_review.click()
     # write your review
     addon.ratings.write_a_review.click()
-    review_text = variables["initial_text_input"]
+    review_text = review_texts["initial"]
     addon.ratings.review_text_input(review_text)
     addon.ratings.submit_review()
     assert reviews.review_items[0].review_body == review_text
@@ -433,7 +433,7 @@ def test_write_review_in_all_reviews_page(selenium, base_url, variables):
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.create_session("rating_user")
-def test_edit_review_in_all_reviews_page(selenium, base_url, variables):
+def test_edit_review_in_all_reviews_page(selenium, base_url, variables, review_texts):
     extension = variables["detail_extension_slug"]
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
@@ -444,7 +444,7 @@ def test_edit_review_in_all_reviews_page(selenium, base_url, variables):
     reviews.edit_review_score[3].click()
     assert len(reviews.selected_score_highlight) == 4
     # update the written review text in All reviews page
-    edited_review_text = variables["edited_text_input"]
+    edited_review_text = review_texts["edited"]
     addon.ratings.clear_review_text_field()
     addon.ratings.review_text_input(edited_review_text)
     addon.ratings.submit_review()
@@ -478,14 +478,14 @@ def test_delete_review_in_all_reviews_page(selenium, base_url, variables):
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.login("developer")
-def test_developer_reply_to_review(selenium, base_url, variables):
+def test_developer_reply_to_review(selenium, base_url, variables, review_texts):
     extension = variables["dev_reply_review"]
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
     # addon.login('developer')
     reviews = addon.ratings.click_all_reviews_link()
     reviews.review_items[0].click_reply_to_review()
-    reply_text = variables["initial_text_input"]
+    reply_text = review_texts["initial"]
     reviews.review_items[0].reply_text_input(reply_text)
     reviews.review_items[0].publish_reply()
     assert "Developer response" in reviews.review_items[0].dev_reply_header.text
@@ -495,13 +495,13 @@ def test_developer_reply_to_review(selenium, base_url, variables):
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.create_session("developer")
-def test_edit_developer_reply_to_review(selenium, base_url, variables):
+def test_edit_developer_reply_to_review(selenium, base_url, variables, review_texts):
     extension = variables["dev_reply_review"]
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
     # addon.login('developer')
     reviews = addon.ratings.click_all_reviews_link()
-    edited_reply = variables["edited_text_input"]
+    edited_reply = review_texts["edited"]
     addon.ratings.edit_review.click()
     reviews.review_items[0].clear_developer_reply_text_field()
     reviews.review_items[0].reply_text_input(edited_reply)
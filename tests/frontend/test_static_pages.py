@@ -4,7 +4,7 @@ import requests
 from selenium.common.exceptions import NoSuchElementException
 
 from pages.desktop.frontend.home import Home
-from pages.desktop.frontend.static_pages import StaticPages
+from pages.desktop.frontend.static_pages import StaticPages, StaticPagesHtml
 
 @pytest.mark.nondestructive
 @pytest.mark.xfail(
@@ -28,12 +28,12 @@ def test_about_firefox_addons_page_links(base_url, selenium, variables):
         # go back to test the next link
         selenium.get(f"{base_url}/about")
 
+@pytest.mark.ssr
 @pytest.mark.nondestructive
-def test_review_guidelines_page_loaded_correctly(base_url, selenium):
-    selenium.get(f"{base_url}/review_guide")
-    page = StaticPages(selenium, base_url)
+def test_review_guidelines_page_loaded_correctly(html_page):
+    page = StaticPagesHtml(html_page("/review_guide"))
     # verify the tab title
-    assert "Review Guidelines – Add-ons for Firefox" in page.driver.title
+    assert "Review Guidelines – Add-ons for Firefox" in page.title
     # verify the header
     assert "Review Guidelines" in page.page_header
     # verify the paragraphs
@@ -43,12 +43,12 @@ def test_review_guidelines_page_loaded_correctly(base_url, selenium):
     assert page.forum_link.is_displayed()
 
 
+@pytest.mark.ssr
 @pytest.mark.nondestructive
-def test_about_firefox_addons_page_loaded_correctly(base_url, selenium, variables):
-    selenium.get(f"{base_url}/about")
-    page = StaticPages(selenium, base_url)
+def test_about_firefox_addons_page_loaded_correctly(html_page):
+    page = StaticPagesHtml(html_page("/about"))
     # verify the tab title
-    assert "About Firefox Add-ons – Add-ons for Firefox" in page.driver.title
+    assert "About Firefox Add-ons – Add-ons for Firefox" in page.title
     # verify the header
     assert "About Firefox Add-ons" in page.page_header
     # verify the paragraphs
@@ -67,15 +67,15 @@ def test_about_firefox_addons_page_loaded_correctly(base_url, selenium, variable
         assert link.is_displayed()
 
 
+@pytest.mark.ssr
 @pytest.mark.nondestructive
 @pytest.mark.fail
-def test_blocked_addon_page_loaded_correctly(base_url, selenium, variables):
-    selenium.get(variables["static_page_blocked_addon"])
-    page = StaticPages(selenium, base_url)
+def test_blocked_addon_page_loaded_correctly(html_page, variables):
+    page = StaticPagesHtml(html_page(variables["static_page_blocked_addon"]))
     # verify the tab title
     assert (
         f'{variables["blocked_addon_name"]} is blocked for violating Mozilla policies – Add-ons for Firefox (en-US)'
-        in page.driver.title
+        in page.title
     )
     # verify the header
     assert (
@@ -91,12 +91,12 @@ def test_blocked_addon_page_loaded_correctly(base_url, selenium, variables):
     assert page.this_support_article_link.is_displayed()
 
 
+@pytest.mark.ssr
 @pytest.mark.nondestructive
-def test_blocked_addon_page_does_not_have_login_button(base_url, selenium, variables):
-    selenium.get(variables["static_page_blocked_addon"])
-    page = StaticPages(selenium, base_url)
+def test_blocked_addon_page_does_not_have_login_button(html_page, variables):
+    page = StaticPagesHtml(html_page(variables["static_page_blocked_addon"]))
     with pytest.raises(NoSuchElementException):
-        page.header.login_button.is_displayed()
+        page.login_button.is_displayed()
 
 
 @pytest.mark.nondestructive
@@ -56,15 +56,15 @@ def test_themes_landing_header(base_url, selenium):
 @pytest.mark.nondestructive
 def test_recommended_themes(base_url, selenium):
     themes = Themes(selenium, base_url).open()
-    shelf_items = themes.shelves.recommended_addons.list
+    shelf_items = themes.shelves.recommended_addons.list_snapshot
     assert "Recommended themes" in themes.shelves.recommended_addons.card_header
     # the following statements are checking that each shelf has three themes
     # and each theme has a name, preview and number of users
     assert len(shelf_items) == 3
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item["name"].text
+        assert item["icon"].displayed
+        assert item["users"].displayed
 
 
 @pytest.mark.sanity
@@ -76,22 +76,22 @@ def test_browse_more_recommended_themes(base_url, selenium):
     search_results = Search(selenium, base_url)
     select = Select(search_results.filter_by_badging)
     assert select.first_selected_option.text == "Recommended"
-    for result in search_results.result_list.search_results:
-        assert "Recommended" in result.promoted_badge_label
+    for result in search_results.result_list.search_results_snapshot:
+        assert "Recommended" in result["promoted_badge_label"].text
 
 
 @pytest.mark.nondestructive
 def test_top_rated_themes(base_url, selenium):
     themes = Themes(selenium, base_url).open()
-    shelf_items = themes.shelves.top_rated_addons.list
+    shelf_items = themes.shelves.top_rated_addons.list_snapshot
     assert "Top rated themes" in themes.shelves.top_rated_addons.card_header
     # the following statements are checking that each shelf has three themes
     # and each theme has a name, preview and number of users
     assert len(shelf_items) == 3
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item["name"].text
+        assert item["icon"].displayed
+        assert item["users"].displayed
 
 
 @pytest.mark.sanity
@@ -109,15 +109,15 @@ def test_browse_more_top_rated_themes(base_url, selenium):
 @pytest.mark.nondestructive
 def test_trending_themes(base_url, selenium):
     themes = Themes(selenium, base_url).open()
-    shelf_items = themes.shelves.trending_addons.list
+    shelf_items = themes.shelves.trending_addons.list_snapshot
     assert "Trending themes" in themes.shelves.trending_addons.card_header
     # the following statements are checking that each shelf has three themes
     # and each theme has a name, preview and number of users
     assert len(shelf_items) == 3
     for item in shelf_items:
-        assert item.name
-        assert item.addon_icon_preview.is_displayed()
-        assert item.addon_users_preview.is_displayed()
+        assert item["name"].text
+        assert item["icon"].displayed
+        assert item["users"].displayed
 
 
 @pytest.mark.sanity
@@ -563,7 +563,7 @@ def test_user_profile_open_theme_detail_page_tc_id_c95590(base_url, selenium, va
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.login("submissions_user")
-def test_user_profile_write_review(base_url, selenium, variables, wait):
+def test_user_profile_write_review(base_url, selenium, variables, review_texts, wait):
     extension = variables["detail_extension_slug"]
     selenium.get(f"{base_url}/addon/{extension}")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
@@ -578,7 +578,7 @@ def test_user_profile_write_review(base_url, selenium, variables, wait):
     # the review card doesn't have preload elements, so we need to wait for it to load individually
     user.view.user_reviews_section_loaded()
     addon.ratings.write_a_review.click()
-    review_text = variables["initial_text_input"]
+    review_text = review_texts["initial"]
     addon.ratings.review_text_input(review_text)
     addon.ratings.submit_review()
     # verifies that the written review is displayed
@@ -591,7 +591,7 @@ def test_user_profile_write_review(base_url, selenium, variables, wait):
 @pytest.mark.serial
 @pytest.mark.nondestructive
 @pytest.mark.create_session("submissions_user")
-def test_user_profile_edit_review(base_url, selenium, variables, wait):
+def test_user_profile_edit_review(base_url, selenium, review_texts, wait):
     user = User(selenium, base_url).open().wait_for_page_to_load()
     # user.login('submissions_user')
     user.edit.click_view_profile_link()
@@ -599,7 +599,7 @@ def test_user_profile_edit_review(base_url, selenium, variables, wait):
     user.view.user_reviews_section_loaded()
     edit = Detail(selenium, base_url)
     edit.ratings.edit_review.click()
-    edited_review_text = variables["edited_text_input"]
+    edited_review_text = review_texts["edited"]
     edit.ratings.clear_review_text_field()
     edit.ratings.review_text_input(edited_review_text)
     edit.ratings.submit_review()